@@ -5,17 +5,177 @@ This module handles sending alerts for data quality issues
 via email, Slack, or webhooks.
 """
 import os
-import json
+import atexit
+import asyncio
+import time
 import logging
-import smtplib
-import requests
+import threading
+import weakref
+import httpx
+import orjson
 from email.message import EmailMessage
-from typing import Dict, List, Any, Optional, Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Union
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared HTTP client so Slack/webhook alerts reuse pooled keep-alive connections
+_HTTP = httpx.Client(
+    http2=True,
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=16)
+)
+atexit.register(_HTTP.close)
+
+# orjson options: GE results may carry numpy scalars and non-string dict keys
+_ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def _dump_json(payload: Dict[str, Any]) -> bytes:
+    """
+    Serialize a payload straight to JSON bytes for an HTTP request body.
+    
+    Args:
+        payload (Dict[str, Any]): JSON payload
+        
+    Returns:
+        bytes: Encoded payload
+    """
+    return orjson.dumps(payload, option=_ORJSON_OPTS)
+
+# Retry policy for transient HTTP failures (connection errors and 5xx responses)
+_MAX_ATTEMPTS = 3
+_RETRY_BACKOFF = 0.1
+
+def _should_retry(error: httpx.HTTPError) -> bool:
+    """Return whether an HTTP error is transient and worth retrying."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+def _post_json(url: str,
+               payload: Dict[str, Any],
+               headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+    """
+    POST a JSON payload with the shared client, retrying transient failures.
+    
+    Args:
+        url (str): Target URL
+        payload (Dict[str, Any]): JSON payload
+        headers (Optional[Dict[str, str]]): Request headers
+        
+    Returns:
+        httpx.Response: Response of the request
+    """
+    content = _dump_json(payload)
+    headers = {**(headers or {}), "Content-Type": "application/json"}
+    
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            response = _HTTP.post(url, content=content, headers=headers)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            if attempt == _MAX_ATTEMPTS - 1 or not _should_retry(e):
+                raise
+            logger.warning(f"Retrying request to {url} after error: {e}")
+            time.sleep(_RETRY_BACKOFF * 2 ** attempt)
+
+class TokenBucket:
+    """Token-bucket rate limiter for outbound alerts."""
+    
+    __slots__ = ('tokens', 'rate', 'cap', 'last', 'dropped')
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Initialize the token bucket.
+        
+        Args:
+            capacity (float): Maximum number of tokens (burst size)
+            refill_rate (float): Tokens added per second
+        """
+        self.cap = float(capacity)
+        self.rate = float(refill_rate)
+        self.tokens = self.cap
+        self.last = time.monotonic()
+        self.dropped = 0
+    
+    def try_acquire(self, now: float) -> bool:
+        """
+        Take one token if available.
+        
+        Args:
+            now (float): Current monotonic time
+            
+        Returns:
+            bool: Whether a token was acquired
+        """
+        self.tokens = min(self.cap, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        self.dropped += 1
+        return False
+
+# Buckets are kept per channel at module level so throttling spans AlertManager instances
+_BUCKETS: Dict[str, TokenBucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+def _acquire_alert_token(channel: str, channel_config: Mapping[str, Any]) -> bool:
+    """
+    Acquire a send token for an alert channel.
+    
+    Channels without a ``rate_limit`` configuration are never throttled.
+    
+    Args:
+        channel (str): Alert channel name ('email', 'slack', 'webhook')
+        channel_config (Mapping[str, Any]): Channel configuration
+        
+    Returns:
+        bool: Whether the alert may be sent
+    """
+    rate_limit = channel_config.get('rate_limit')
+    if not rate_limit:
+        return True
+    
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(channel)
+        if bucket is None:
+            bucket = TokenBucket(rate_limit.get('capacity', 5), rate_limit.get('refill_rate', 0.1))
+            _BUCKETS[channel] = bucket
+        
+        dropped = bucket.dropped
+        if not bucket.try_acquire(time.monotonic()):
+            logger.warning(f"{channel.capitalize()} alert throttled by rate limit")
+            return False
+        bucket.dropped = 0
+    
+    if dropped:
+        logger.info(f"{dropped} {channel} alert(s) were suppressed since the last one sent")
+    return True
+
+@lru_cache(maxsize=32)
+def _load_config_cached(path: str, mtime: float) -> Mapping[str, Any]:
+    """
+    Load and cache a configuration file.
+    
+    The modification time is part of the cache key so that edits to the
+    file are picked up on the next load. Use ``_load_config_cached.cache_clear()``
+    to drop all cached configurations.
+    
+    Args:
+        path (str): Path to configuration file
+        mtime (float): Modification time of the configuration file
+        
+    Returns:
+        Mapping[str, Any]: Read-only view of the parsed configuration
+    """
+    with open(path, 'rb') as f:
+        return MappingProxyType(orjson.loads(f.read()))
+
 class AlertManager:
     """Class for sending data quality alerts."""
     
@@ -29,13 +189,100 @@ class AlertManager:
         # Load configuration if provided
         self.config = {}
         if config_path and os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                self.config = json.load(f)
+            self.config = _load_config_cached(config_path, os.path.getmtime(config_path))
         
         # Extract alert configurations
         self.email_config = self.config.get('alerts', {}).get('email', {})
         self.slack_config = self.config.get('alerts', {}).get('slack', {})
         self.webhook_config = self.config.get('alerts', {}).get('webhook', {})
+        
+        # Persistent SMTP connection (smtplib.SMTP), reused across email alerts
+        self._smtp = None
+        self._smtp_lock = threading.Lock()
+    
+    def _build_email_message(self,
+                             subject: str,
+                             message: str,
+                             recipients: Optional[List[str]] = None) -> Optional[EmailMessage]:
+        """
+        Build an email message from the email configuration.
+        
+        Args:
+            subject (str): Email subject
+            message (str): Email message
+            recipients (Optional[List[str]]): List of email recipients
+            
+        Returns:
+            Optional[EmailMessage]: Email message, or None if the configuration is incomplete
+        """
+        sender_email = self.email_config.get('sender_email')
+        sender_password = self.email_config.get('sender_password')
+        
+        if not recipients:
+            recipients = self.email_config.get('recipients', [])
+        
+        if not sender_email or not sender_password or not recipients:
+            logger.error("Incomplete email configuration")
+            return None
+        
+        msg = EmailMessage()
+        msg['Subject'] = subject
+        msg['From'] = sender_email
+        msg['To'] = ', '.join(recipients)
+        msg.set_content(message)
+        return msg
+    
+    def _get_smtp(self):
+        """
+        Return a live SMTP connection, reconnecting if needed.
+        
+        Must be called with ``self._smtp_lock`` held.
+        
+        Returns:
+            smtplib.SMTP: Authenticated SMTP connection
+        """
+        import smtplib
+        
+        if self._smtp is not None:
+            try:
+                self._smtp.noop()
+                return self._smtp
+            except (smtplib.SMTPException, OSError):
+                self._drop_smtp()
+        
+        server = smtplib.SMTP(
+            self.email_config.get('smtp_server', 'smtp.gmail.com'),
+            self.email_config.get('smtp_port', 587)
+        )
+        server.starttls()
+        server.login(self.email_config.get('sender_email'), self.email_config.get('sender_password'))
+        
+        _SMTP_MANAGERS.add(self)
+        self._smtp = server
+        return server
+    
+    def _drop_smtp(self) -> None:
+        """
+        Close the socket of a broken SMTP connection without the QUIT handshake.
+        
+        Must be called with ``self._smtp_lock`` held.
+        """
+        if self._smtp is not None:
+            try:
+                self._smtp.close()
+            except Exception:
+                pass
+            self._smtp = None
+    
+    def close_smtp(self) -> None:
+        """Close the persistent SMTP connection, if any."""
+        with self._smtp_lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except Exception:
+                    pass
+                self._smtp = None
     
     def send_email_alert(self, 
                        subject: str, 
@@ -56,34 +303,25 @@ class AlertManager:
             logger.warning("Email alerts are not enabled")
             return False
         
+        if not _acquire_alert_token('email', self.email_config):
+            return False
+        
         try:
-            # Get email configuration
-            smtp_server = self.email_config.get('smtp_server', 'smtp.gmail.com')
-            smtp_port = self.email_config.get('smtp_port', 587)
-            sender_email = self.email_config.get('sender_email')
-            sender_password = self.email_config.get('sender_password')
-            
-            if not recipients:
-                recipients = self.email_config.get('recipients', [])
-            
-            if not sender_email or not sender_password or not recipients:
-                logger.error("Incomplete email configuration")
-                return False
-            
             # Create email message
-            msg = EmailMessage()
-            msg['Subject'] = subject
-            msg['From'] = sender_email
-            msg['To'] = ', '.join(recipients)
-            msg.set_content(message)
+            msg = self._build_email_message(subject, message, recipients)
+            if msg is None:
+                return False
             
-            # Send email
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
-                server.starttls()
-                server.login(sender_email, sender_password)
-                server.send_message(msg)
+            # Send email over the persistent connection
+            with self._smtp_lock:
+                try:
+                    self._get_smtp().send_message(msg)
+                except Exception:
+                    # Drop the connection so the next alert reconnects cleanly
+                    self._drop_smtp()
+                    raise
             
-            logger.info(f"Email alert sent to: {recipients}")
+            logger.info(f"Email alert sent to: {msg['To']}")
             return True
             
         except Exception as e:
@@ -107,6 +345,9 @@ class AlertManager:
             logger.warning("Slack alerts are not enabled")
             return False
         
+        if not _acquire_alert_token('slack', self.slack_config):
+            return False
+        
         try:
             # Get Slack configuration
             webhook_url = self.slack_config.get('webhook_url')
@@ -122,13 +363,7 @@ class AlertManager:
                     "channel": channel
                 }
                 
-                response = requests.post(
-                    webhook_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                response.raise_for_status()
+                _post_json(webhook_url, payload)
                 
             elif token:
                 # Use Slack API
@@ -145,6 +380,9 @@ class AlertManager:
             logger.info(f"Slack alert sent to: {channel}")
             return True
             
+        except httpx.HTTPError as e:
+            logger.error(f"Slack webhook request failed: {e}")
+            return False
         except Exception as e:
             logger.error(f"Failed to send Slack alert: {e}")
             return False
@@ -164,6 +402,9 @@ class AlertManager:
             logger.warning("Webhook alerts are not enabled")
             return False
         
+        if not _acquire_alert_token('webhook', self.webhook_config):
+            return False
+        
         try:
             # Get webhook configuration
             webhook_url = self.webhook_config.get('url')
@@ -174,21 +415,139 @@ class AlertManager:
                 return False
             
             # Send webhook request
-            response = requests.post(
-                webhook_url,
-                json=payload,
-                headers=headers
-            )
-            
-            response.raise_for_status()
+            _post_json(webhook_url, payload, headers)
             
             logger.info(f"Webhook alert sent to: {webhook_url}")
             return True
             
+        except httpx.HTTPError as e:
+            logger.error(f"Webhook request failed: {e}")
+            return False
         except Exception as e:
             logger.error(f"Failed to send webhook alert: {e}")
             return False
 
+    async def send_email_alert_async(self,
+                                     subject: str,
+                                     message: str,
+                                     recipients: Optional[List[str]] = None) -> bool:
+        """
+        Send an email alert without blocking the event loop.
+        
+        Runs :meth:`send_email_alert` in a worker thread, so both share the
+        persistent SMTP connection.
+        
+        Args:
+            subject (str): Email subject
+            message (str): Email message
+            recipients (Optional[List[str]]): List of email recipients
+            
+        Returns:
+            bool: Whether the email was sent successfully
+        """
+        return await asyncio.to_thread(self.send_email_alert, subject, message, recipients)
+    
+    async def send_slack_alert_async(self,
+                                     message: str,
+                                     channel: Optional[str] = None) -> bool:
+        """
+        Send a Slack alert without blocking the event loop.
+        
+        Runs :meth:`send_slack_alert` in a worker thread.
+        
+        Args:
+            message (str): Slack message
+            channel (Optional[str]): Slack channel
+            
+        Returns:
+            bool: Whether the Slack message was sent successfully
+        """
+        return await asyncio.to_thread(self.send_slack_alert, message, channel)
+    
+    async def send_webhook_alert_async(self,
+                                       payload: Dict[str, Any]) -> bool:
+        """
+        Send a webhook alert without blocking the event loop.
+        
+        Runs :meth:`send_webhook_alert` in a worker thread.
+        
+        Args:
+            payload (Dict[str, Any]): Webhook payload
+            
+        Returns:
+            bool: Whether the webhook was sent successfully
+        """
+        return await asyncio.to_thread(self.send_webhook_alert, payload)
+
+# Alert managers that opened an SMTP connection; one exit hook closes them all
+_SMTP_MANAGERS: "weakref.WeakSet[AlertManager]" = weakref.WeakSet()
+
+def _close_smtp_connections() -> None:
+    """Close the persistent SMTP connections still open at interpreter exit."""
+    for manager in list(_SMTP_MANAGERS):
+        manager.close_smtp()
+
+atexit.register(_close_smtp_connections)
+
+# Alert message templates, filled via str.format_map
+_HEADER_TMPL = """
+    *Data Quality Alert: {dataset_name}*
+    Time: {timestamp}
+    Status: {status}
+    
+    *Summary:*
+    - Total checks: {evaluated_expectations}
+    - Passed checks: {successful_expectations}
+    - Failed checks: {unsuccessful_expectations}
+    - Success rate: {success_percent}%
+    
+    *Failed Checks:*
+    """
+_CHECK_TMPL = """
+    {index}. {check_name}
+       - Failed rows: {failed_rows} ({failure_percentage}%)
+       """
+_INSIGHT_TMPL = """
+       - *Insight:* {issue_description}
+       - *Impact:* {impact_level} - {business_impact}
+       """
+_FIX_TMPL = """
+       - *Suggested Fix:* {fix_approach}
+       - *Rationale:* {rationale}
+       """
+
+# Fallback values for fields missing from the source dictionaries
+_HEADER_DEFAULTS = {
+    'evaluated_expectations': 0,
+    'successful_expectations': 0,
+    'unsuccessful_expectations': 0,
+    'success_percent': 0,
+}
+_CHECK_DEFAULTS = {
+    'check_name': 'Unknown check',
+    'failed_rows': 0,
+    'failure_percentage': 0,
+}
+_INSIGHT_DEFAULTS = {
+    'issue_description': 'No insight available',
+    'impact_level': 'Unknown',
+    'business_impact': 'Unknown',
+}
+_FIX_DEFAULTS = {
+    'fix_approach': 'No suggestion available',
+    'rationale': 'No rationale available',
+}
+
+class _FieldMap(dict):
+    """Mapping for str.format_map that falls back to per-field defaults."""
+    
+    def __init__(self, values: Mapping[str, Any], defaults: Mapping[str, Any]):
+        super().__init__(values)
+        self.defaults = defaults
+    
+    def __missing__(self, key: str) -> Any:
+        return self.defaults.get(key, 'Unknown')
+
 def format_alert_message(validation_results: Dict[str, Any], 
                         insights: Dict[str, Any] = None,
                         fixes: Dict[str, Any] = None) -> str:
@@ -203,59 +562,113 @@ def format_alert_message(validation_results: Dict[str, Any],
     Returns:
         str: Formatted alert message
     """
-    # Extract basic information
-    dataset_name = validation_results.get('dataset_name', 'Unknown dataset')
-    timestamp = validation_results.get('timestamp', 'Unknown time')
-    success = validation_results.get('success', False)
-    stats = validation_results.get('statistics', {})
-    failed_checks = validation_results.get('failed_checks', [])
-    
-    # Format message
-    message = f"""
-    *Data Quality Alert: {dataset_name}*
-    Time: {timestamp}
-    Status: {'✅ PASSED' if success else '❌ FAILED'}
+    # Format message header
+    header_fields = dict(validation_results.get('statistics', {}))
+    header_fields['dataset_name'] = validation_results.get('dataset_name', 'Unknown dataset')
+    header_fields['timestamp'] = validation_results.get('timestamp', 'Unknown time')
+    header_fields['status'] = '✅ PASSED' if validation_results.get('success', False) else '❌ FAILED'
+    parts = [_HEADER_TMPL.format_map(_FieldMap(header_fields, _HEADER_DEFAULTS))]
     
-    *Summary:*
-    - Total checks: {stats.get('evaluated_expectations', 0)}
-    - Passed checks: {stats.get('successful_expectations', 0)}
-    - Failed checks: {stats.get('unsuccessful_expectations', 0)}
-    - Success rate: {stats.get('success_percent', 0)}%
-    
-    *Failed Checks:*
-    """
+    has_insights = bool(insights)
+    has_fixes = bool(fixes)
     
     # Add failed checks
-    for i, check in enumerate(failed_checks):
-        message += f"""
-    {i+1}. {check.get('check_name', 'Unknown check')}
-       - Failed rows: {check.get('failed_rows', 0)} ({check.get('failure_percentage', 0)}%)
-       """
+    for i, check in enumerate(validation_results.get('failed_checks', [])):
+        check_fields = _FieldMap(check, _CHECK_DEFAULTS)
+        check_fields['index'] = i + 1
+        parts.append(_CHECK_TMPL.format_map(check_fields))
         
         # Add insights if available
-        if insights and check['check_name'] in insights:
-            insight = insights[check['check_name']]
-            message += f"""
-       - *Insight:* {insight.get('issue_description', 'No insight available')}
-       - *Impact:* {insight.get('impact_level', 'Unknown')} - {insight.get('business_impact', 'Unknown')}
-       """
+        if has_insights and check['check_name'] in insights:
+            parts.append(_INSIGHT_TMPL.format_map(_FieldMap(insights[check['check_name']], _INSIGHT_DEFAULTS)))
         
         # Add fix suggestions if available
-        if fixes and check['check_name'] in fixes:
-            fix = fixes[check['check_name']]
-            message += f"""
-       - *Suggested Fix:* {fix.get('fix_approach', 'No suggestion available')}
-       - *Rationale:* {fix.get('rationale', 'No rationale available')}
-       """
+        if has_fixes and check['check_name'] in fixes:
+            parts.append(_FIX_TMPL.format_map(_FieldMap(fixes[check['check_name']], _FIX_DEFAULTS)))
     
-    return message
+    return "".join(parts)
 
-def send_alerts(validation_results_path: str, 
-               insights_path: Optional[str] = None,
-               fixes_path: Optional[str] = None,
-               config_path: Optional[str] = None) -> bool:
+async def send_alerts_from_dicts_async(validation_results: Dict[str, Any],
+                                       insights: Optional[Dict[str, Any]],
+                                       fixes: Optional[Dict[str, Any]],
+                                       alert_manager: AlertManager) -> bool:
     """
-    Send alerts for data quality issues.
+    Send alerts for already-loaded results, fanning out to all channels concurrently.
+    
+    Args:
+        validation_results (Dict[str, Any]): Validation results
+        insights (Optional[Dict[str, Any]]): LLM insights
+        fixes (Optional[Dict[str, Any]]): LLM fix suggestions
+        alert_manager (AlertManager): Alert manager used to send the alerts
+        
+    Returns:
+        bool: Whether alerts were sent successfully
+    """
+    # Only send alerts if validation failed
+    if validation_results.get('success', True):
+        logger.info("Validation passed, no alerts needed")
+        return True
+    
+    # Format alert message
+    message = format_alert_message(validation_results, insights, fixes)
+    
+    # Send alerts via all configured channels concurrently
+    sent = await asyncio.gather(
+        alert_manager.send_email_alert_async(
+            subject=f"Data Quality Alert: {validation_results.get('dataset_name', 'Unknown dataset')}",
+            message=message
+        ),
+        alert_manager.send_slack_alert_async(message=message),
+        alert_manager.send_webhook_alert_async(
+            payload={
+                "validation_results": validation_results,
+                "insights": insights,
+                "fixes": fixes,
+                "message": message
+            }
+        ),
+        return_exceptions=True
+    )
+    
+    for result in sent:
+        if isinstance(result, BaseException):
+            logger.error(f"Alert channel raised an error: {result}")
+    
+    return any(result is True for result in sent)
+
+def send_alerts_from_dicts(validation_results: Dict[str, Any],
+                           insights: Optional[Dict[str, Any]],
+                           fixes: Optional[Dict[str, Any]],
+                           alert_manager: AlertManager) -> bool:
+    """
+    Send alerts for already-loaded results.
+    
+    Synchronous wrapper around :func:`send_alerts_from_dicts_async`, for callers
+    such as the dashboard that already hold the results in memory.
+    
+    Args:
+        validation_results (Dict[str, Any]): Validation results
+        insights (Optional[Dict[str, Any]]): LLM insights
+        fixes (Optional[Dict[str, Any]]): LLM fix suggestions
+        alert_manager (AlertManager): Alert manager used to send the alerts
+        
+    Returns:
+        bool: Whether alerts were sent successfully
+    """
+    coro = send_alerts_from_dicts_async(validation_results, insights, fixes, alert_manager)
+    try:
+        return asyncio.run(coro)
+    except Exception as e:
+        coro.close()
+        logger.error(f"Failed to send alerts: {e}")
+        return False
+
+async def send_alerts_async(validation_results_path: str, 
+                            insights_path: Optional[str] = None,
+                            fixes_path: Optional[str] = None,
+                            config_path: Optional[str] = None) -> bool:
+    """
+    Send alerts for data quality issues, fanning out to all channels concurrently.
     
     Args:
         validation_results_path (str): Path to validation results JSON
@@ -268,52 +681,53 @@ def send_alerts(validation_results_path: str,
     """
     try:
         # Load validation results
-        with open(validation_results_path, 'r') as f:
-            validation_results = json.load(f)
+        with open(validation_results_path, 'rb') as f:
+            validation_results = orjson.loads(f.read())
         
         # Load insights if available
         insights = None
         if insights_path and os.path.exists(insights_path):
-            with open(insights_path, 'r') as f:
-                insights = json.load(f)
+            with open(insights_path, 'rb') as f:
+                insights = orjson.loads(f.read())
         
         # Load fixes if available
         fixes = None
         if fixes_path and os.path.exists(fixes_path):
-            with open(fixes_path, 'r') as f:
-                fixes = json.load(f)
+            with open(fixes_path, 'rb') as f:
+                fixes = orjson.loads(f.read())
         
-        # Only send alerts if validation failed
-        if validation_results.get('success', True):
-            logger.info("Validation passed, no alerts needed")
-            return True
-        
-        # Format alert message
-        message = format_alert_message(validation_results, insights, fixes)
-        
-        # Initialize alert manager
-        alert_manager = AlertManager(config_path)
-        
-        # Send alerts via all configured channels
-        email_sent = alert_manager.send_email_alert(
-            subject=f"Data Quality Alert: {validation_results.get('dataset_name', 'Unknown dataset')}",
-            message=message
+        return await send_alerts_from_dicts_async(
+            validation_results, insights, fixes, AlertManager(config_path)
         )
         
-        slack_sent = alert_manager.send_slack_alert(message=message)
-        
-        webhook_sent = alert_manager.send_webhook_alert(
-            payload={
-                "validation_results": validation_results,
-                "insights": insights,
-                "fixes": fixes,
-                "message": message
-            }
-        )
-        
-        return email_sent or slack_sent or webhook_sent
+    except Exception as e:
+        logger.error(f"Failed to send alerts: {e}")
+        return False
+
+def send_alerts(validation_results_path: str, 
+               insights_path: Optional[str] = None,
+               fixes_path: Optional[str] = None,
+               config_path: Optional[str] = None) -> bool:
+    """
+    Send alerts for data quality issues.
+    
+    Synchronous wrapper around :func:`send_alerts_async`; it cannot be called
+    from a running event loop (await send_alerts_async there instead).
+    
+    Args:
+        validation_results_path (str): Path to validation results JSON
+        insights_path (Optional[str]): Path to LLM insights JSON
+        fixes_path (Optional[str]): Path to LLM fix suggestions JSON
+        config_path (Optional[str]): Path to configuration file
         
+    Returns:
+        bool: Whether alerts were sent successfully
+    """
+    coro = send_alerts_async(validation_results_path, insights_path, fixes_path, config_path)
+    try:
+        return asyncio.run(coro)
     except Exception as e:
+        coro.close()
         logger.error(f"Failed to send alerts: {e}")
         return False
 
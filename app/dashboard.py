@@ -5,13 +5,11 @@ This dashboard displays data quality validation results,
 LLM-generated insights, and suggested fixes.
 """
 import os
-import json
+import re
+import sys
 import logging
-import pandas as pd
+import orjson
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 
 # Configure logging
@@ -26,40 +24,113 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Add the project directory to path
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_DIR not in sys.path:
+    sys.path.append(PROJECT_DIR)
+
 # Global variables
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+CONFIG_PATH = os.path.join(PROJECT_DIR, "config.json")
 VALIDATION_RESULTS_DIR = os.path.join(DATA_DIR, "validation_results")
 INSIGHTS_DIR = os.path.join(DATA_DIR, "insights")
 FIXES_DIR = os.path.join(DATA_DIR, "fixes")
+RESULTS_INDEX_PATH = os.path.join(VALIDATION_RESULTS_DIR, "index.parquet")
+
+# Matcher for date-named result directories (YYYY-MM-DD)
+_DATE_RE = re.compile(r'^(20\d{2})-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$').fullmatch
+
+# Static markdown blocks
+_WELCOME_MD = """
+    Welcome to the AI-Powered Data Quality Monitor dashboard!
+    
+    This tool helps you monitor the quality of your data by:
+    
+    1. Running validation checks against your datasets
+    2. Using AI to explain data quality issues
+    3. Suggesting fixes for common problems
+    4. Alerting you when issues are detected
+    
+    To get started, select a date and dataset from the sidebar.
+    """
+
+_EX_MISSING_MD = """
+        **Issue Description:** The customer_id field is missing values in 2.5% of records, which exceeds our threshold of 1%.
+        
+        **Impact Level:** Medium
+        
+        **Business Impact:** Missing customer IDs prevent proper attribution of transactions and can lead to inaccurate customer analytics and personalization efforts.
+        
+        **Possible Causes:**
+        - Data entry errors in the source system
+        - Integration issues between customer database and transaction system
+        - New transactions being processed before customer records are created
+        
+        **Recommended Actions:**
+        - Investigate the 17 records with missing IDs to identify patterns
+        - Check if these transactions can be matched to customers using other attributes
+        - Implement validation at the source to prevent missing customer IDs
+        - Consider raising the threshold to 3% if some level of missing IDs is acceptable
+        """
+
+_EX_SCHEMA_MD = """
+        **Issue Description:** The transaction_amount field contains non-numeric values in 0.8% of records, which should be numeric according to the schema.
+        
+        **Impact Level:** High
+        
+        **Business Impact:** Non-numeric transaction amounts will cause errors in financial reporting, skew analytics, and potentially result in incorrect revenue calculations.
+        
+        **Possible Causes:**
+        - Special characters (like currency symbols) included in the amount field
+        - Text status codes mistakenly entered in amount fields
+        - Source system allowing free-form text entry for amounts
+        
+        **Recommended Actions:**
+        - Clean the data by removing non-numeric characters and converting to numbers
+        - Implement input validation in the source system
+        - Create a separate field for transaction notes/comments
+        - Consider adding a data transformation step to handle common formatting issues
+        """
+
+_ABOUT_MD = """
+    **AI-Powered Data Quality Monitor** is an intelligent system that 
+    continuously monitors datasets for anomalies, schema drift, missing values, 
+    and suspicious patterns. It uses LLMs to provide explanations, auto-generated 
+    test cases, and remediation suggestions.
+    """
+
+# Function to read and cache a JSON file
+@st.cache_data(ttl=300, max_entries=256, show_spinner=False)
+def _load_json(path):
+    """Load a JSON file, caching the parsed result across reruns."""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
 
 # Function to load available dates
+@st.cache_data(ttl=30, show_spinner=False)
 def load_available_dates():
     """Load available dates from validation results directory."""
     if not os.path.exists(VALIDATION_RESULTS_DIR):
         return []
     
-    dates = []
-    for date_dir in os.listdir(VALIDATION_RESULTS_DIR):
-        if os.path.isdir(os.path.join(VALIDATION_RESULTS_DIR, date_dir)) and date_dir.startswith("20"):
-            try:
-                datetime.strptime(date_dir, "%Y-%m-%d")
-                dates.append(date_dir)
-            except ValueError:
-                continue
+    with os.scandir(VALIDATION_RESULTS_DIR) as entries:
+        dates = [
+            entry.name for entry in entries
+            if entry.is_dir() and _DATE_RE(entry.name)
+        ]
     
     return sorted(dates, reverse=True)
 
 # Function to load available datasets for a given date
+@st.cache_data(ttl=30, show_spinner=False)
 def load_available_datasets(date):
     """Load available datasets for a given date."""
     date_dir = os.path.join(VALIDATION_RESULTS_DIR, date)
     if not os.path.exists(date_dir):
         return []
     
-    datasets = []
-    for dataset_dir in os.listdir(date_dir):
-        if os.path.isdir(os.path.join(date_dir, dataset_dir)):
-            datasets.append(dataset_dir)
+    with os.scandir(date_dir) as entries:
+        datasets = [entry.name for entry in entries if entry.is_dir()]
     
     return sorted(datasets)
 
@@ -70,8 +141,7 @@ def load_validation_results(date, dataset):
     if not os.path.exists(results_path):
         return None
     
-    with open(results_path, 'r') as f:
-        return json.load(f)
+    return _load_json(results_path)
 
 # Function to load insights
 def load_insights(date, dataset):
@@ -80,8 +150,7 @@ def load_insights(date, dataset):
     if not os.path.exists(insights_path):
         return {}
     
-    with open(insights_path, 'r') as f:
-        return json.load(f)
+    return _load_json(insights_path)
 
 # Function to load fix suggestions
 def load_fixes(date, dataset):
@@ -90,80 +159,100 @@ def load_fixes(date, dataset):
     if not os.path.exists(fixes_path):
         return {}
     
-    with open(fixes_path, 'r') as f:
-        return json.load(f)
+    return _load_json(fixes_path)
+
+# Function to load the validation results summary index
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_results_index(mtime):
+    """Load the results summary index written by the validator."""
+    import pandas as pd
+    
+    return pd.read_parquet(RESULTS_INDEX_PATH)
 
 # Function to create success rate chart
+@st.cache_data(ttl=30, show_spinner=False)
 def create_success_rate_chart(dates, datasets):
     """Create a chart showing success rate over time."""
-    data = []
+    import pandas as pd
+    import plotly.graph_objects as go
+    
+    rates = {}
+    if os.path.exists(RESULTS_INDEX_PATH):
+        # Fast path: read the summary index instead of every results file
+        index = _load_results_index(os.path.getmtime(RESULTS_INDEX_PATH))
+        index = index[index['dataset'].isin(datasets) & index['date'].isin(dates)]
+        rates = dict(zip(zip(index['date'], index['dataset']), index['success_percent']))
     
+    # Runs missing from the index (e.g. saved before it existed) are read from their results files
     for date in dates:
         for dataset in datasets:
+            if (date, dataset) in rates:
+                continue
             results = load_validation_results(date, dataset)
             if results:
-                success_percent = results.get('statistics', {}).get('success_percent', 0)
-                data.append({
-                    'Date': date,
-                    'Dataset': dataset,
-                    'Success Rate': success_percent
-                })
+                rates[(date, dataset)] = results.get('statistics', {}).get('success_percent', 0)
     
-    if not data:
+    if not rates:
         return None
     
-    df = pd.DataFrame(data)
-    fig = px.line(
-        df, 
-        x='Date', 
-        y='Success Rate', 
-        color='Dataset',
-        title='Data Quality Success Rate Over Time',
-        labels={'Success Rate': 'Success Rate (%)', 'Date': 'Date'}
-    )
+    keys = sorted(rates)
+    dates_col = [date for date, _ in keys]
+    datasets_col = [dataset for _, dataset in keys]
+    rates_col = [rates[key] for key in keys]
     
-    fig.update_layout(
-        xaxis_title="Date",
-        yaxis_title="Success Rate (%)",
-        legend_title="Dataset",
-        yaxis=dict(range=[0, 100])
-    )
+    df = pd.DataFrame({
+        'Date': dates_col,
+        'Dataset': pd.Categorical(datasets_col),
+        'Success Rate': rates_col
+    })
+    
+    traces = [
+        go.Scatter(x=group['Date'], y=group['Success Rate'], mode='lines', name=name)
+        for name, group in df.groupby('Dataset', sort=False, observed=True)
+    ]
     
-    return fig
+    return go.Figure(
+        data=traces,
+        layout=go.Layout(
+            title='Data Quality Success Rate Over Time',
+            xaxis_title="Date",
+            yaxis_title="Success Rate (%)",
+            legend_title="Dataset",
+            yaxis=dict(range=[0, 100])
+        )
+    )
 
 # Function to create failed checks chart
 def create_failed_checks_chart(results):
     """Create a chart showing failed checks."""
-    if not results or not results.get('failed_checks'):
+    failed = results.get('failed_checks') if results else None
+    if not failed:
         return None
     
-    data = []
-    for check in results.get('failed_checks', []):
-        data.append({
-            'Check': check.get('check_name', 'Unknown'),
-            'Failure Percentage': check.get('failure_percentage', 0)
-        })
+    import plotly.graph_objects as go
     
-    df = pd.DataFrame(data)
-    fig = px.bar(
-        df, 
-        x='Check', 
-        y='Failure Percentage',
-        title='Failed Checks',
-        labels={'Failure Percentage': 'Failure Percentage (%)', 'Check': 'Check'}
+    bar = go.Bar(
+        x=[check.get('check_name', 'Unknown') for check in failed],
+        y=[check.get('failure_percentage', 0) for check in failed]
     )
     
-    fig.update_layout(
-        xaxis_title="Check",
-        yaxis_title="Failure Percentage (%)",
-        xaxis={'categoryorder':'total descending'}
+    return go.Figure(
+        data=[bar],
+        layout=go.Layout(
+            title='Failed Checks',
+            xaxis_title="Check",
+            yaxis_title="Failure Percentage (%)",
+            xaxis={'categoryorder':'total descending'}
+        )
     )
-    
-    return fig
 
 # Sidebar
 st.sidebar.title("🧠 AI-Powered Data Quality Monitor")
 
+# Drop cached results so new validation runs show up immediately
+if st.sidebar.button("🔄 Refresh"):
+    st.cache_data.clear()
+
 # Date selector
 available_dates = load_available_dates()
 if not available_dates:
@@ -226,9 +315,11 @@ if selected_date and selected_dataset:
         
         # Failed checks details
         st.header("Failed Checks")
-        if results.get('failed_checks'):
-            for i, check in enumerate(results.get('failed_checks', [])):
-                with st.expander(f"{check.get('check_name', 'Unknown check')} ({check.get('failure_percentage', 0)}% failure)"):
+        failed = results.get('failed_checks') or []
+        if failed:
+            for i, check in enumerate(failed):
+                check_name = check.get('check_name', 'Unknown check')
+                with st.expander(f"{check_name} ({check.get('failure_percentage', 0)}% failure)"):
                     # Check details
                     st.subheader("Check Details")
                     st.write(f"**Check Type:** {check.get('check_type', 'Unknown')}")
@@ -244,9 +335,9 @@ if selected_date and selected_dataset:
                     st.json(check.get('actual_value', {}))
                     
                     # LLM Insight
-                    if insights and check['check_name'] in insights:
+                    if insights and check_name in insights:
                         st.subheader("🧠 AI Insight")
-                        insight = insights[check['check_name']]
+                        insight = insights[check_name]
                         st.write(f"**Description:** {insight.get('issue_description', 'No insight available')}")
                         st.write(f"**Impact Level:** {insight.get('impact_level', 'Unknown')}")
                         st.write(f"**Business Impact:** {insight.get('business_impact', 'Unknown')}")
@@ -260,9 +351,9 @@ if selected_date and selected_dataset:
                             st.write(f"- {action}")
                     
                     # LLM Fix Suggestion
-                    if fixes and check['check_name'] in fixes:
+                    if fixes and check_name in fixes:
                         st.subheader("🛠️ AI Fix Suggestion")
-                        fix = fixes[check['check_name']]
+                        fix = fixes[check_name]
                         st.write(f"**Approach:** {fix.get('fix_approach', 'No suggestion available')}")
                         st.write(f"**Rationale:** {fix.get('rationale', 'No rationale available')}")
                         st.write(f"**Confidence:** {fix.get('confidence', 'Unknown')}")
@@ -294,71 +385,21 @@ with st.sidebar:
     st.markdown("[📊 Great Expectations Docs](https://docs.greatexpectations.io/)")
 
     st.header("About")
-    st.markdown("""
-    **AI-Powered Data Quality Monitor** is an intelligent system that 
-    continuously monitors datasets for anomalies, schema drift, missing values, 
-    and suspicious patterns. It uses LLMs to provide explanations, auto-generated 
-    test cases, and remediation suggestions.
-    """)
+    st.markdown(_ABOUT_MD)
 
 if not selected_date:
     # Welcome message when no data is selected
     st.title("🧠 AI-Powered Data Quality Monitor")
     
-    st.markdown("""
-    Welcome to the AI-Powered Data Quality Monitor dashboard!
-    
-    This tool helps you monitor the quality of your data by:
-    
-    1. Running validation checks against your datasets
-    2. Using AI to explain data quality issues
-    3. Suggesting fixes for common problems
-    4. Alerting you when issues are detected
-    
-    To get started, select a date and dataset from the sidebar.
-    """)
+    st.markdown(_WELCOME_MD)
     
     # Display sample insights
     st.header("Sample AI Insights")
     with st.expander("✨ Example: Missing Values in Customer ID"):
-        st.markdown("""
-        **Issue Description:** The customer_id field is missing values in 2.5% of records, which exceeds our threshold of 1%.
-        
-        **Impact Level:** Medium
-        
-        **Business Impact:** Missing customer IDs prevent proper attribution of transactions and can lead to inaccurate customer analytics and personalization efforts.
-        
-        **Possible Causes:**
-        - Data entry errors in the source system
-        - Integration issues between customer database and transaction system
-        - New transactions being processed before customer records are created
-        
-        **Recommended Actions:**
-        - Investigate the 17 records with missing IDs to identify patterns
-        - Check if these transactions can be matched to customers using other attributes
-        - Implement validation at the source to prevent missing customer IDs
-        - Consider raising the threshold to 3% if some level of missing IDs is acceptable
-        """)
+        st.markdown(_EX_MISSING_MD)
     
     with st.expander("✨ Example: Schema Drift in Transaction Amount"):
-        st.markdown("""
-        **Issue Description:** The transaction_amount field contains non-numeric values in 0.8% of records, which should be numeric according to the schema.
-        
-        **Impact Level:** High
-        
-        **Business Impact:** Non-numeric transaction amounts will cause errors in financial reporting, skew analytics, and potentially result in incorrect revenue calculations.
-        
-        **Possible Causes:**
-        - Special characters (like currency symbols) included in the amount field
-        - Text status codes mistakenly entered in amount fields
-        - Source system allowing free-form text entry for amounts
-        
-        **Recommended Actions:**
-        - Clean the data by removing non-numeric characters and converting to numbers
-        - Implement input validation in the source system
-        - Create a separate field for transaction notes/comments
-        - Consider adding a data transformation step to handle common formatting issues
-        """)
+        st.markdown(_EX_SCHEMA_MD)
 
 if __name__ == "__main__":
     # This is needed for Streamlit to run
@@ -7,21 +7,151 @@ This module handles data ingestion from various sources:
 - Database connections
 """
 import os
+import csv
 import json
+import shutil
 import logging
+import threading
+import orjson
 import requests
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Iterator, List, Any, Optional, Union
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of rows per chunk when streaming CSV files
+CSV_CHUNK_SIZE = 100_000
+
+# Maximum number of sources ingested concurrently by ingest_many
+MAX_INGEST_WORKERS = 16
+
+# Number of rows fetched per chunk when streaming database query results
+SQL_CHUNK_SIZE = 100_000
+
+# Compression codec for Parquet output
+PARQUET_COMPRESSION = 'zstd'
+
+def _promote_schema(schema, table):
+    """
+    Widen a Parquet output schema for a new chunk of data.
+    
+    Fields that were all-null so far take the chunk's type, and fields first
+    seen in the chunk are appended.
+    
+    Args:
+        schema (pa.Schema): Schema the file is written with
+        table (pa.Table): Next chunk of data
+        
+    Returns:
+        pa.Schema: Schema covering both
+    """
+    import pyarrow as pa
+    
+    fields = []
+    for field in schema:
+        index = table.schema.get_field_index(field.name)
+        if pa.types.is_null(field.type) and index >= 0 and not pa.types.is_null(table.schema.field(index).type):
+            field = table.schema.field(index)
+        fields.append(field)
+    fields.extend(field for field in table.schema if schema.get_field_index(field.name) < 0)
+    return pa.schema(fields)
+
+def _conform_table(table, schema):
+    """
+    Cast a chunk of data to the output schema, filling fields it lacks with nulls.
+    
+    Args:
+        table (pa.Table): Chunk of data
+        schema (pa.Schema): Schema the file is written with
+        
+    Returns:
+        pa.Table: Chunk with exactly the schema's fields
+    """
+    import pyarrow as pa
+    
+    columns = [
+        table.column(field.name).cast(field.type)
+        if table.schema.get_field_index(field.name) >= 0
+        else pa.nulls(table.num_rows, field.type)
+        for field in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+def _write_parquet_tables(tables: Iterator[Any], target_path: str) -> None:
+    """
+    Write a stream of Arrow tables to a single Parquet file.
+    
+    The schema is inferred from the first table and widened whenever a later
+    table brings values for an all-null field or new fields; the rows
+    written so far are then copied into a file with the wider schema.
+    
+    Args:
+        tables (Iterator[pa.Table]): Chunks of data
+        target_path (str): Output Parquet path
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    writer = None
+    try:
+        for table in tables:
+            if writer is None:
+                writer = pq.ParquetWriter(target_path, table.schema, compression=PARQUET_COMPRESSION)
+            elif not table.schema.equals(writer.schema):
+                schema = _promote_schema(writer.schema, table)
+                if not schema.equals(writer.schema):
+                    # Rewrite the rows written so far with the wider schema
+                    writer.close()
+                    partial_path = f"{target_path}.{os.getpid()}.partial"
+                    os.replace(target_path, partial_path)
+                    writer = pq.ParquetWriter(target_path, schema, compression=PARQUET_COMPRESSION)
+                    for batch in pq.ParquetFile(partial_path).iter_batches():
+                        writer.write_table(_conform_table(pa.Table.from_batches([batch]), schema))
+                    os.remove(partial_path)
+                table = _conform_table(table, writer.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        pq.write_table(pa.table({}), target_path)
+
+def _append_csv_columns(path: str, columns: List[str], new_columns: List[str]) -> None:
+    """
+    Add empty columns to a CSV file written so far.
+    
+    Args:
+        path (str): CSV file
+        columns (List[str]): Current header
+        new_columns (List[str]): Columns to append
+    """
+    partial_path = f"{path}.{os.getpid()}.partial"
+    os.replace(path, partial_path)
+    padding = [''] * len(new_columns)
+    with open(partial_path, newline='') as src, open(path, 'w', newline='') as dst:
+        reader = csv.reader(src)
+        writer = csv.writer(dst)
+        next(reader, None)
+        writer.writerow(columns + new_columns)
+        for row in reader:
+            writer.writerow(row + padding)
+    os.remove(partial_path)
+
 class DataIngester:
     """Class for ingesting data from various sources."""
     
+    # SQLAlchemy engines shared by all ingesters, keyed by connection string
+    _engine_cache: Dict[str, Any] = {}
+    _engine_cache_lock = threading.Lock()
+    
     def __init__(self, 
                 target_dir: str = "../data/raw",
                 config_path: Optional[str] = "../config.json"):
@@ -42,16 +172,32 @@ class DataIngester:
         if config_path and os.path.exists(config_path):
             with open(config_path, 'r') as f:
                 self.config = json.load(f)
+        
+        # Pooled HTTP session so API ingestion reuses TCP/TLS connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=MAX_INGEST_WORKERS,
+            pool_maxsize=2 * MAX_INGEST_WORKERS,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Output directories already created by this ingester
+        self._ensured_dirs = set()
     
     def ingest_from_file(self, 
                        source_path: str, 
-                       target_name: Optional[str] = None) -> str:
+                       target_name: Optional[str] = None,
+                       transform: bool = False) -> str:
         """
         Ingest data from a file.
         
         Args:
             source_path (str): Path to the source file
             target_name (Optional[str]): Name for the target file
+            transform (bool): Parse and re-serialize the data even when the
+                source and target formats match
             
         Returns:
             str: Path to the ingested data file
@@ -63,27 +209,33 @@ class DataIngester:
             if not target_name:
                 target_name = os.path.basename(source_path)
             
-            # Create date-based directory
-            date_dir = datetime.now().strftime("%Y-%m-%d")
-            output_dir = os.path.join(self.target_dir, date_dir)
-            os.makedirs(output_dir, exist_ok=True)
-            
-            # Copy file to target directory
-            target_path = os.path.join(output_dir, target_name)
+            # Resolve the target path in today's directory
+            target_path = self._ensure_date_path(target_name, datetime.now())
             
             # Handle different file formats
-            if source_path.endswith('.csv'):
-                df = pd.read_csv(source_path)
-                df.to_csv(target_path, index=False)
+            same_format = os.path.splitext(source_path)[1].lower() == os.path.splitext(target_path)[1].lower()
+            if not transform and same_format:
+                # Pass-through: kernel-side copy, no parsing
+                shutil.copyfile(source_path, target_path)
+            elif source_path.endswith('.csv'):
+                # Stream in chunks so peak memory is bounded by the chunk size
+                first = True
+                for chunk in pd.read_csv(source_path, chunksize=CSV_CHUNK_SIZE):
+                    chunk.to_csv(target_path, mode='w' if first else 'a', header=first, index=False)
+                    first = False
             elif source_path.endswith('.parquet'):
-                df = pd.read_parquet(source_path)
-                df.to_parquet(target_path, index=False)
+                # Stream record batches straight between Parquet files via Arrow
+                import pyarrow.parquet as pq
+                
+                source = pq.ParquetFile(source_path)
+                with pq.ParquetWriter(target_path, source.schema_arrow, compression=PARQUET_COMPRESSION) as writer:
+                    for batch in source.iter_batches():
+                        writer.write_batch(batch)
             elif source_path.endswith('.json'):
                 df = pd.read_json(source_path)
                 df.to_json(target_path, orient='records')
             else:
                 # For other file types, just copy the file
-                import shutil
                 shutil.copyfile(source_path, target_path)
             
             logger.info(f"Data ingested to: {target_path}")
@@ -93,6 +245,105 @@ class DataIngester:
             logger.error(f"Data ingestion failed: {e}")
             raise
     
+    def _ensure_date_path(self, target_name: str, now: datetime) -> str:
+        """
+        Get the path for a target file in the date-based directory, creating the directory once.
+        
+        Args:
+            target_name (str): Name of the target file
+            now (datetime): Ingestion time selecting the date directory
+            
+        Returns:
+            str: Path to the target file
+        """
+        output_dir = os.path.join(self.target_dir, now.strftime("%Y-%m-%d"))
+        if output_dir not in self._ensured_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+            self._ensured_dirs.add(output_dir)
+        return os.path.join(output_dir, target_name)
+    
+    @classmethod
+    def _get_engine(cls, connection_string: str):
+        """
+        Get a pooled SQLAlchemy engine for a connection string, creating it on first use.
+        
+        Args:
+            connection_string (str): Database URL
+            
+        Returns:
+            sqlalchemy.engine.Engine: Shared engine for the database
+        """
+        with cls._engine_cache_lock:
+            engine = cls._engine_cache.get(connection_string)
+            if engine is None:
+                import sqlalchemy
+                
+                options = {'pool_pre_ping': True}
+                if not connection_string.startswith('sqlite'):
+                    options['pool_size'] = 8
+                engine = sqlalchemy.create_engine(connection_string, **options)
+                cls._engine_cache[connection_string] = engine
+            return engine
+    
+    def _write_df(self, df: pd.DataFrame, target_path: str) -> None:
+        """
+        Write a DataFrame to disk in the format implied by the target extension.
+        
+        Args:
+            df (pd.DataFrame): Data to write
+            target_path (str): Output path ('.csv', '.parquet', anything else is JSON records)
+        """
+        if target_path.endswith('.csv'):
+            df.to_csv(target_path, index=False)
+        elif target_path.endswith('.parquet'):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            
+            pq.write_table(
+                pa.Table.from_pandas(df, preserve_index=False),
+                target_path,
+                compression=PARQUET_COMPRESSION,
+                use_dictionary=True
+            )
+        else:
+            df.to_json(target_path, orient='records')
+    
+    def _write_df_chunks(self, chunks: Iterator[pd.DataFrame], target_path: str) -> None:
+        """
+        Write a stream of DataFrame chunks to a single file without materializing them.
+        
+        Args:
+            chunks (Iterator[pd.DataFrame]): DataFrame chunks sharing the same columns
+            target_path (str): Output path ('.csv', '.parquet', anything else is JSON records)
+        """
+        if target_path.endswith('.parquet'):
+            import pyarrow as pa
+            
+            # Columns that are all-null in the first chunk are typed by the first chunk with values
+            _write_parquet_tables(
+                (pa.Table.from_pandas(chunk, preserve_index=False) for chunk in chunks),
+                target_path
+            )
+        elif target_path.endswith('.csv'):
+            with open(target_path, 'w', newline='') as f:
+                first = True
+                for chunk in chunks:
+                    chunk.to_csv(f, header=first, index=False)
+                    first = False
+        else:
+            with open(target_path, 'w') as f:
+                f.write('[')
+                first = True
+                for chunk in chunks:
+                    records = chunk.to_json(orient='records')[1:-1]
+                    if not records:
+                        continue
+                    if not first:
+                        f.write(',')
+                    f.write(records)
+                    first = False
+                f.write(']')
+    
     def ingest_from_api(self, 
                       api_config: Dict[str, Any],
                       target_name: Optional[str] = None) -> str:
@@ -100,7 +351,9 @@ class DataIngester:
         Ingest data from an API.
         
         Args:
-            api_config (Dict[str, Any]): API configuration
+            api_config (Dict[str, Any]): API configuration. When 'records_path'
+                is set (an ijson prefix such as 'item' or 'results.item'), the
+                records are streamed to disk without buffering the response.
             target_name (Optional[str]): Name for the target file
             
         Returns:
@@ -115,6 +368,7 @@ class DataIngester:
             headers = api_config.get('headers', {})
             params = api_config.get('params', {})
             data = api_config.get('data', {})
+            records_path = api_config.get('records_path')
             auth = None
             
             if api_config.get('auth'):
@@ -127,36 +381,38 @@ class DataIngester:
                 elif auth_config.get('type') == 'token':
                     headers['Authorization'] = f"Bearer {auth_config.get('token')}"
             
-            # Make API request
-            response = requests.request(
+            # Determine target file name
+            now = datetime.now()
+            if not target_name:
+                target_name = f"api_data_{now.strftime('%Y%m%d_%H%M%S')}.parquet"
+            
+            # Save data to file in today's directory
+            target_path = self._ensure_date_path(target_name, now)
+            
+            # Make API request; the body is only pulled off the socket as it is consumed
+            with self.session.request(
                 method=method,
                 url=url,
                 headers=headers,
                 params=params,
                 json=data if method in ['POST', 'PUT', 'PATCH'] else None,
-                auth=auth
-            )
-            
-            # Check response
-            response.raise_for_status()
-            
-            # Parse response
-            if 'application/json' in response.headers.get('Content-Type', ''):
-                data = response.json()
-            else:
-                data = response.text
-            
-            # Create date-based directory
-            date_dir = datetime.now().strftime("%Y-%m-%d")
-            output_dir = os.path.join(self.target_dir, date_dir)
-            os.makedirs(output_dir, exist_ok=True)
-            
-            # Determine target file name
-            if not target_name:
-                target_name = f"api_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            
-            # Save data to file
-            target_path = os.path.join(output_dir, target_name)
+                auth=auth,
+                stream=True
+            ) as response:
+                # Check response
+                response.raise_for_status()
+                
+                is_json = 'application/json' in response.headers.get('Content-Type', '')
+                if is_json and records_path:
+                    self._stream_api_records(response, records_path, target_path)
+                    logger.info(f"Data ingested to: {target_path}")
+                    return target_path
+                
+                # Parse response
+                if is_json:
+                    data = orjson.loads(response.content)
+                else:
+                    data = response.text
             
             # Convert to DataFrame and save
             if isinstance(data, list):
@@ -176,12 +432,7 @@ class DataIngester:
                 return target_path
             
             # Save DataFrame
-            if target_name.endswith('.csv'):
-                df.to_csv(target_path, index=False)
-            elif target_name.endswith('.parquet'):
-                df.to_parquet(target_path, index=False)
-            else:
-                df.to_json(target_path, orient='records')
+            self._write_df(df, target_path)
             
             logger.info(f"Data ingested to: {target_path}")
             return target_path
@@ -190,6 +441,57 @@ class DataIngester:
             logger.error(f"API data ingestion failed: {e}")
             raise
     
+    def _stream_api_records(self, response, records_path: str, target_path: str) -> None:
+        """
+        Incrementally parse JSON records from a streamed response and write them in batches.
+        
+        Args:
+            response: Streamed requests response
+            records_path (str): ijson prefix of the records to extract
+            target_path (str): Path of the output file; its extension selects the format
+        """
+        import ijson
+        
+        # Let urllib3 undo any gzip/deflate content encoding while reading
+        response.raw.decode_content = True
+        records = ijson.items(response.raw, records_path, use_float=True)
+        
+        batches = iter(lambda: list(islice(records, CSV_CHUNK_SIZE)), [])
+        
+        if target_path.endswith('.parquet'):
+            import pyarrow as pa
+            
+            # Each batch infers its types from all of its records (from_pylist would only use the
+            # first record's keys); the file schema is widened for keys typed or first seen later
+            _write_parquet_tables(
+                (pa.Table.from_batches([pa.RecordBatch.from_struct_array(pa.array(batch))]) for batch in batches),
+                target_path
+            )
+        elif target_path.endswith('.csv'):
+            columns = None
+            for batch in batches:
+                df = pd.DataFrame(batch)
+                if columns is not None:
+                    # Keys first seen in this batch become new columns, empty in earlier rows
+                    new_columns = [name for name in df.columns if name not in columns]
+                    if new_columns:
+                        _append_csv_columns(target_path, columns, new_columns)
+                        columns = columns + new_columns
+                    df = df.reindex(columns=columns)
+                with open(target_path, 'w' if columns is None else 'a', newline='') as f:
+                    df.to_csv(f, header=columns is None, index=False)
+                columns = list(df.columns)
+            if columns is None:
+                open(target_path, 'w').close()
+        else:
+            with open(target_path, 'wb') as f:
+                f.write(b'[')
+                for i, record in enumerate(records):
+                    if i:
+                        f.write(b',')
+                    f.write(orjson.dumps(record, default=str))
+                f.write(b']')
+    
     def ingest_from_database(self, 
                            db_config: Dict[str, Any],
                            query: str,
@@ -226,30 +528,19 @@ class DataIngester:
             else:
                 raise ValueError(f"Unsupported database type: {db_type}")
             
-            # Connect to database and execute query
-            import sqlalchemy
-            engine = sqlalchemy.create_engine(connection_string)
-            df = pd.read_sql(query, engine)
-            
-            # Create date-based directory
-            date_dir = datetime.now().strftime("%Y-%m-%d")
-            output_dir = os.path.join(self.target_dir, date_dir)
-            os.makedirs(output_dir, exist_ok=True)
-            
             # Determine target file name
+            now = datetime.now()
             if not target_name:
-                target_name = f"db_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+                target_name = f"db_data_{now.strftime('%Y%m%d_%H%M%S')}.parquet"
             
-            # Save data to file
-            target_path = os.path.join(output_dir, target_name)
+            # Save data to file in today's directory
+            target_path = self._ensure_date_path(target_name, now)
             
-            # Save DataFrame
-            if target_name.endswith('.csv'):
-                df.to_csv(target_path, index=False)
-            elif target_name.endswith('.parquet'):
-                df.to_parquet(target_path, index=False)
-            else:
-                df.to_json(target_path, orient='records')
+            # Connect to database and stream the query result to disk chunk by chunk
+            engine = self._get_engine(connection_string)
+            with engine.connect() as conn:
+                conn = conn.execution_options(stream_results=True)
+                self._write_df_chunks(pd.read_sql(query, conn, chunksize=SQL_CHUNK_SIZE), target_path)
             
             logger.info(f"Data ingested to: {target_path}")
             return target_path
@@ -274,7 +565,11 @@ class DataIngester:
             str: Path to the ingested data file
         """
         if source_type == 'file':
-            return self.ingest_from_file(source_config.get('path'), target_name)
+            return self.ingest_from_file(
+                source_config.get('path'),
+                target_name,
+                source_config.get('transform', False)
+            )
         elif source_type == 'api':
             return self.ingest_from_api(source_config, target_name)
         elif source_type == 'database':
@@ -285,6 +580,33 @@ class DataIngester:
             )
         else:
             raise ValueError(f"Unsupported source type: {source_type}")
+    
+    def ingest_many(self, 
+                  sources: List[Dict[str, Any]],
+                  max_workers: int = MAX_INGEST_WORKERS) -> List[str]:
+        """
+        Ingest data from several sources concurrently.
+        
+        Args:
+            sources (List[Dict[str, Any]]): Sources to ingest, each with a 'type'
+                ('file', 'api', 'database'), a 'config' and an optional 'target_name'
+            max_workers (int): Maximum number of concurrent ingestions
+            
+        Returns:
+            List[str]: Paths to the ingested data files, in the order of ``sources``
+        """
+        if not sources:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(sources))) as executor:
+            return list(executor.map(
+                lambda source: self.ingest_from_source(
+                    source['type'],
+                    source.get('config', {}),
+                    source.get('target_name')
+                ),
+                sources
+            ))
 
 
 def ingest(source: str, target: Optional[str] = None, config_path: Optional[str] = None) -> str:
@@ -0,0 +1,354 @@
+"""
+Vectorized implementations of common expectations
+
+This module evaluates the most frequently used Great Expectations
+expectations directly with pandas/numpy column operations and produces
+GE-shaped result dictionaries. Expectations it does not cover are
+validated by Great Expectations itself.
+"""
+import os
+import json
+import logging
+import pandas as pd
+import great_expectations as ge
+from great_expectations.core import ExpectationSuite
+from great_expectations.dataset import PandasDataset
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Number of sample unexpected values reported per expectation (GE's BASIC result format)
+PARTIAL_UNEXPECTED_COUNT = 20
+
+# Minimum number of rows before expectations are evaluated on a thread pool
+PARALLEL_MIN_ROWS = 100_000
+
+
+def _column_map_result(series: pd.Series,
+                       unexpected: pd.Series,
+                       mostly: float,
+                       count_missing: bool = True) -> Dict[str, Any]:
+    """
+    Build the result of a column map expectation from its unexpected-value mask.
+
+    Args:
+        series (pd.Series): Column being validated
+        unexpected (pd.Series): Boolean mask of unexpected values
+        mostly (float): Minimum fraction of expected values for success
+        count_missing (bool): Whether nulls are excluded from the evaluated values
+
+    Returns:
+        Dict[str, Any]: Success flag and GE-shaped ``result`` payload
+    """
+    element_count = len(series)
+    missing_count = int(series.isna().sum()) if count_missing else 0
+    nonmissing_count = element_count - missing_count
+    unexpected_count = int(unexpected.sum())
+
+    if count_missing:
+        partial = series[unexpected].head(PARTIAL_UNEXPECTED_COUNT).tolist()
+    else:
+        partial = [None] * min(unexpected_count, PARTIAL_UNEXPECTED_COUNT)
+
+    unexpected_ratio = unexpected_count / nonmissing_count if nonmissing_count else 0.0
+    result = {
+        "element_count": element_count,
+        "unexpected_count": unexpected_count,
+        "unexpected_percent": unexpected_ratio * 100,
+        "unexpected_percent_total": unexpected_count / element_count * 100 if element_count else None,
+        "partial_unexpected_list": partial,
+    }
+    if count_missing:
+        result["missing_count"] = missing_count
+        result["missing_percent"] = missing_count / element_count * 100 if element_count else None
+        result["unexpected_percent_nonmissing"] = result["unexpected_percent"]
+
+    return {
+        "success": not nonmissing_count or (1 - unexpected_ratio) >= mostly,
+        "result": result,
+    }
+
+
+def _not_be_null(df: pd.DataFrame, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """expect_column_values_to_not_be_null"""
+    series = df[kwargs['column']]
+    return _column_map_result(series, series.isna(), kwargs.get('mostly', 1), count_missing=False)
+
+
+def _be_unique(df: pd.DataFrame, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """expect_column_values_to_be_unique: every occurrence of a duplicated value is unexpected"""
+    series = df[kwargs['column']]
+    unexpected = series.duplicated(keep=False) & series.notna()
+    return _column_map_result(series, unexpected, kwargs.get('mostly', 1))
+
+
+def _be_in_set(df: pd.DataFrame, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """expect_column_values_to_be_in_set"""
+    value_set = kwargs.get('value_set')
+    if not isinstance(value_set, (list, tuple, set)):
+        return None
+
+    series = df[kwargs['column']]
+    unexpected = ~series.isin(value_set) & series.notna()
+    return _column_map_result(series, unexpected, kwargs.get('mostly', 1))
+
+
+def _is_number(value: Any) -> bool:
+    """Check whether a value is a plain (non-boolean) number."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _be_between(df: pd.DataFrame, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """expect_column_values_to_be_between for numeric columns and bounds"""
+    series = df[kwargs['column']]
+    min_value = kwargs.get('min_value')
+    max_value = kwargs.get('max_value')
+
+    # Only plain numeric ranges; dates, strings and mixed types go through GE
+    if min_value is None and max_value is None:
+        return None
+    if any(bound is not None and not _is_number(bound) for bound in (min_value, max_value)):
+        return None
+    if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+        return None
+
+    in_range = series.notna()
+    if min_value is not None:
+        in_range &= (series > min_value) if kwargs.get('strict_min') else (series >= min_value)
+    if max_value is not None:
+        in_range &= (series < max_value) if kwargs.get('strict_max') else (series <= max_value)
+
+    return _column_map_result(series, ~in_range & series.notna(), kwargs.get('mostly', 1))
+
+
+def _column_to_exist(df: pd.DataFrame, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """expect_column_to_exist without a column_index"""
+    if kwargs.get('column_index') is not None:
+        return None
+    return {"success": kwargs['column'] in df.columns, "result": {}}
+
+
+def _table_columns_to_match_ordered_list(df: pd.DataFrame, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """expect_table_columns_to_match_ordered_list"""
+    observed = list(df.columns)
+    return {
+        "success": observed == list(kwargs.get('column_list') or []),
+        "result": {"observed_value": observed},
+    }
+
+
+def _table_row_count_to_be_between(df: pd.DataFrame, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """expect_table_row_count_to_be_between"""
+    min_value = kwargs.get('min_value')
+    max_value = kwargs.get('max_value')
+    if any(bound is not None and not _is_number(bound) for bound in (min_value, max_value)):
+        return None
+
+    row_count = len(df)
+    return {
+        "success": (min_value is None or row_count >= min_value) and (max_value is None or row_count <= max_value),
+        "result": {"observed_value": row_count},
+    }
+
+
+# Native implementation and accepted kwargs per expectation type
+_NATIVE_CHECKS: Dict[str, Any] = {
+    'expect_column_values_to_not_be_null': (_not_be_null, {'column', 'mostly'}),
+    'expect_column_values_to_be_unique': (_be_unique, {'column', 'mostly'}),
+    'expect_column_values_to_be_in_set': (_be_in_set, {'column', 'value_set', 'mostly'}),
+    'expect_column_values_to_be_between': (
+        _be_between, {'column', 'min_value', 'max_value', 'strict_min', 'strict_max', 'mostly'}
+    ),
+    'expect_column_to_exist': (_column_to_exist, {'column', 'column_index'}),
+    'expect_table_columns_to_match_ordered_list': (_table_columns_to_match_ordered_list, {'column_list'}),
+    'expect_table_row_count_to_be_between': (_table_row_count_to_be_between, {'min_value', 'max_value'}),
+}
+
+
+def _evaluate_native(df: pd.DataFrame, expectation) -> Optional[Dict[str, Any]]:
+    """
+    Evaluate an expectation natively when it is supported.
+
+    Args:
+        df (pd.DataFrame): Dataset to validate
+        expectation: Expectation configuration
+
+    Returns:
+        Optional[Dict[str, Any]]: GE-shaped expectation result, or None if the
+            expectation has to be validated by Great Expectations
+    """
+    check = _NATIVE_CHECKS.get(expectation.expectation_type)
+    if check is None:
+        return None
+
+    func, accepted_kwargs = check
+    kwargs = expectation.kwargs
+
+    # Unknown options, evaluation parameters and missing columns keep GE's own semantics
+    if not set(kwargs) <= accepted_kwargs:
+        return None
+    if any(isinstance(value, dict) for value in kwargs.values()):
+        return None
+    if 'column' in kwargs and expectation.expectation_type != 'expect_column_to_exist' \
+            and kwargs['column'] not in df.columns:
+        return None
+
+    outcome = func(df, kwargs)
+    if outcome is None:
+        return None
+
+    return {
+        "success": bool(outcome["success"]),
+        "expectation_config": {
+            "expectation_type": expectation.expectation_type,
+            "kwargs": dict(kwargs),
+            "meta": dict(expectation.meta or {}),
+        },
+        "result": outcome["result"],
+        "meta": {},
+        "exception_info": {
+            "raised_exception": False,
+            "exception_message": None,
+            "exception_traceback": None,
+        },
+    }
+
+
+def _validate_with_ge(df: pd.DataFrame, suite: ExpectationSuite, expectations: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Validate a subset of a suite's expectations with Great Expectations.
+    
+    Args:
+        df (pd.DataFrame): Dataset to validate (a PandasDataset is reused as is)
+        suite (ExpectationSuite): Suite the expectations belong to
+        expectations (List[Any]): Expectation configurations to validate
+        
+    Returns:
+        List[Dict[str, Any]]: Expectation results in Great Expectations' JSON shape
+    """
+    logger.debug(f"Validating {len(expectations)} expectations with Great Expectations")
+    dataset = df if isinstance(df, PandasDataset) else ge.from_pandas(df)
+    ge_suite = ExpectationSuite(
+        expectation_suite_name=suite.expectation_suite_name,
+        expectations=expectations,
+        meta=suite.meta
+    )
+    return dataset.validate(expectation_suite=ge_suite).to_json_dict().get('results', [])
+
+
+def _group_by_column(expectations: List[Any]) -> List[List[Any]]:
+    """Group expectations by their target column; table-level ones share a group."""
+    groups: Dict[Optional[str], List[Any]] = {}
+    for expectation in expectations:
+        column = expectation.kwargs.get('column')
+        groups.setdefault(column if isinstance(column, str) else None, []).append(expectation)
+    return list(groups.values())
+
+
+def _config_key(expectation_type: Optional[str], kwargs: Dict[str, Any]) -> str:
+    """Return a canonical key of an expectation configuration."""
+    return f"{expectation_type}:{json.dumps(kwargs, sort_keys=True, default=str)}"
+
+
+def _suite_positions(results: List[Dict[str, Any]],
+                     expectations: List[Any],
+                     indices: List[int]) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    Pair Great Expectations results with the suite positions of their expectations.
+
+    GE validates column by column, so its results do not come back in suite
+    order; each result is matched to its expectation by configuration.
+
+    Args:
+        results (List[Dict[str, Any]]): Expectation results from Great Expectations
+        expectations (List[Any]): All expectations of the suite
+        indices (List[int]): Suite positions of the expectations GE validated
+
+    Returns:
+        List[Tuple[int, Dict[str, Any]]]: (suite position, result) pairs; unmatched
+            results are placed after the suite's expectations
+    """
+    positions: Dict[str, List[int]] = {}
+    for index in indices:
+        key = _config_key(expectations[index].expectation_type, expectations[index].kwargs)
+        positions.setdefault(key, []).append(index)
+    
+    paired = []
+    for result in results:
+        config = result.get('expectation_config') or {}
+        candidates = positions.get(_config_key(config.get('expectation_type'), config.get('kwargs') or {}))
+        paired.append((candidates.pop(0) if candidates else len(expectations), result))
+    return paired
+
+
+def validate_dataframe(df: pd.DataFrame, 
+                       suite: ExpectationSuite,
+                       max_workers: Optional[int] = None,
+                       parallel: bool = False) -> Dict[str, Any]:
+    """
+    Validate a DataFrame against an expectation suite.
+
+    Supported expectations are evaluated with vectorized pandas operations;
+    the remaining ones are validated by Great Expectations in a single pass.
+    On large frames the expectations are evaluated concurrently.
+
+    With ``parallel``, expectations are evaluated concurrently regardless of
+    the frame size, and the Great Expectations pass is split into one pass
+    per target column, each on its own dataset view of the shared data.
+
+    Args:
+        df (pd.DataFrame): Dataset to validate (a PandasDataset is reused for the GE pass)
+        suite (ExpectationSuite): Expectation suite to validate against
+        max_workers (Optional[int]): Thread pool size (defaults to the CPU count)
+        parallel (bool): Whether to always validate concurrently, including the GE pass
+
+    Returns:
+        Dict[str, Any]: Validation results in Great Expectations' JSON shape, in suite order
+    """
+    expectations = suite.expectations
+    workers = min(max_workers or os.cpu_count() or 1, max(len(expectations), 1))
+    
+    # Threads are only started once work is submitted
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        if len(expectations) > 1 and (parallel or len(df) >= PARALLEL_MIN_ROWS):
+            native = list(executor.map(lambda expectation: _evaluate_native(df, expectation), expectations))
+        else:
+            native = [_evaluate_native(df, expectation) for expectation in expectations]
+        
+        ordered = [(index, result) for index, result in enumerate(native) if result is not None]
+        
+        # Validate whatever could not be evaluated natively with Great Expectations
+        fallback_indices = [index for index, result in enumerate(native) if result is None]
+        fallback = [expectations[index] for index in fallback_indices]
+        ge_results = []
+        groups = _group_by_column(fallback) if parallel else [fallback]
+        if len(groups) > 1:
+            # Column groups are independent; each gets its own dataset so no GE state is shared
+            group_results = executor.map(
+                lambda group: _validate_with_ge(pd.DataFrame(df, copy=False), suite, group), groups
+            )
+            for group_result in group_results:
+                ge_results.extend(group_result)
+        elif fallback:
+            ge_results = _validate_with_ge(df, suite, fallback)
+    
+    # Report results in the order of the suite's expectations
+    ordered.extend(_suite_positions(ge_results, expectations, fallback_indices))
+    results = [result for _, result in sorted(ordered, key=lambda item: item[0])]
+
+    evaluated = len(results)
+    successful = sum(1 for result in results if result.get('success'))
+
+    return {
+        'success': successful == evaluated,
+        'results': results,
+        'statistics': {
+            'evaluated_expectations': evaluated,
+            'successful_expectations': successful,
+            'unsuccessful_expectations': evaluated - successful,
+            'success_percent': successful / evaluated * 100 if evaluated else None,
+        }
+    }
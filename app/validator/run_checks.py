@@ -2,24 +2,285 @@
 Main validator module for running data quality checks
 
 This module uses Great Expectations to validate datasets against
-defined expectations and saves validation results.
+defined expectations and saves validation results. Common expectations
+are evaluated natively (see native_checks).
 """
 import os
+import csv
 import sys
+import copy
 import json
+import pickle
+import hashlib
 import yaml
+import orjson
 import logging
 import datetime
+from collections import OrderedDict
+from functools import lru_cache
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import great_expectations as ge
 from great_expectations.core import ExpectationSuite
 from great_expectations.dataset import PandasDataset
-from typing import Dict, List, Any, Optional
+from .native_checks import validate_dataframe
+from typing import Dict, Iterator, List, Any, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: index updates are not serialized across processes
+    fcntl = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Directory of pickled suite configurations; set to an empty string to disable it
+SUITE_CACHE_DIR = os.getenv("SUITE_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".dq_cache", "suites"))
+
+@lru_cache(maxsize=64)
+def _load_suite_config(path: str, mtime: float) -> Dict[str, Any]:
+    """
+    Load and cache an expectation suite configuration file.
+    
+    The modification time is part of the cache key so that edits to the
+    suite are picked up on the next load. Across processes, the parsed
+    configuration is reused from a pickle in SUITE_CACHE_DIR (named by the
+    hash of the suite's path) as long as the file's mtime and size match.
+    
+    Args:
+        path (str): Path to the expectation suite file
+        mtime (float): Modification time of the file
+        
+    Returns:
+        Dict[str, Any]: Parsed suite configuration
+    """
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cache_path = None
+    if SUITE_CACHE_DIR:
+        cache_name = hashlib.sha256(os.path.realpath(path).encode()).hexdigest()
+        cache_path = os.path.join(SUITE_CACHE_DIR, f"{cache_name}.pkl")
+        
+        # Skip parsing when the pickled configuration belongs to this version of the file
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_version, suite_config = pickle.load(f)
+            if cached_version == version:
+                return suite_config
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError) as e:
+            logger.debug(f"No usable cached suite for {path}: {e}")
+    
+    if path.endswith('.json'):
+        with open(path, 'rb') as f:
+            suite_config = orjson.loads(f.read())
+    else:
+        with open(path, 'r') as f:
+            suite_config = yaml.load(f, Loader=_YAML_LOADER)
+    
+    if cache_path is not None:
+        try:
+            os.makedirs(SUITE_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((version, suite_config), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache parsed suite {path}: {e}")
+    
+    return suite_config
+
+# Number of loaded datasets kept per validator for repeated validations of unchanged files
+DATASET_CACHE_SIZE = 4
+
+# Dataset path reported for DataFrames validated in memory
+IN_MEMORY_DATASET_PATH = "in_memory_dataset"
+
+# Maximum number of sample unexpected values kept per expectation when merging chunks
+PARTIAL_UNEXPECTED_LIMIT = 20
+
+# Column-value expectations whose outcome depends on rows in other chunks
+_CROSS_CHUNK_EXPECTATIONS = {
+    'expect_column_values_to_be_unique',
+    'expect_column_values_to_be_increasing',
+    'expect_column_values_to_be_decreasing',
+}
+
+def _is_chunkable(expectation_type: str) -> bool:
+    """
+    Check whether an expectation can be evaluated per chunk and merged.
+    
+    Row-wise column expectations sum their counters across chunks, and
+    table-column expectations see the same columns in every chunk. Aggregate
+    expectations (row counts, means, uniqueness, ...) need the whole dataset.
+    
+    Args:
+        expectation_type (str): Great Expectations expectation type
+        
+    Returns:
+        bool: Whether the expectation supports chunked validation
+    """
+    if expectation_type in _CROSS_CHUNK_EXPECTATIONS:
+        return False
+    return (expectation_type.startswith(('expect_column_values_to_', 'expect_table_columns_to_'))
+            or expectation_type == 'expect_column_to_exist')
+
+# Expectation kwargs that name the columns an expectation reads
+_COLUMN_KWARGS = ('column', 'column_A', 'column_B')
+
+def _referenced_columns(suite: ExpectationSuite) -> Optional[List[str]]:
+    """
+    Collect the columns referenced by an expectation suite.
+    
+    Args:
+        suite (ExpectationSuite): Expectation suite
+        
+    Returns:
+        Optional[List[str]]: Referenced columns, or None if the suite needs every
+            column (table-level expectations or expectations without column kwargs)
+    """
+    columns = []
+    for expectation in suite.expectations:
+        if expectation.expectation_type.startswith('expect_table_'):
+            return None
+        
+        kwargs = expectation.kwargs
+        names = [kwargs[key] for key in _COLUMN_KWARGS if key in kwargs]
+        names.extend(kwargs.get('column_list') or [])
+        if not names:
+            return None
+        
+        columns.extend(name for name in names if name not in columns)
+    
+    return columns or None
+
+def _prune_columns(path: str, columns: Optional[List[str]]) -> Optional[List[str]]:
+    """
+    Restrict requested columns to those present in a CSV or Parquet file.
+    
+    Columns missing from the file are dropped so that the corresponding
+    expectations still report the missing column instead of the read failing.
+    
+    Args:
+        path (str): Path to the dataset file
+        columns (Optional[List[str]]): Requested columns, or None for all columns
+        
+    Returns:
+        Optional[List[str]]: Columns to read in file order, or None for all columns
+            (including when none of the requested columns exist)
+    """
+    if columns is None:
+        return None
+    
+    if path.endswith('.parquet'):
+        available = pq.read_schema(path).names
+    else:
+        with open(path, newline='') as f:
+            available = next(csv.reader(f), [])
+    
+    wanted = set(columns)
+    return [name for name in available if name in wanted] or None
+
+def _read_table(path: str, columns: Optional[List[str]] = None) -> pa.Table:
+    """
+    Read a CSV or Parquet file into an Arrow table using the multi-threaded readers.
+    
+    CSV files are parsed like pandas.read_csv in the chunked path: empty
+    cells are nulls in every column and dates stay strings instead of being
+    inferred as date/timestamp columns.
+    
+    Args:
+        path (str): Path to the dataset file
+        columns (Optional[List[str]]): Columns to read, or None for all columns
+        
+    Returns:
+        pa.Table: Loaded table
+    """
+    if path.endswith('.csv'):
+        options = {'strings_can_be_null': True}
+        if columns is not None:
+            options['include_columns'] = columns
+        
+        # Infer the column types from the first block and read temporal columns as strings
+        reader = pacsv.open_csv(path, convert_options=pacsv.ConvertOptions(**options))
+        try:
+            schema = reader.schema
+        finally:
+            reader.close()
+        options['column_types'] = {
+            field.name: pa.string()
+            for field in schema
+            if pa.types.is_temporal(field.type)
+        }
+        
+        return pacsv.read_csv(path, convert_options=pacsv.ConvertOptions(**options))
+    elif path.endswith('.parquet'):
+        return pq.read_table(path, columns=columns)
+    else:
+        raise ValueError(f"Unsupported file format: {path}")
+
+def _build_failed_check(result: Dict[str, Any], 
+                        dataset_name: str, 
+                        dataset_path: str, 
+                        timestamp: str) -> Dict[str, Any]:
+    """
+    Build the failed-check record for a single unsuccessful expectation result.
+    
+    Args:
+        result (Dict[str, Any]): Expectation validation result
+        dataset_name (str): File name of the validated dataset
+        dataset_path (str): Path to the dataset file
+        timestamp (str): ISO timestamp of the validation run
+        
+    Returns:
+        Dict[str, Any]: Failed check details
+    """
+    cfg = result.get('expectation_config') or {}
+    res = result.get('result') or {}
+    expectation_type = cfg.get('expectation_type') or ''
+    unexpected_count = res.get('unexpected_count', 0)
+    unexpected_percent = res.get('unexpected_percent', 0)
+    
+    return {
+        "check_name": expectation_type or 'unknown',
+        "check_type": expectation_type[7:] if expectation_type.startswith('expect_') else 'custom',
+        "dataset_name": dataset_name,
+        "failed_rows": unexpected_count,
+        "failure_percentage": unexpected_percent,
+        "timestamp": timestamp,
+        "expected_value": cfg.get('kwargs') or {},
+        "actual_value": {
+            "unexpected_count": unexpected_count,
+            "unexpected_percent": unexpected_percent,
+            "unexpected_values": res.get('partial_unexpected_list', [])
+        },
+        "check_implementation": cfg,
+        "dataset_path": dataset_path
+    }
+
+
+def _write_bytes(path: str, payload: bytes) -> None:
+    """
+    Write a serialized payload to a file with unbuffered writes.
+    
+    Args:
+        path (str): Path of the file to (over)write
+        payload (bytes): Data to write
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 class DataQualityValidator:
     """Validator class for running data quality checks."""
     
@@ -36,6 +297,9 @@ class DataQualityValidator:
         self.expectations_dir = expectations_dir
         self.results_dir = results_dir
         
+        # Loaded datasets keyed by file version and column selection (most recently used last)
+        self._dataset_cache: "OrderedDict[tuple, PandasDataset]" = OrderedDict()
+        
         # Ensure results directory exists
         os.makedirs(self.results_dir, exist_ok=True)
     
@@ -54,73 +318,248 @@ class DataQualityValidator:
         if not os.path.exists(suite_path):
             raise FileNotFoundError(f"Expectation suite not found: {suite_path}")
         
-        # Load from YAML
-        with open(suite_path, 'r') as f:
-            suite_config = json.load(f) if suite_path.endswith('.json') else yaml.safe_load(f)
+        # Load from YAML (cached); copy so the suite never shares state with the cache
+        suite_config = _load_suite_config(suite_path, os.path.getmtime(suite_path))
         
         # Create expectation suite
         suite = ExpectationSuite(
             expectation_suite_name=suite_config.get('name', suite_name),
-            expectations=suite_config.get('expectations', []),
-            meta=suite_config.get('meta', {})
+            expectations=copy.deepcopy(suite_config.get('expectations', [])),
+            meta=copy.deepcopy(suite_config.get('meta', {}))
         )
         
         return suite
     
-    def _load_dataset(self, dataset_path: str) -> PandasDataset:
+    def _load_dataset(self, 
+                      dataset_path: Union[str, pd.DataFrame], 
+                      columns: Optional[List[str]] = None) -> PandasDataset:
         """
         Load a dataset from a file.
         
+        Datasets are memoized per file version (path, modification time and
+        size), so validating an unchanged file again skips parsing it. A
+        DataFrame is used as is, without copying or caching it.
+        
         Args:
-            dataset_path (str): Path to the dataset file
+            dataset_path (Union[str, pd.DataFrame]): Path to the dataset file, or an in-memory DataFrame
+            columns (Optional[List[str]]): Columns to load, or None for all columns
             
         Returns:
             PandasDataset: Loaded dataset as a Great Expectations PandasDataset
         """
+        if isinstance(dataset_path, pd.DataFrame):
+            return dataset_path if isinstance(dataset_path, PandasDataset) else ge.from_pandas(dataset_path)
+        
+        # Reuse the dataset loaded for this exact file version and column selection
+        stat = os.stat(dataset_path)
+        cache_key = (
+            os.path.realpath(dataset_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            tuple(columns) if columns is not None else None,
+        )
+        cached = self._dataset_cache.get(cache_key)
+        if cached is not None:
+            self._dataset_cache.move_to_end(cache_key)
+            return cached
+        
         # Determine file type and load accordingly
-        if dataset_path.endswith('.csv'):
-            df = pd.read_csv(dataset_path)
-        elif dataset_path.endswith('.parquet'):
-            df = pd.read_parquet(dataset_path)
-        elif dataset_path.endswith('.json'):
+        if dataset_path.endswith('.json'):
             df = pd.read_json(dataset_path)
+            if columns is not None:
+                wanted = set(columns)
+                pruned = [name for name in df.columns if name in wanted]
+                if pruned:
+                    df = df[pruned]
         else:
-            raise ValueError(f"Unsupported file format: {dataset_path}")
+            # Release Arrow buffers as columns are converted to keep peak memory low
+            table = _read_table(dataset_path, _prune_columns(dataset_path, columns))
+            df = table.to_pandas(split_blocks=True, self_destruct=True)
+            del table
         
         # Convert to Great Expectations dataset
         ge_dataset = ge.from_pandas(df)
         
+        self._dataset_cache[cache_key] = ge_dataset
+        if len(self._dataset_cache) > DATASET_CACHE_SIZE:
+            self._dataset_cache.popitem(last=False)
+        
         return ge_dataset
     
+    def _iter_dataset(self, 
+                      dataset_path: str, 
+                      chunk_size: int,
+                      columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over a dataset in chunks of at most ``chunk_size`` rows.
+        
+        Args:
+            dataset_path (str): Path to the dataset file
+            chunk_size (int): Maximum number of rows per chunk
+            columns (Optional[List[str]]): Columns to load, or None for all columns
+            
+        Yields:
+            pd.DataFrame: Next chunk of the dataset
+        """
+        if dataset_path.endswith('.csv'):
+            yield from pd.read_csv(
+                dataset_path, 
+                chunksize=chunk_size, 
+                usecols=_prune_columns(dataset_path, columns)
+            )
+        elif dataset_path.endswith('.parquet'):
+            parquet_file = pq.ParquetFile(dataset_path)
+            for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=_prune_columns(dataset_path, columns)):
+                yield batch.to_pandas()
+        else:
+            # JSON arrays cannot be read incrementally; validate as one chunk
+            yield pd.DataFrame(self._load_dataset(dataset_path, columns))
+    
+    def _validate_chunked(self, 
+                          dataset_path: str, 
+                          suite: ExpectationSuite,
+                          chunk_size: int,
+                          columns: Optional[List[str]] = None,
+                          parallel: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Validate a dataset chunk by chunk and merge the per-chunk results.
+        
+        Args:
+            dataset_path (str): Path to the dataset file
+            suite (ExpectationSuite): Expectation suite to validate against
+            chunk_size (int): Maximum number of rows per chunk
+            columns (Optional[List[str]]): Columns to load, or None for all columns
+            parallel (bool): Whether to validate the expectations of each chunk concurrently
+            
+        Returns:
+            Optional[Dict[str, Any]]: Merged validation results, or None if the dataset is empty
+        """
+        chunk_results = []
+        for chunk in self._iter_dataset(dataset_path, chunk_size, columns):
+            chunk_results.append(validate_dataframe(chunk, suite, parallel=parallel))
+        
+        if not chunk_results:
+            return None
+        
+        return self._merge_chunk_results(chunk_results)
+    
+    def _merge_chunk_results(self, chunk_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Merge validation results of several chunks into dataset-level results.
+        
+        Counters are summed per expectation, percentages and ``mostly``
+        thresholds are re-evaluated on the totals, and sample unexpected
+        values are capped at PARTIAL_UNEXPECTED_LIMIT.
+        
+        Args:
+            chunk_results (List[Dict[str, Any]]): Validation results of each chunk
+            
+        Returns:
+            Dict[str, Any]: Merged validation results
+        """
+        merged = {}
+        for chunk_result in chunk_results:
+            for result in chunk_result.get('results', []):
+                config = result.get('expectation_config') or {}
+                key = json.dumps(
+                    [config.get('expectation_type'), config.get('kwargs') or {}],
+                    sort_keys=True,
+                    default=str
+                )
+                
+                entry = merged.get(key)
+                if entry is None:
+                    merged[key] = result
+                    continue
+                
+                entry['success'] = bool(entry.get('success')) and bool(result.get('success'))
+                totals = entry.setdefault('result', {})
+                counts = result.get('result') or {}
+                for field in ('element_count', 'missing_count', 'unexpected_count'):
+                    if field in counts:
+                        totals[field] = totals.get(field, 0) + counts[field]
+                
+                if counts.get('partial_unexpected_list'):
+                    partial = totals.setdefault('partial_unexpected_list', [])
+                    partial.extend(counts['partial_unexpected_list'][:PARTIAL_UNEXPECTED_LIMIT - len(partial)])
+        
+        results = list(merged.values())
+        for result in results:
+            totals = result.get('result') or {}
+            if 'unexpected_count' not in totals or 'element_count' not in totals:
+                continue
+            
+            element_count = totals['element_count']
+            nonmissing_count = element_count - totals.get('missing_count', 0)
+            unexpected_ratio = totals['unexpected_count'] / nonmissing_count if nonmissing_count else 0.0
+            totals['unexpected_percent'] = unexpected_ratio * 100
+            if 'missing_count' in totals:
+                totals['missing_percent'] = totals['missing_count'] / element_count * 100 if element_count else None
+            
+            mostly = (result.get('expectation_config') or {}).get('kwargs', {}).get('mostly', 1)
+            result['success'] = (1 - unexpected_ratio) >= mostly
+        
+        evaluated = len(results)
+        successful = sum(1 for result in results if result.get('success'))
+        
+        return {
+            'success': successful == evaluated,
+            'results': results,
+            'statistics': {
+                'evaluated_expectations': evaluated,
+                'successful_expectations': successful,
+                'unsuccessful_expectations': evaluated - successful,
+                'success_percent': successful / evaluated * 100 if evaluated else None,
+            }
+        }
+    
     def validate(self, 
-                dataset_path: str, 
+                dataset_path: Union[str, pd.DataFrame], 
                 suite_name: str,
-                save_results: bool = True) -> Dict[str, Any]:
+                save_results: bool = True,
+                chunk_size: Optional[int] = None,
+                parallel: bool = False) -> Dict[str, Any]:
         """
         Validate a dataset against an expectation suite.
         
         Args:
-            dataset_path (str): Path to the dataset file
+            dataset_path (Union[str, pd.DataFrame]): Path to the dataset file, or an in-memory
+                DataFrame (reported as IN_MEMORY_DATASET_PATH)
             suite_name (str): Name of the expectation suite
             save_results (bool): Whether to save validation results
+            chunk_size (Optional[int]): Validate in chunks of this many rows to bound
+                memory use. Ignored when the suite has expectations that need the
+                whole dataset at once.
+            parallel (bool): Whether to validate independent expectations concurrently
+                on a thread pool, grouped by target column
             
         Returns:
             Dict[str, Any]: Validation results
         """
-        logger.info(f"Validating dataset: {dataset_path} with suite: {suite_name}")
+        in_memory = isinstance(dataset_path, pd.DataFrame)
+        logger.info(f"Validating dataset: {IN_MEMORY_DATASET_PATH if in_memory else dataset_path} with suite: {suite_name}")
         
         try:
-            # Load dataset and expectation suite
-            dataset = self._load_dataset(dataset_path)
+            # Load expectation suite and only read the columns it references
             suite = self._load_expectation_suite(suite_name)
+            columns = _referenced_columns(suite)
             
-            # Validate dataset against expectation suite
-            validation_result = dataset.validate(expectation_suite=suite)
+            validation_result = None
+            if chunk_size and not in_memory:
+                if all(_is_chunkable(e.expectation_type) for e in suite.expectations):
+                    validation_result = self._validate_chunked(dataset_path, suite, chunk_size, columns, parallel)
+                else:
+                    logger.info("Suite has whole-dataset expectations, validating without chunking")
+            
+            if validation_result is None:
+                # Load dataset and validate it against the expectation suite in one pass
+                dataset = self._load_dataset(dataset_path, columns)
+                validation_result = validate_dataframe(dataset, suite, parallel=parallel)
             
             # Process validation results
             results = self._process_validation_results(
                 validation_result, 
-                dataset_path, 
+                IN_MEMORY_DATASET_PATH if in_memory else dataset_path, 
                 suite_name
             )
             
@@ -149,45 +588,31 @@ class DataQualityValidator:
         Returns:
             Dict[str, Any]: Processed validation results
         """
+        # Compute values shared by every check once
+        now_iso = datetime.datetime.now().isoformat()
+        dataset_name = os.path.basename(dataset_path)
+        statistics = validation_result.get('statistics') or {}
+        
         # Extract basic information
         results = {
             "dataset_path": dataset_path,
-            "dataset_name": os.path.basename(dataset_path),
+            "dataset_name": dataset_name,
             "suite_name": suite_name,
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": now_iso,
             "success": validation_result.get('success', False),
             "statistics": {
-                "evaluated_expectations": validation_result.get('statistics', {}).get('evaluated_expectations', 0),
-                "successful_expectations": validation_result.get('statistics', {}).get('successful_expectations', 0),
-                "unsuccessful_expectations": validation_result.get('statistics', {}).get('unsuccessful_expectations', 0),
-                "success_percent": validation_result.get('statistics', {}).get('success_percent', 0),
+                "evaluated_expectations": statistics.get('evaluated_expectations', 0),
+                "successful_expectations": statistics.get('successful_expectations', 0),
+                "unsuccessful_expectations": statistics.get('unsuccessful_expectations', 0),
+                "success_percent": statistics.get('success_percent', 0),
             },
-            "failed_checks": []
+            "failed_checks": [
+                _build_failed_check(result, dataset_name, dataset_path, now_iso)
+                for result in validation_result.get('results', ())
+                if not result.get('success', False)
+            ]
         }
         
-        # Process failed expectations
-        for result in validation_result.get('results', []):
-            if not result.get('success', False):
-                # Extract relevant information for failed check
-                failed_check = {
-                    "check_name": result.get('expectation_config', {}).get('expectation_type', 'unknown'),
-                    "check_type": result.get('expectation_config', {}).get('expectation_type', 'unknown').split('expect_')[1] if 'expect_' in result.get('expectation_config', {}).get('expectation_type', '') else 'custom',
-                    "dataset_name": os.path.basename(dataset_path),
-                    "failed_rows": result.get('result', {}).get('unexpected_count', 0),
-                    "failure_percentage": result.get('result', {}).get('unexpected_percent', 0),
-                    "timestamp": datetime.datetime.now().isoformat(),
-                    "expected_value": result.get('expectation_config', {}).get('kwargs', {}),
-                    "actual_value": {
-                        "unexpected_count": result.get('result', {}).get('unexpected_count', 0),
-                        "unexpected_percent": result.get('result', {}).get('unexpected_percent', 0),
-                        "unexpected_values": result.get('result', {}).get('partial_unexpected_list', [])
-                    },
-                    "check_implementation": json.dumps(result.get('expectation_config', {}), indent=2),
-                    "dataset_path": dataset_path
-                }
-                
-                results['failed_checks'].append(failed_check)
-        
         return results
     
     def _save_results(self, results: Dict[str, Any]) -> str:
@@ -201,39 +626,102 @@ class DataQualityValidator:
             str: Path to the saved results file
         """
         # Create directory for results
-        date_str = datetime.datetime.now().strftime("%Y-%m-%d")
+        now = datetime.datetime.now()
+        date_str = now.strftime("%Y-%m-%d")
         dataset_name = os.path.splitext(results['dataset_name'])[0]
         output_dir = os.path.join(self.results_dir, date_str, dataset_name)
         os.makedirs(output_dir, exist_ok=True)
         
         # Save results to file
-        timestamp = datetime.datetime.now().strftime("%H%M%S")
+        timestamp = now.strftime("%H%M%S")
         output_path = os.path.join(output_dir, f"results_{timestamp}.json")
-        with open(output_path, 'w') as f:
-            json.dump(results, f, indent=2)
+        payload = orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        _write_bytes(output_path, payload)
         
-        # Also save a copy as 'latest.json'
+        # Point 'results.json' at the latest run: hardlink under a temporary
+        # name, then atomically rename over the previous link
         latest_path = os.path.join(output_dir, "results.json")
-        with open(latest_path, 'w') as f:
-            json.dump(results, f, indent=2)
+        tmp_path = f"{latest_path}.{os.getpid()}.tmp"
+        if os.path.lexists(tmp_path):
+            os.unlink(tmp_path)
+        try:
+            os.link(output_path, tmp_path)
+        except OSError:
+            # Filesystem without hardlink support
+            _write_bytes(tmp_path, payload)
+        os.replace(tmp_path, latest_path)
+        
+        # Keep the per-run summary index in sync for the dashboard trends chart
+        self._update_results_index(date_str, dataset_name, results)
         
         logger.info(f"Validation results saved to: {output_path}")
         return output_path
+    
+    def _update_results_index(self, 
+                              date_str: str, 
+                              dataset_name: str, 
+                              results: Dict[str, Any]) -> str:
+        """
+        Record a validation run in the results summary index.
+        
+        The index is a small Parquet file with one row per (date, dataset)
+        so that trend views do not have to parse every results file. The
+        read-modify-replace runs under an exclusive lock on a sidecar lock
+        file, so concurrent validation runs do not drop each other's rows.
+        
+        Args:
+            date_str (str): Date of the validation run (YYYY-MM-DD)
+            dataset_name (str): Name of the validated dataset
+            results (Dict[str, Any]): Validation results
+            
+        Returns:
+            str: Path to the index file
+        """
+        index_path = os.path.join(self.results_dir, "index.parquet")
+        row = pd.DataFrame({
+            "date": [date_str],
+            "dataset": [dataset_name],
+            "success_percent": [float(results['statistics'].get('success_percent') or 0)],
+            "failed_count": [len(results['failed_checks'])],
+        })
+        
+        with open(f"{index_path}.lock", 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            
+            if os.path.exists(index_path):
+                index = pd.read_parquet(index_path)
+                index = index[(index['date'] != date_str) | (index['dataset'] != dataset_name)]
+                index = pd.concat([index, row], ignore_index=True)
+            else:
+                index = row
+            
+            # Write to a per-process temporary file first so readers never see a partial index
+            tmp_path = f"{index_path}.{os.getpid()}.tmp"
+            index.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, index_path)
+        
+        return index_path
 
 
-def run_validation(dataset_path: str, suite_name: str) -> Dict[str, Any]:
+def run_validation(dataset_path: str, 
+                   suite_name: str, 
+                   chunk_size: Optional[int] = None,
+                   parallel: bool = False) -> Dict[str, Any]:
     """
     Run validation on a dataset.
     
     Args:
         dataset_path (str): Path to the dataset file
         suite_name (str): Name of the expectation suite
+        chunk_size (Optional[int]): Validate in chunks of this many rows
+        parallel (bool): Whether to validate independent expectations concurrently
         
     Returns:
         Dict[str, Any]: Validation results
     """
     validator = DataQualityValidator()
-    return validator.validate(dataset_path, suite_name)
+    return validator.validate(dataset_path, suite_name, chunk_size=chunk_size, parallel=parallel)
 
 
 if __name__ == "__main__":
@@ -242,7 +730,9 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run data quality validation")
     parser.add_argument("--dataset", required=True, help="Path to the dataset file")
     parser.add_argument("--suite", required=True, help="Name of the expectation suite")
+    parser.add_argument("--chunk-size", type=int, help="Validate in chunks of this many rows")
+    parser.add_argument("--parallel", action="store_true", help="Validate independent expectations concurrently")
     
     args = parser.parse_args()
     
-    run_validation(args.dataset, args.suite)
+    run_validation(args.dataset, args.suite, args.chunk_size, args.parallel)
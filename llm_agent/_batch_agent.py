@@ -0,0 +1,256 @@
+"""
+Batched LLM pipeline shared by the insight generator and the fix suggestor
+
+Failed checks are grouped into batches so that each LLM request covers
+several checks. Batches answered in an earlier run are served from the
+response cache, near-identical checks reuse answers from the semantic
+cache, and the remaining batches are sent to the LLM concurrently, each
+staged on disk as soon as it completes. An agent plugs in its prompt and
+output type through a BatchAgent.
+"""
+import os
+import asyncio
+import logging
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional
+
+import orjson
+import aiofiles
+from langchain_openai import OpenAI, ChatOpenAI
+from langchain_core.exceptions import OutputParserException
+
+from ._cache import get_cached_response, put_cached_response, request_key
+from ._http import get_async_http_client
+from ._semantic_cache import SemanticCache
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Environment variables (should be set in .env file or environment)
+LLM_MODEL = os.getenv("LLM_MODEL", "gpt-3.5-turbo-0613")
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "your-api-key")
+
+# Maximum number of LLM requests in flight at once
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "20"))
+
+# Number of failed checks described in a single LLM prompt
+LLM_BATCH_SIZE = int(os.getenv("LLM_BATCH_SIZE", "5"))
+
+# Attempts per LLM request before a batch is reported as failed (exponential backoff with jitter)
+LLM_MAX_ATTEMPTS = int(os.getenv("LLM_MAX_ATTEMPTS", "3"))
+
+def create_llm(temperature: float, http_async_client=None):
+    """
+    Initialize and return the LLM.
+
+    Args:
+        temperature (float): Sampling temperature
+        http_async_client (Optional[httpx.AsyncClient]): HTTP client for async requests
+
+    Returns:
+        The chat model, or the completion model if it cannot be created
+    """
+    try:
+        # Try to use ChatOpenAI first
+        return ChatOpenAI(
+            model=LLM_MODEL,
+            temperature=temperature,
+            openai_api_key=OPENAI_API_KEY,
+            http_async_client=http_async_client,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to initialize ChatOpenAI: {e}. Falling back to OpenAI.")
+        # Fallback to OpenAI
+        return OpenAI(
+            model_name=LLM_MODEL,
+            temperature=temperature,
+            openai_api_key=OPENAI_API_KEY,
+            http_async_client=http_async_client,
+        )
+
+class SharedLLM:
+    """LLM client of an agent, shared by its requests and recreated for each event loop."""
+
+    def __init__(self, temperature: float):
+        """
+        Initialize the shared client holder.
+
+        Args:
+            temperature (float): Sampling temperature of the agent
+        """
+        self.temperature = temperature
+        self._llm = None
+        self._http_client = None
+
+    def get(self):
+        """Return the shared LLM client, creating it on first use and for each event loop."""
+        http_client = get_async_http_client()
+        if self._llm is None or http_client is not self._http_client:
+            self._llm = create_llm(self.temperature, http_client)
+            self._http_client = http_client
+        return self._llm
+
+def batched(items: List[Any], size: int) -> List[List[Any]]:
+    """Split a list into consecutive batches of at most ``size`` items."""
+    iterator = iter(items)
+    return list(iter(lambda: list(islice(iterator, size)), []))
+
+class BatchAgent:
+    """Prompt, output type and naming of an agent that answers failed checks in batches."""
+
+    def __init__(self,
+                 name: str,
+                 request_template: str,
+                 describe_check: Callable[[int, Dict[str, Any]], str],
+                 results_field: str,
+                 raw_key: str):
+        """
+        Describe an agent.
+
+        Args:
+            name (str): Output name ('insights', 'fixes'); names the output directory and
+                files and the semantic cache namespace
+            request_template (str): Everything besides the checks that shapes a request;
+                part of its response cache key
+            describe_check (Callable[[int, Dict[str, Any]], str]): Renders the prompt summary
+                of a check from its 1-based position in the batch; runs in a worker thread
+            results_field (str): Field of the parsed LLM output holding one result per check
+            raw_key (str): Key under which the raw LLM output is stored when parsing fails
+        """
+        self.name = name
+        self.request_template = request_template
+        self.describe_check = describe_check
+        self.results_field = results_field
+        self.raw_key = raw_key
+
+    def describe_batch(self, batch: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build the prompt inputs of a batch of failed checks.
+
+        Args:
+            batch (List[Dict[str, Any]]): Failed checks
+
+        Returns:
+            Dict[str, Any]: Inputs of the agent's batch prompt
+        """
+        return {
+            "check_count": len(batch),
+            "checks": "".join(self.describe_check(i, check) for i, check in enumerate(batch, 1))
+        }
+
+    def match(self, batch: List[Dict[str, Any]], parsed: Any) -> Dict[str, Any]:
+        """
+        Assign parsed results to the failed checks of a batch.
+
+        Args:
+            batch (List[Dict[str, Any]]): Failed checks described in the prompt
+            parsed (Any): Parsed LLM output
+
+        Returns:
+            Dict[str, Any]: Results keyed by check name
+        """
+        results = getattr(parsed, self.results_field)
+
+        # Match results to checks by position when the counts agree
+        if len(results) == len(batch):
+            return {
+                check['check_name']: {**result.dict(), "check_name": check['check_name']}
+                for check, result in zip(batch, results)
+            }
+        return {result.check_name: result.dict() for result in results}
+
+async def run_batch_agent(agent: BatchAgent,
+                          chain: Any,
+                          validation_results_path: str,
+                          checks: List[Dict[str, Any]],
+                          answered: Optional[Dict[str, Any]] = None,
+                          concurrency: int = LLM_CONCURRENCY,
+                          batch_size: int = LLM_BATCH_SIZE,
+                          use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Answer failed checks with an agent's chain and save the results next to the validation results.
+
+    Args:
+        agent (BatchAgent): Agent answering the checks
+        chain (Any): Prompt | LLM | parser chain of the agent
+        validation_results_path (str): Path to the validation results JSON file; locates the output
+        checks (List[Dict[str, Any]]): Failed checks still to be answered
+        answered (Optional[Dict[str, Any]]): Results known without the LLM, keyed by check name
+        concurrency (int): Maximum number of concurrent LLM requests
+        batch_size (int): Number of failed checks per LLM request
+        use_cache (bool): Whether to serve and store responses in the LLM response and semantic caches
+
+    Returns:
+        Dict[str, Any]: Results keyed by check name
+    """
+    results = dict(answered or {})
+
+    # Near-identical checks answered in earlier runs reuse their result
+    semantic_cache = SemanticCache.open(f"{agent.name}_{LLM_MODEL}") if use_cache else None
+    if semantic_cache is not None:
+        cached, checks = semantic_cache.partition(checks)
+        results.update(cached)
+
+    batches = batched(checks, max(1, batch_size))
+
+    # Output locations; each batch is staged as a JSONL line as soon as it completes
+    output_dir = os.path.dirname(validation_results_path).replace('validation_results', agent.name)
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, f'{agent.name}.json')
+    staging_path = os.path.join(output_dir, f'{agent.name}.jsonl')
+
+    # Serve batches of checks answered in an earlier run from the response cache
+    cache_keys = [request_key(agent.request_template, batch) for batch in batches]
+    batch_results = [get_cached_response(key, LLM_MODEL) if use_cache else None for key in cache_keys]
+    pending = [index for index, cached in enumerate(batch_results) if cached is None]
+    logger.info(
+        f"Generating {agent.name} for {sum(map(len, batches))} checks in {len(pending)} LLM requests "
+        f"({len(batches) - len(pending)} served from cache)"
+    )
+
+    # Render prompts for cache misses only, in worker threads since describing a check may read the dataset
+    batch_infos = await asyncio.gather(
+        *(asyncio.to_thread(agent.describe_batch, batches[index]) for index in pending)
+    )
+
+    async with aiofiles.open(staging_path, 'wb') as staging:
+        # Query the LLM with bounded concurrency; results arrive as each request completes
+        async for position, parsed in chain.abatch_as_completed(
+            list(batch_infos),
+            config={"max_concurrency": concurrency},
+            return_exceptions=True
+        ):
+            index = pending[position]
+            batch = batches[index]
+            if isinstance(parsed, OutputParserException):
+                logger.error(f"Failed to parse LLM output: {parsed}")
+                # Store raw output if parsing fails
+                batch_result = {check['check_name']: {agent.raw_key: parsed.llm_output} for check in batch}
+            elif isinstance(parsed, Exception):
+                logger.error(f"LLM request failed for checks {[c['check_name'] for c in batch]}: {parsed}")
+                batch_result = {check['check_name']: {"error": str(parsed)} for check in batch}
+            else:
+                batch_result = agent.match(batch, parsed)
+                if use_cache:
+                    put_cached_response(cache_keys[index], LLM_MODEL, batch_result)
+                if semantic_cache is not None:
+                    matched = [check for check in batch if check['check_name'] in batch_result]
+                    semantic_cache.add(matched, [batch_result[check['check_name']] for check in matched])
+
+            # Stage the batch on disk while other requests are still in flight
+            await staging.write(orjson.dumps(batch_result, option=orjson.OPT_APPEND_NEWLINE))
+            batch_results[index] = batch_result
+
+    # Merge the batches in check order and replace the staging file with the final output
+    for batch_result in batch_results:
+        results.update(batch_result)
+
+    async with aiofiles.open(output_path, 'wb') as f:
+        await f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    os.remove(staging_path)
+    if semantic_cache is not None:
+        semantic_cache.save()
+
+    logger.info(f"{agent.name.capitalize()} saved to: {output_path}")
+    return results
@@ -0,0 +1,103 @@
+"""
+Response caching for LLM calls
+
+Requests for the same failed checks are answered from a persistent on-disk
+cache instead of calling the LLM again. Entries are JSON files named by the
+SHA-256 of the model and a request key (see request_key), with an
+in-process LRU layer in front of the disk lookup.
+"""
+import os
+import hashlib
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Directory of the persistent prompt -> response cache; set to an empty string to disable it
+LLM_RESPONSE_CACHE_DIR = os.getenv(
+    "LLM_RESPONSE_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".dq_cache", "llm")
+)
+
+# Fields of a failed check that change on every run without changing what is asked of the LLM
+PER_RUN_FIELDS = ('timestamp', 'dataset_path')
+
+def request_key(template: str, checks: List[Dict[str, Any]]) -> str:
+    """
+    Build the cache key text of an LLM request for a batch of failed checks.
+
+    The key covers the prompt template and the check inputs, leaving out
+    PER_RUN_FIELDS so that the same failure in a later run hits the cache.
+
+    Args:
+        template (str): Prompt text the checks are rendered into
+        checks (List[Dict[str, Any]]): Failed checks of the batch
+
+    Returns:
+        str: Request key
+    """
+    inputs = [{k: v for k, v in check.items() if k not in PER_RUN_FIELDS} for check in checks]
+    return f"{template}\n{orjson.dumps(inputs, default=str, option=orjson.OPT_SORT_KEYS).decode()}"
+
+def _cache_path(key_text: str, model: str, cache_dir: str) -> str:
+    """Return the cache file of a request key for a model."""
+    key = hashlib.sha256(f"{model}\n{key_text}".encode()).hexdigest()
+    return os.path.join(cache_dir, f"{key}.json")
+
+@lru_cache(maxsize=512)
+def _read_cache_file(path: str) -> bytes:
+    """Read a cache entry; misses raise, so only hits are kept in memory."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+def get_cached_response(key_text: str, model: str, cache_dir: Optional[str] = None) -> Optional[Any]:
+    """
+    Look up the cached response of a request.
+
+    Args:
+        key_text (str): Request key (see request_key)
+        model (str): Name of the LLM the prompt is sent to
+        cache_dir (Optional[str]): Cache directory (defaults to LLM_RESPONSE_CACHE_DIR)
+
+    Returns:
+        Optional[Any]: Cached response, or None on a miss
+    """
+    cache_dir = LLM_RESPONSE_CACHE_DIR if cache_dir is None else cache_dir
+    if not cache_dir:
+        return None
+
+    try:
+        return orjson.loads(_read_cache_file(_cache_path(key_text, model, cache_dir)))
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def put_cached_response(key_text: str, model: str, response: Any, cache_dir: Optional[str] = None) -> None:
+    """
+    Store the response of a request in the cache.
+
+    The entry is written under a temporary name and renamed into place, so
+    concurrent readers never see a partial file.
+
+    Args:
+        key_text (str): Request key (see request_key)
+        model (str): Name of the LLM the request was sent to
+        response (Any): JSON-serializable response
+        cache_dir (Optional[str]): Cache directory (defaults to LLM_RESPONSE_CACHE_DIR)
+    """
+    cache_dir = LLM_RESPONSE_CACHE_DIR if cache_dir is None else cache_dir
+    if not cache_dir:
+        return
+
+    path = _cache_path(key_text, model, cache_dir)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(response))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Failed to cache LLM response: {e}")
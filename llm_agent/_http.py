@@ -0,0 +1,70 @@
+"""
+Shared HTTP client for async LLM requests
+
+All async LLM requests made on an event loop go through one pooled HTTP/2
+client, so concurrent batches reuse keep-alive connections instead of
+opening a new TCP/TLS session per request.
+"""
+import os
+import asyncio
+import logging
+import weakref
+from typing import Any, Awaitable, Optional
+
+import httpx
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Connection pool limits of the shared client
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "100"))
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "50"))
+
+# One client per event loop: pooled connections cannot outlive the loop that opened them
+_CLIENTS = weakref.WeakKeyDictionary()
+
+def get_async_http_client() -> Optional[httpx.AsyncClient]:
+    """
+    Return the shared async HTTP client of the running event loop.
+    
+    Returns:
+        Optional[httpx.AsyncClient]: Pooled client, or None outside an event loop
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    
+    client = _CLIENTS.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+        _CLIENTS[loop] = client
+    return client
+
+def run_async(coroutine: Awaitable[Any]) -> Any:
+    """
+    Run a coroutine on a new event loop and close the loop's shared HTTP client afterwards.
+    
+    Args:
+        coroutine (Awaitable[Any]): Coroutine to run
+        
+    Returns:
+        Any: Result of the coroutine
+    """
+    async def main():
+        try:
+            return await coroutine
+        finally:
+            client = _CLIENTS.pop(asyncio.get_running_loop(), None)
+            if client is not None:
+                await client.aclose()
+    
+    return asyncio.run(main())
@@ -0,0 +1,29 @@
+"""
+Streaming access to validation results
+
+The LLM agents only need the failed checks of a validation run. They are
+streamed from the results file one record at a time instead of parsing
+the whole document up front. Results already held in memory (as in the
+pipeline) are used directly.
+"""
+from typing import Any, Dict, Iterator, Union
+
+def iter_failed_checks(validation_results_path: Union[str, Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the failed checks of a validation results file.
+    
+    Args:
+        validation_results_path (Union[str, Dict[str, Any]]): Path to the validation results
+            JSON file, or the validation results themselves
+        
+    Yields:
+        Dict[str, Any]: Failed checks, in file order
+    """
+    if isinstance(validation_results_path, dict):
+        yield from validation_results_path.get('failed_checks', [])
+        return
+    
+    import ijson
+    
+    with open(validation_results_path, 'rb') as f:
+        yield from ijson.items(f, 'failed_checks.item', use_float=True)
@@ -0,0 +1,257 @@
+"""
+Rule-based fix suggestions for common data quality checks
+
+Failures of the most common Great Expectations checks have canonical
+remediations. This module builds those suggestions locally so that the
+fix suggestor only needs the LLM for unusual checks.
+"""
+from typing import Callable, Dict, Any, Optional
+
+
+def _kwargs(check: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the expectation kwargs recorded for a failed check."""
+    expected = check.get('expected_value')
+    return expected if isinstance(expected, dict) else {}
+
+
+def _unexpected_values(check: Dict[str, Any]) -> list:
+    """Return the sample of unexpected values recorded for a failed check."""
+    actual = check.get('actual_value')
+    return (actual.get('unexpected_values') or [])[:5] if isinstance(actual, dict) else []
+
+
+def _not_null(check: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Nulls: quarantine or impute the missing values."""
+    column = _kwargs(check).get('column')
+    if not column:
+        return None
+    return {
+        "fix_approach": "Data Transformation",
+        "rationale": f"{check.get('failed_rows', 0)} rows have no value for '{column}'. Missing values usually "
+                     "come from incomplete source records or failed joins upstream.",
+        "implementation": (
+            f"# Quarantine rows without '{column}' and fill where a safe default exists\n"
+            f"missing = df['{column}'].isna()\n"
+            f"df[missing].to_csv('quarantine/{column}_missing.csv', index=False)\n"
+            f"df = df[~missing]"
+        ),
+        "confidence": "High",
+        "alternative_approaches": [
+            f"Impute '{column}' from a reference source or a default value",
+            "Allow a small share of nulls with the 'mostly' parameter",
+            "Fix the upstream extraction or join that drops the value",
+        ],
+    }
+
+
+def _between(check: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Range violations: flag outliers and review the bounds."""
+    kwargs = _kwargs(check)
+    column = kwargs.get('column')
+    if not column:
+        return None
+    min_value, max_value = kwargs.get('min_value'), kwargs.get('max_value')
+    return {
+        "fix_approach": "Data Transformation + Threshold Review",
+        "rationale": f"Values of '{column}' fall outside [{min_value}, {max_value}] "
+                     f"(e.g. {_unexpected_values(check)}). They are either bad records or the range is too strict.",
+        "implementation": (
+            f"# Flag out-of-range values for review instead of passing them downstream\n"
+            f"out_of_range = ~df['{column}'].between({min_value}, {max_value})\n"
+            f"df.loc[out_of_range, '{column}_flag'] = 'out_of_range'"
+        ),
+        "confidence": "Medium",
+        "alternative_approaches": [
+            "Widen min_value/max_value if the outliers are legitimate",
+            "Clip values to the allowed range",
+            "Use the 'mostly' parameter to tolerate rare outliers",
+        ],
+    }
+
+
+def _of_type(check: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Type mismatches: coerce explicitly at ingestion."""
+    kwargs = _kwargs(check)
+    column = kwargs.get('column')
+    type_ = kwargs.get('type_') or kwargs.get('type_list')
+    if not column or not type_:
+        return None
+    return {
+        "fix_approach": "Schema Change",
+        "rationale": f"'{column}' does not have the expected type {type_}. "
+                     "Mixed or malformed values make the reader infer a different type.",
+        "implementation": (
+            f"# Coerce '{column}' explicitly and inspect the values that fail to convert\n"
+            f"converted = pd.to_numeric(df['{column}'], errors='coerce')  # or pd.to_datetime / astype(str)\n"
+            f"bad_values = df.loc[converted.isna() & df['{column}'].notna(), '{column}']\n"
+            f"df['{column}'] = converted"
+        ),
+        "confidence": "High",
+        "alternative_approaches": [
+            "Declare the column type in the reader (dtype=...) at ingestion",
+            "Fix the producer that writes malformed values",
+            "Relax the expectation to a list of acceptable types",
+        ],
+    }
+
+
+def _unique(check: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Duplicate keys: deduplicate on the key column."""
+    column = _kwargs(check).get('column')
+    if not column:
+        return None
+    return {
+        "fix_approach": "Data Transformation",
+        "rationale": f"'{column}' contains duplicates (e.g. {_unexpected_values(check)}), "
+                     "typically from re-delivered files or non-idempotent loads.",
+        "implementation": (
+            f"# Keep the latest record per '{column}'\n"
+            f"df = df.drop_duplicates(subset=['{column}'], keep='last')"
+        ),
+        "confidence": "High",
+        "alternative_approaches": [
+            "Make the ingestion idempotent (upsert on the key)",
+            "Check whether the key should be composite",
+            "Deduplicate at the source",
+        ],
+    }
+
+
+def _in_set(check: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Unknown categories: normalize variants or extend the set."""
+    kwargs = _kwargs(check)
+    column = kwargs.get('column')
+    if not column:
+        return None
+    return {
+        "fix_approach": "Data Transformation + Threshold Review",
+        "rationale": f"'{column}' contains values outside the allowed set (e.g. {_unexpected_values(check)}). "
+                     "These are usually new categories or spelling variants.",
+        "implementation": (
+            f"# Normalize spelling/case before validation and map known variants\n"
+            f"df['{column}'] = df['{column}'].str.strip().str.title()\n"
+            f"df['{column}'] = df['{column}'].replace({{}})  # add variant -> canonical mappings"
+        ),
+        "confidence": "Medium",
+        "alternative_approaches": [
+            "Add legitimate new categories to value_set",
+            "Route unknown categories to an 'Other' bucket",
+            "Enforce the category list in the source system",
+        ],
+    }
+
+
+def _match_regex(check: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Pattern mismatches: normalize formats."""
+    kwargs = _kwargs(check)
+    column, regex = kwargs.get('column'), kwargs.get('regex')
+    if not column or not regex:
+        return None
+    return {
+        "fix_approach": "Data Transformation",
+        "rationale": f"Values of '{column}' do not match the pattern {regex!r} (e.g. {_unexpected_values(check)}).",
+        "implementation": (
+            f"# Trim whitespace and isolate values that still do not match\n"
+            f"df['{column}'] = df['{column}'].str.strip()\n"
+            f"bad = ~df['{column}'].astype(str).str.fullmatch({regex!r})"
+        ),
+        "confidence": "Medium",
+        "alternative_approaches": [
+            "Broaden the pattern if the new formats are valid",
+            "Normalize formats at ingestion",
+        ],
+    }
+
+
+def _column_exists(check: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Missing column: map renames or update the suite."""
+    column = _kwargs(check).get('column')
+    if not column:
+        return None
+    return {
+        "fix_approach": "Schema Change",
+        "rationale": f"Column '{column}' is missing from the dataset, which points to an upstream schema change or rename.",
+        "implementation": (
+            f"# Map a renamed column back or add it explicitly\n"
+            f"df = df.rename(columns={{'<new_name>': '{column}'}})"
+        ),
+        "confidence": "Medium",
+        "alternative_approaches": [
+            "Update the expectation suite if the column was intentionally removed",
+            "Agree on a schema contract with the data producer",
+        ],
+    }
+
+
+def _ordered_columns(check: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Column list drift: select the expected columns."""
+    column_list = _kwargs(check).get('column_list')
+    if not column_list:
+        return None
+    return {
+        "fix_approach": "Schema Change",
+        "rationale": "The dataset's columns differ from the expected ordered list, "
+                     "so the producer added, removed, renamed or reordered columns.",
+        "implementation": (
+            f"# Select the expected columns in order (fails loudly if any are missing)\n"
+            f"df = df[{list(column_list)!r}]"
+        ),
+        "confidence": "High",
+        "alternative_approaches": [
+            "Use expect_table_columns_to_match_set if order does not matter",
+            "Update the suite to the new schema",
+        ],
+    }
+
+
+def _row_count(check: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Row count out of bounds: investigate partial or duplicate loads."""
+    kwargs = _kwargs(check)
+    return {
+        "fix_approach": "Pipeline Investigation",
+        "rationale": f"The row count is outside [{kwargs.get('min_value')}, {kwargs.get('max_value')}], "
+                     "which indicates a partial or duplicated load.",
+        "implementation": (
+            "# Compare with the previous load before publishing\n"
+            "previous = pd.read_parquet('previous.parquet')\n"
+            "assert abs(len(df) - len(previous)) / max(len(previous), 1) < 0.5"
+        ),
+        "confidence": "Medium",
+        "alternative_approaches": [
+            "Re-run the ingestion for the affected period",
+            "Adjust the bounds if volume has legitimately changed",
+        ],
+    }
+
+
+# Rule-based fix builders keyed by check type (expectation type without the 'expect_' prefix).
+# A builder returns None when the check lacks the details it needs; the LLM handles it then.
+RULE_FIXES: Dict[str, Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]] = {
+    'column_values_to_not_be_null': _not_null,
+    'column_values_to_be_between': _between,
+    'column_values_to_be_of_type': _of_type,
+    'column_values_to_be_in_type_list': _of_type,
+    'column_values_to_be_unique': _unique,
+    'column_values_to_be_in_set': _in_set,
+    'column_values_to_match_regex': _match_regex,
+    'column_to_exist': _column_exists,
+    'table_columns_to_match_ordered_list': _ordered_columns,
+    'table_row_count_to_be_between': _row_count,
+}
+
+
+def rule_based_fix(check: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Build a fix suggestion for a failed check without calling the LLM.
+
+    Args:
+        check (Dict[str, Any]): Failed check from the validation results
+
+    Returns:
+        Optional[Dict[str, Any]]: Fix suggestion fields, or None if no rule applies
+    """
+    builder = RULE_FIXES.get(check.get('check_type'))
+    fix = builder(check) if builder else None
+    if fix is None:
+        return None
+    return {"check_name": check.get('check_name'), **fix}
@@ -0,0 +1,269 @@
+"""
+Semantic cache of per-check LLM responses
+
+Failures of the same check recur across daily runs with slightly different
+unexpected values, so their rendered prompts never hash the same. A stored
+response is only reused for a check on the same dataset, check type and
+column (its scope); within that scope the expectation kwargs are embedded
+with a sentence-transformer model and the nearest previously answered
+check is reused when the cosine similarity reaches SEMANTIC_CACHE_THRESHOLD.
+
+The index is a FAISS inner-product index over normalized embeddings,
+persisted next to the responses it points to. sentence-transformers and
+faiss are optional; without them the cache is disabled.
+"""
+import os
+import logging
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import orjson
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Directory of the persisted semantic cache; set to an empty string to disable it
+SEMANTIC_CACHE_DIR = os.getenv("SEMANTIC_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".dq_cache"))
+
+# Sentence-transformer model used to embed failed checks
+SEMANTIC_CACHE_MODEL = os.getenv("SEMANTIC_CACHE_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+
+# Minimum cosine similarity for a stored response to be reused
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+
+# Loading the encoder is expensive; insights and fixes may ask for it from two threads at once
+_ENCODER_LOCK = threading.Lock()
+
+
+def _split_check(check: Dict[str, Any]) -> Tuple[Tuple[Any, Any, Any], str]:
+    """Return the scope of a failed check and its remaining kwargs rendered canonically."""
+    expected = check.get('expected_value')
+    kwargs = dict(expected) if isinstance(expected, dict) else {"expected_value": expected}
+    column = kwargs.pop('column', None)
+    if column is not None and not isinstance(column, str):
+        column = str(column)
+    rendered_kwargs = orjson.dumps(kwargs, default=str, option=orjson.OPT_SORT_KEYS).decode()
+    return (check.get('dataset_name'), check.get('check_type'), column), rendered_kwargs
+
+
+def check_scope(check: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+    """
+    Return the part of a failed check a reused response must match exactly.
+
+    Args:
+        check (Dict[str, Any]): Failed check from the validation results
+
+    Returns:
+        Tuple[Any, Any, Any]: Dataset name, check type and column
+    """
+    return _split_check(check)[0]
+
+
+def check_key(check: Dict[str, Any]) -> str:
+    """
+    Build the canonical text of a failed check.
+
+    Observed values (failed rows, unexpected values) are left out so that
+    recurring failures of the same check share their key.
+
+    Args:
+        check (Dict[str, Any]): Failed check from the validation results
+
+    Returns:
+        str: Canonical check description
+    """
+    (dataset, check_type, column), rendered_kwargs = _split_check(check)
+    return f"dataset: {dataset} | check: {check_type} | column: {column} | expected: {rendered_kwargs}"
+
+
+def _embedding_text(check: Dict[str, Any]) -> str:
+    """Return the text embedded for similarity lookups: the kwargs outside the check's scope."""
+    return f"expected: {_split_check(check)[1]}"
+
+
+@lru_cache(maxsize=1)
+def _load_encoder(model_name: str):
+    """Load the sentence-transformer model (once per process)."""
+    from sentence_transformers import SentenceTransformer
+
+    logger.info(f"Loading semantic cache encoder: {model_name}")
+    return SentenceTransformer(model_name)
+
+
+def _get_encoder(model_name: str = SEMANTIC_CACHE_MODEL):
+    """Return the shared sentence-transformer model."""
+    with _ENCODER_LOCK:
+        return _load_encoder(model_name)
+
+
+class SemanticCache:
+    """Nearest-neighbour cache of LLM responses for failed checks."""
+
+    def __init__(self, namespace: str, cache_dir: Optional[str] = None, threshold: Optional[float] = None):
+        """
+        Open (or create) the semantic cache of a namespace.
+
+        Args:
+            namespace (str): Cache partition, e.g. the agent and LLM model the responses come from
+            cache_dir (Optional[str]): Cache directory (defaults to SEMANTIC_CACHE_DIR)
+            threshold (Optional[float]): Minimum cosine similarity for a hit (defaults to SEMANTIC_CACHE_THRESHOLD)
+        """
+        import faiss
+
+        cache_dir = SEMANTIC_CACHE_DIR if cache_dir is None else cache_dir
+        self.threshold = SEMANTIC_CACHE_THRESHOLD if threshold is None else threshold
+        self.index_path = os.path.join(cache_dir, f"sem_{namespace}.faiss")
+        self.responses_path = os.path.join(cache_dir, f"sem_{namespace}.json")
+        self._encoder = _get_encoder()
+        self._embeddings = {}
+
+        # Load the persisted index; a missing or inconsistent pair of files starts a fresh cache
+        self.index = None
+        self.entries: List[Dict[str, Any]] = []
+        try:
+            index = faiss.read_index(self.index_path)
+            with open(self.responses_path, 'rb') as f:
+                entries = orjson.loads(f.read())
+            if index.ntotal == len(entries) and all(
+                isinstance(entry, dict) and {'key', 'scope', 'response'} <= entry.keys() for entry in entries
+            ):
+                self.index, self.entries = index, entries
+        except (OSError, RuntimeError, orjson.JSONDecodeError):
+            pass
+        if self.index is None:
+            self.index = faiss.IndexFlatIP(self._encoder.get_sentence_embedding_dimension())
+
+        # Stored positions per scope, and the canonical keys already stored
+        self._scope_ids: Dict[Tuple[Any, Any, Any], List[int]] = {}
+        self._keys: Set[str] = set()
+        for position, entry in enumerate(self.entries):
+            self._scope_ids.setdefault(tuple(entry['scope']), []).append(position)
+            self._keys.add(entry['key'])
+
+    @classmethod
+    def open(cls, namespace: str, cache_dir: Optional[str] = None) -> Optional["SemanticCache"]:
+        """
+        Open the semantic cache of a namespace if it is enabled and its dependencies are installed.
+
+        Args:
+            namespace (str): Cache partition
+            cache_dir (Optional[str]): Cache directory (defaults to SEMANTIC_CACHE_DIR)
+
+        Returns:
+            Optional[SemanticCache]: The cache, or None if it is unavailable
+        """
+        cache_dir = SEMANTIC_CACHE_DIR if cache_dir is None else cache_dir
+        if not cache_dir:
+            return None
+
+        try:
+            return cls(namespace, cache_dir=cache_dir)
+        except ImportError:
+            logger.debug("sentence-transformers or faiss not installed; semantic cache disabled")
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to open semantic cache: {e}; semantic cache disabled")
+            return None
+
+    def _embed(self, checks: List[Dict[str, Any]]):
+        """Return the normalized embeddings of checks, encoding each canonical key once."""
+        import numpy as np
+
+        keys = [_embedding_text(check) for check in checks]
+        missing = list(dict.fromkeys(key for key in keys if key not in self._embeddings))
+        if missing:
+            vectors = self._encoder.encode(missing, normalize_embeddings=True, convert_to_numpy=True)
+            self._embeddings.update(zip(missing, vectors))
+        return np.asarray([self._embeddings[key] for key in keys], dtype=np.float32).reshape(len(keys), -1)
+
+    def partition(self, checks: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Split failed checks into those answered from the cache and those that still need the LLM.
+
+        Args:
+            checks (List[Dict[str, Any]]): Failed checks
+
+        Returns:
+            Tuple[Dict[str, Any], List[Dict[str, Any]]]: Reused responses keyed by check name, remaining checks
+        """
+        answered, remaining = {}, []
+        for check, hit in zip(checks, self.lookup(checks)):
+            if hit is None:
+                remaining.append(check)
+            else:
+                answered[check['check_name']] = {**hit, "check_name": check['check_name']}
+        logger.info(f"Semantic cache answered {len(answered)} of {len(checks)} checks")
+        return answered, remaining
+
+    def lookup(self, checks: List[Dict[str, Any]]) -> List[Optional[Any]]:
+        """
+        Find stored responses for near-identical checks.
+
+        Only responses stored for the same dataset, check type and column are
+        candidates; among them the most similar kwargs win.
+
+        Args:
+            checks (List[Dict[str, Any]]): Failed checks
+
+        Returns:
+            List[Optional[Any]]: Stored response per check, or None where nothing is similar enough
+        """
+        import faiss
+        import numpy as np
+
+        hits: List[Optional[Any]] = [None] * len(checks)
+        scoped = [(i, self._scope_ids.get(check_scope(check))) for i, check in enumerate(checks)]
+        scoped = [(i, ids) for i, ids in scoped if ids]
+        if not scoped:
+            return hits
+
+        vectors = self._embed([checks[i] for i, _ in scoped])
+        for (i, ids), vector in zip(scoped, vectors):
+            params = faiss.SearchParameters(sel=faiss.IDSelectorBatch(np.asarray(ids, dtype=np.int64)))
+            scores, found = self.index.search(vector.reshape(1, -1), 1, params=params)
+            if found[0, 0] >= 0 and scores[0, 0] >= self.threshold:
+                hits[i] = self.entries[found[0, 0]]['response']
+        return hits
+
+    def add(self, checks: List[Dict[str, Any]], responses: List[Any]) -> None:
+        """
+        Store the responses of answered checks.
+
+        Checks whose canonical key is already stored are skipped, so repeated
+        runs do not grow the index.
+
+        Args:
+            checks (List[Dict[str, Any]]): Failed checks
+            responses (List[Any]): JSON-serializable response per check
+        """
+        new = []
+        for check, response in zip(checks, responses):
+            key = check_key(check)
+            if key not in self._keys:
+                self._keys.add(key)
+                new.append((check, key, response))
+        if not new:
+            return
+
+        self.index.add(self._embed([check for check, _, _ in new]))
+        for check, key, response in new:
+            scope = check_scope(check)
+            self._scope_ids.setdefault(scope, []).append(len(self.entries))
+            self.entries.append({"key": key, "scope": list(scope), "response": response})
+
+    def save(self) -> None:
+        """Persist the index and its responses (written under temporary names, then renamed)."""
+        import faiss
+
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            tmp_suffix = f".{os.getpid()}.tmp"
+            faiss.write_index(self.index, self.index_path + tmp_suffix)
+            with open(self.responses_path + tmp_suffix, 'wb') as f:
+                f.write(orjson.dumps(self.entries))
+            os.replace(self.index_path + tmp_suffix, self.index_path)
+            os.replace(self.responses_path + tmp_suffix, self.responses_path)
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Failed to save semantic cache: {e}")
@@ -0,0 +1,139 @@
+"""
+Fused numeric column statistics
+
+Computes min, max, mean, standard deviation and null count of a numeric
+column in a single pass. When Numba is installed the pass is JIT-compiled
+and split into chunks that run in parallel; otherwise NumPy is used.
+"""
+import logging
+import numpy as np
+import pandas as pd
+from typing import Dict, Any
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Number of values reduced per parallel chunk
+CHUNK_SIZE = 65536
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _moments_numpy(values: np.ndarray):
+    """
+    Compute (min, max, mean, M2, null_count, count) with NumPy.
+
+    Args:
+        values (np.ndarray): Contiguous float64 values, NaN marking nulls
+
+    Returns:
+        tuple: Column moments as floats
+    """
+    mask = np.isnan(values)
+    valid = values[~mask]
+    if not valid.size:
+        return np.inf, -np.inf, 0.0, 0.0, float(mask.sum()), 0.0
+    mean = valid.mean()
+    return valid.min(), valid.max(), mean, float(((valid - mean) ** 2).sum()), float(mask.sum()), float(valid.size)
+
+
+if NUMBA_AVAILABLE:
+    # Compiled eagerly (and cached on disk) so the JIT cost is paid at import, not per call.
+    # fastmath is deliberately off: it lets the compiler assume there are no NaNs.
+    @njit("UniTuple(float64, 6)(float64[::1])", parallel=True, cache=True)
+    def _moments_numba(values):
+        n_chunks = (values.size + CHUNK_SIZE - 1) // CHUNK_SIZE
+        counts = np.zeros(n_chunks)
+        means = np.zeros(n_chunks)
+        m2s = np.zeros(n_chunks)
+        mins = np.full(n_chunks, np.inf)
+        maxs = np.full(n_chunks, -np.inf)
+        nulls = np.zeros(n_chunks)
+
+        # Welford's update within each chunk
+        for c in prange(n_chunks):
+            start = c * CHUNK_SIZE
+            stop = min(start + CHUNK_SIZE, values.size)
+            n = 0.0
+            mean = 0.0
+            m2 = 0.0
+            lo = np.inf
+            hi = -np.inf
+            null_count = 0.0
+            for i in range(start, stop):
+                v = values[i]
+                if np.isnan(v):
+                    null_count += 1
+                    continue
+                n += 1
+                delta = v - mean
+                mean += delta / n
+                m2 += delta * (v - mean)
+                if v < lo:
+                    lo = v
+                if v > hi:
+                    hi = v
+            counts[c] = n
+            means[c] = mean
+            m2s[c] = m2
+            mins[c] = lo
+            maxs[c] = hi
+            nulls[c] = null_count
+
+        # Combine the chunks (Chan et al. pairwise update)
+        n = 0.0
+        mean = 0.0
+        m2 = 0.0
+        lo = np.inf
+        hi = -np.inf
+        null_count = 0.0
+        for c in range(n_chunks):
+            null_count += nulls[c]
+            if counts[c] == 0:
+                continue
+            total = n + counts[c]
+            delta = means[c] - mean
+            mean += delta * counts[c] / total
+            m2 += m2s[c] + delta * delta * n * counts[c] / total
+            n = total
+            lo = min(lo, mins[c])
+            hi = max(hi, maxs[c])
+
+        return lo, hi, mean, m2, null_count, n
+
+
+def describe_numeric(series: pd.Series) -> Dict[str, Any]:
+    """
+    Summarize a numeric column for the dataset profile.
+
+    Args:
+        series (pd.Series): Numeric (or boolean) column
+
+    Returns:
+        Dict[str, Any]: min, max, mean, median and std (sample standard deviation)
+    """
+    values = np.ascontiguousarray(series.to_numpy(dtype=np.float64, na_value=np.nan))
+    moments = _moments_numba if NUMBA_AVAILABLE else _moments_numpy
+    lo, hi, mean, m2, null_count, count = moments(values)
+
+    if not count:
+        return {'min': None, 'max': None, 'mean': None, 'median': None, 'std': None}
+
+    # Keep integer bounds as integers in the prompt
+    if pd.api.types.is_integer_dtype(series):
+        lo, hi = int(lo), int(hi)
+    else:
+        lo, hi = float(lo), float(hi)
+
+    return {
+        'min': lo,
+        'max': hi,
+        'mean': float(mean),
+        'median': float(np.nanmedian(values)),
+        'std': float(np.sqrt(m2 / (count - 1))) if count > 1 else None,
+    }
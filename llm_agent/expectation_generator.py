@@ -5,16 +5,24 @@ This module uses LLM to analyze a dataset and automatically generate
 appropriate Great Expectations test suite configurations.
 """
 import os
-import json
+import orjson
+import hashlib
 import yaml
 import logging
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, wraps
+from itertools import islice
+from typing import Dict, List, Any, Optional, Tuple
 
-from langchain.chains import LLMChain
 from langchain.prompts import PromptTemplate
 from langchain_openai import OpenAI, ChatOpenAI
+from pydantic import BaseModel, Field
+
+from ._stats import describe_numeric
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -24,6 +32,45 @@ logger = logging.getLogger(__name__)
 LLM_MODEL = os.getenv("LLM_MODEL", "gpt-3.5-turbo-0613")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "your-api-key")
 
+# Maximum number of rows profiled by analyze_dataset; larger files are sampled
+ANALYZE_SAMPLE_ROWS = int(os.getenv("ANALYZE_SAMPLE_ROWS", "200000"))
+
+# Maximum number of bytes read from the start of a file for the sample
+ANALYZE_SAMPLE_BYTES = 64 * 1024 * 1024
+
+# Token budget for the data statistics embedded in the expectation prompt
+MAX_STATS_TOKENS = int(os.getenv("MAX_STATS_TOKENS", "2500"))
+
+# Minimum number of non-numeric columns before they are profiled on a process pool
+PROFILE_PARALLEL_MIN_COLUMNS = int(os.getenv("PROFILE_PARALLEL_MIN_COLUMNS", "32"))
+
+# Number of top values per categorical column kept in the prompt
+PROMPT_TOP_VALUES = 5
+
+# Directory of generated suites keyed by dataset file version; set to an empty string to disable
+EXPECTATIONS_CACHE_DIR = os.getenv("EXPECTATIONS_CACHE_DIR", ".cache/expectations")
+
+# Directory of dataset analyses keyed by file content; set to an empty string to disable
+ANALYSIS_CACHE_DIR = os.getenv("ANALYSIS_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".dq_cache", "analyze"))
+
+# Read size when hashing dataset files for the analysis cache
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Output schema for structured LLM responses, mirroring the suite YAML files
+class Expectation(BaseModel):
+    """A single Great Expectations expectation."""
+    expectation_type: str = Field(description="Great Expectations expectation type, e.g. expect_column_values_to_not_be_null")
+    kwargs: Dict[str, Any] = Field(description="Keyword arguments of the expectation, e.g. column, min_value, mostly")
+
+
+class ExpectationSuite(BaseModel):
+    """Great Expectations suite configuration."""
+    name: str = Field(description="Suite name: the dataset name without extension, suffixed with _suite")
+    config_version: float = Field(default=1.0, description="Configuration version")
+    expectations: List[Expectation] = Field(description="Expectations of the suite")
+    meta: Dict[str, Any] = Field(default_factory=dict, description="Optional suite metadata")
+
+
 # Prompt template for expectation generation
 EXPECTATION_PROMPT = """
 You are a data quality expert creating Great Expectations test suite configuration.
@@ -39,7 +86,7 @@ Data Types:
 Data Statistics:
 {data_stats}
 
-Based on this information, generate a Great Expectations configuration YAML that includes appropriate tests for:
+Based on this information, generate a Great Expectations expectation suite that includes appropriate tests for:
 1. Column presence and order
 2. Data types
 3. Missing values and nulls
@@ -47,10 +94,15 @@ Based on this information, generate a Great Expectations configuration YAML that
 5. Category sets for categorical variables
 6. Any other appropriate checks
 
-Provide the output in valid YAML format compatible with Great Expectations.
-IMPORTANT: Ensure your response contains ONLY the YAML configuration, no other text.
+Use only expectation types and kwargs supported by Great Expectations.
 """
 
+# Prompt built once
+PROMPT = PromptTemplate(
+    template=EXPECTATION_PROMPT,
+    input_variables=["dataset_name", "row_count", "columns", "data_types", "data_stats"],
+)
+
 def get_llm():
     """Initialize and return the LLM."""
     try:
@@ -69,10 +121,165 @@ def get_llm():
             openai_api_key=OPENAI_API_KEY,
         )
 
+def _count_rows(dataset_path: str) -> int:
+    """
+    Count the data rows of a CSV file without parsing it.
+    
+    Args:
+        dataset_path (str): Path to the CSV file
+        
+    Returns:
+        int: Number of lines after the header (quoted newlines are counted as rows)
+    """
+    lines = 0
+    last = b'\n'
+    with open(dataset_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            lines += chunk.count(b'\n')
+            last = chunk[-1:]
+    if last != b'\n':
+        lines += 1
+    return max(lines - 1, 0)
+
+def _read_csv_sample(dataset_path: str) -> pd.DataFrame:
+    """
+    Read up to ANALYZE_SAMPLE_ROWS rows from the start of a CSV file.
+    
+    Args:
+        dataset_path (str): Path to the CSV file
+        
+    Returns:
+        pd.DataFrame: Leading rows of the dataset
+    """
+    # One large block so type inference sees the whole sample; empty cells are nulls as in pandas
+    reader = pacsv.open_csv(
+        dataset_path,
+        read_options=pacsv.ReadOptions(block_size=ANALYZE_SAMPLE_BYTES),
+        convert_options=pacsv.ConvertOptions(strings_can_be_null=True)
+    )
+    try:
+        batches = [reader.read_next_batch()]
+    except StopIteration:
+        batches = []
+    finally:
+        reader.close()
+    
+    # Buffers are released as columns are converted
+    table = pa.Table.from_batches(batches, schema=reader.schema).slice(0, ANALYZE_SAMPLE_ROWS)
+    return table.to_pandas(date_as_object=False, split_blocks=True, self_destruct=True)
+
+def _content_digest(dataset_path: str) -> str:
+    """
+    Hash the name and contents of a dataset file.
+    
+    The file is streamed through BLAKE2b in HASH_CHUNK_SIZE chunks. The
+    sampling limit is part of the key since it changes the analysis.
+    
+    Args:
+        dataset_path (str): Path to the dataset file
+        
+    Returns:
+        str: Hex digest identifying the analysis of the file
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{os.path.basename(dataset_path)}\n{ANALYZE_SAMPLE_ROWS}\n".encode())
+    with open(dataset_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _cached_by_content(analyze):
+    """
+    Memoize a dataset analysis on disk, keyed by the content of the dataset file.
+    
+    Unlike the suite cache, the key does not depend on the modification time,
+    so a rewritten but unchanged file is not profiled again. Analyses are
+    stored as JSON; on a hit, timestamps and numpy values come back in the
+    form they are rendered in the prompt.
+    """
+    @wraps(analyze)
+    def wrapper(dataset_path: str, use_cache: bool = True) -> Dict[str, Any]:
+        if not use_cache or not ANALYSIS_CACHE_DIR:
+            return analyze(dataset_path)
+        
+        try:
+            cache_path = os.path.join(ANALYSIS_CACHE_DIR, f"{_content_digest(dataset_path)}.json")
+            with open(cache_path, 'rb') as f:
+                dataset_info = orjson.loads(f.read())
+            logger.info(f"Using cached analysis of {dataset_path}: {cache_path}")
+            return dataset_info
+        except (OSError, orjson.JSONDecodeError):
+            pass
+        
+        dataset_info = analyze(dataset_path)
+        
+        # Store the analysis atomically for the next run
+        try:
+            os.makedirs(ANALYSIS_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    dataset_info,
+                    default=str,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                ))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache dataset analysis: {e}")
+        
+        return dataset_info
+    
+    return wrapper
+
+def _profile_column(series: pd.Series) -> Dict[str, Any]:
+    """
+    Profile a non-numeric column.
+    
+    Defined at module level so that wide datasets can profile their columns
+    in worker processes.
+    
+    Args:
+        series (pd.Series): Column to profile
+        
+    Returns:
+        Dict[str, Any]: Column statistics; null counts are only included for
+            parsed dates, where they refer to the parsed values
+    """
+    col_stats = {}
+    
+    # For categorical columns
+    if pd.api.types.is_object_dtype(series):
+        col_stats['unique_count'] = int(series.nunique())
+        col_stats['top_values'] = series.value_counts(sort=False).nlargest(10).to_dict()  # Top 10 values (partial sort)
+    
+    # For datetime columns (try to infer); a date-named column is parsed only once
+    elif pd.api.types.is_datetime64_dtype(series) or 'date' in str(series.name).lower():
+        if pd.api.types.is_datetime64_dtype(series):
+            datetime_col = series
+        else:
+            datetime_col = pd.to_datetime(series, errors='coerce')
+            if not datetime_col.notna().any():
+                return col_stats
+        try:
+            datetime_nulls = datetime_col.isna()
+            col_stats['min_date'] = datetime_col.min()
+            col_stats['max_date'] = datetime_col.max()
+            col_stats['null_count'] = int(datetime_nulls.sum())
+            col_stats['null_percentage'] = round(datetime_nulls.mean() * 100, 2)
+        except:
+            # Fallback if datetime conversion fails
+            col_stats['unique_count'] = series.nunique()
+    
+    return col_stats
+
+@_cached_by_content
 def analyze_dataset(dataset_path: str) -> Dict[str, Any]:
     """
     Analyze a dataset to provide statistical information for the LLM.
     
+    Analyses are cached in ANALYSIS_CACHE_DIR by file content; pass
+    ``use_cache=False`` to profile the file again.
+    
     Args:
         dataset_path (str): Path to the dataset file
         
@@ -82,57 +289,48 @@ def analyze_dataset(dataset_path: str) -> Dict[str, Any]:
     logger.info(f"Analyzing dataset: {dataset_path}")
     
     try:
-        # Load the dataset
-        df = pd.read_csv(dataset_path)
+        # Load the dataset (a sample of it for large files)
+        df = _read_csv_sample(dataset_path)
+        sampled = os.path.getsize(dataset_path) > ANALYZE_SAMPLE_BYTES or len(df) >= ANALYZE_SAMPLE_ROWS
         
-        # Basic info
+        # Basic info; the row count is exact even when statistics come from a sample
         dataset_info = {
             'dataset_name': os.path.basename(dataset_path),
-            'row_count': len(df),
+            'row_count': _count_rows(dataset_path) if sampled else len(df),
             'columns': df.columns.tolist(),
-            'data_types': {}
         }
+        if sampled:
+            dataset_info['sample_rows'] = len(df)
         
         # Data types for each column
-        for col in df.columns:
-            dataset_info['data_types'][col] = str(df[col].dtype)
+        dataset_info['data_types'] = df.dtypes.astype(str).to_dict()
+        
+        # Column-wide statistics, computed once for the whole frame
+        na_mask = df.isna()
+        null_counts = na_mask.sum().to_dict()
+        null_percentages = (na_mask.mean() * 100).round(2).to_dict()
+        del na_mask
         
-        # Statistics for each column
+        numeric_stats = {
+            col: describe_numeric(df[col])
+            for col in df.columns if pd.api.types.is_numeric_dtype(df[col])
+        }
+        
+        # Categorical and date columns are profiled per column; wide datasets use all cores
+        other_cols = [col for col in df.columns if col not in numeric_stats]
+        if len(other_cols) >= PROFILE_PARALLEL_MIN_COLUMNS:
+            with ProcessPoolExecutor() as executor:
+                other_stats = dict(zip(other_cols, executor.map(_profile_column, (df[col] for col in other_cols), chunksize=4)))
+        else:
+            other_stats = {col: _profile_column(df[col]) for col in other_cols}
+        
+        # Statistics for each column, with the column's null counts unless the profile has its own
         dataset_info['data_stats'] = {}
         for col in df.columns:
-            col_stats = {}
-            
-            # For numeric columns
-            if pd.api.types.is_numeric_dtype(df[col]):
-                col_stats['min'] = df[col].min()
-                col_stats['max'] = df[col].max()
-                col_stats['mean'] = df[col].mean()
-                col_stats['median'] = df[col].median()
-                col_stats['std'] = df[col].std()
-                col_stats['null_count'] = df[col].isnull().sum()
-                col_stats['null_percentage'] = round(df[col].isnull().mean() * 100, 2)
-            
-            # For categorical columns
-            elif pd.api.types.is_object_dtype(df[col]):
-                value_counts = df[col].value_counts().head(10).to_dict()  # Top 10 values
-                col_stats['unique_count'] = df[col].nunique()
-                col_stats['top_values'] = value_counts
-                col_stats['null_count'] = df[col].isnull().sum()
-                col_stats['null_percentage'] = round(df[col].isnull().mean() * 100, 2)
-            
-            # For datetime columns (try to infer)
-            elif pd.api.types.is_datetime64_dtype(df[col]) or ('date' in col.lower() and pd.to_datetime(df[col], errors='coerce').notnull().any()):
-                try:
-                    datetime_col = pd.to_datetime(df[col], errors='coerce')
-                    col_stats['min_date'] = datetime_col.min()
-                    col_stats['max_date'] = datetime_col.max()
-                    col_stats['null_count'] = datetime_col.isnull().sum()
-                    col_stats['null_percentage'] = round(datetime_col.isnull().mean() * 100, 2)
-                except:
-                    # Fallback if datetime conversion fails
-                    col_stats['unique_count'] = df[col].nunique()
-                    col_stats['null_count'] = df[col].isnull().sum()
-                    col_stats['null_percentage'] = round(df[col].isnull().mean() * 100, 2)
+            col_stats = dict(numeric_stats[col]) if col in numeric_stats else other_stats[col]
+            if col_stats and 'null_count' not in col_stats:
+                col_stats['null_count'] = int(null_counts[col])
+                col_stats['null_percentage'] = null_percentages[col]
             
             dataset_info['data_stats'][col] = col_stats
         
@@ -142,13 +340,190 @@ def analyze_dataset(dataset_path: str) -> Dict[str, Any]:
         logger.error(f"Failed to analyze dataset: {e}")
         raise
 
-def generate_expectations_config(dataset_path: str, output_path: Optional[str] = None) -> str:
+def _dump_stats(stats: Dict[str, Any]) -> str:
+    """Serialize column statistics for the prompt."""
+    return orjson.dumps(
+        stats,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Return the tokenizer of LLM_MODEL, or None if tiktoken or its BPE files are unavailable."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(LLM_MODEL)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        # BPE files are downloaded on first use; offline, fall back to the character estimate
+        logger.warning(f"Failed to load tiktoken encoding: {e}; estimating token counts")
+        return None
+
+def _count_tokens(text: str) -> int:
+    """Count the prompt tokens of a text (about four characters per token without tiktoken)."""
+    encoding = _get_encoding()
+    return len(encoding.encode(text)) if encoding else len(text) // 4
+
+def _shrink_stats(stats: Dict[str, Any], max_tokens: int = MAX_STATS_TOKENS) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Fit column statistics into the prompt's token budget.
+    
+    Top values are capped to PROMPT_TOP_VALUES per column; if the statistics
+    are still over budget, the least informative columns are dropped first:
+    numeric columns without nulls, then other columns without nulls.
+    
+    Args:
+        stats (Dict[str, Any]): Column statistics from analyze_dataset
+        max_tokens (int): Token budget for the serialized statistics
+        
+    Returns:
+        Tuple[Dict[str, Any], List[str]]: Retained statistics and the omitted column names
+    """
+    stats = {
+        col: {**col_stats, 'top_values': dict(islice(col_stats['top_values'].items(), PROMPT_TOP_VALUES))}
+        if 'top_values' in col_stats else col_stats
+        for col, col_stats in stats.items()
+    }
+    
+    total = _count_tokens(_dump_stats(stats))
+    if total <= max_tokens:
+        return stats, []
+    
+    # Drop columns, least informative first, until the statistics fit
+    candidates = sorted(stats, key=lambda col: (stats[col].get('null_count', 0) > 0, 'mean' not in stats[col]))
+    omitted = []
+    for col in candidates:
+        if total <= max_tokens:
+            break
+        total -= _count_tokens(_dump_stats({col: stats[col]}))
+        omitted.append(col)
+    
+    omitted_set = set(omitted)
+    return {col: col_stats for col, col_stats in stats.items() if col not in omitted_set}, omitted
+
+def _expectations_cache_path(dataset_path: str) -> Optional[str]:
+    """
+    Return the cache location of the suite generated for a dataset file.
+    
+    The key covers the path, modification time and size of the file, so any
+    change to the dataset invalidates the cached suite.
+    
+    Args:
+        dataset_path (str): Path to the dataset file
+        
+    Returns:
+        Optional[str]: Path of the cached YAML, or None if caching is disabled or the file is missing
+    """
+    if not EXPECTATIONS_CACHE_DIR:
+        return None
+    try:
+        stat = os.stat(dataset_path)
+    except OSError:
+        return None
+    key = hashlib.md5(f"{os.path.abspath(dataset_path)}{stat.st_mtime}{stat.st_size}{LLM_MODEL}".encode()).hexdigest()
+    return os.path.join(EXPECTATIONS_CACHE_DIR, f"{key}.yml")
+
+def _read_cached_expectations(cache_path: Optional[str]) -> Optional[str]:
+    """
+    Read a cached suite if it exists and is valid YAML.
+    
+    Args:
+        cache_path (Optional[str]): Path of the cached YAML
+        
+    Returns:
+        Optional[str]: Cached YAML configuration, or None on a miss
+    """
+    if not cache_path or not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, 'r') as f:
+            yaml_config = f.read()
+        if isinstance(yaml.safe_load(yaml_config), dict):
+            return yaml_config
+    except (OSError, yaml.YAMLError) as e:
+        logger.warning(f"Ignoring unreadable cached expectations {cache_path}: {e}")
+    return None
+
+def _write_cached_expectations(cache_path: str, yaml_config: str) -> None:
+    """
+    Atomically store a generated suite in the cache.
+    
+    Args:
+        cache_path (str): Path of the cached YAML
+        yaml_config (str): YAML configuration to store
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(yaml_config)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Failed to cache expectations at {cache_path}: {e}")
+
+def _generate_yaml_config(dataset_path: str, use_cache: bool = True) -> str:
+    """
+    Profile a dataset and ask the LLM for its expectation suite.
+    
+    Args:
+        dataset_path (str): Path to the dataset file
+        use_cache (bool): Whether to reuse a cached analysis of the dataset
+        
+    Returns:
+        str: Generated YAML configuration
+    """
+    # Analyze dataset
+    dataset_info = analyze_dataset(dataset_path, use_cache=use_cache)
+    
+    # Keep the statistics within the prompt's token budget
+    data_stats, omitted_columns = _shrink_stats(dataset_info['data_stats'])
+    if omitted_columns:
+        logger.info(f"Omitting statistics of {len(omitted_columns)} columns from the prompt")
+    
+    # Prepare input for LLM
+    llm_input = {
+        "dataset_name": dataset_info['dataset_name'],
+        "row_count": dataset_info['row_count'],
+        "columns": ", ".join(dataset_info['columns']),
+        "data_types": "\n".join([f"- {col}: {dtype}" for col, dtype in dataset_info['data_types'].items()]),
+        "data_stats": _dump_stats(data_stats)
+    }
+    if omitted_columns:
+        llm_input["data_stats"] += (
+            f"\n(statistics omitted for brevity: {', '.join(omitted_columns)})"
+        )
+    if dataset_info.get('sample_rows'):
+        llm_input["data_stats"] = (
+            f"(approximate: computed on the first {dataset_info['sample_rows']} rows)\n"
+            + llm_input["data_stats"]
+        )
+    
+    # Generate the suite as a schema-validated structured response
+    chain = PROMPT | get_llm().with_structured_output(ExpectationSuite)
+    suite = chain.invoke(llm_input)
+    
+    # Render the YAML locally, keeping the field order of the suite files
+    return yaml.safe_dump(suite.dict(), sort_keys=False)
+
+def generate_expectations_config(dataset_path: str,
+                                 output_path: Optional[str] = None,
+                                 use_cache: bool = True) -> str:
     """
     Generate Great Expectations configuration for a dataset using LLM.
     
+    A suite generated earlier for the same version of the dataset file is
+    reused from EXPECTATIONS_CACHE_DIR without profiling or calling the LLM.
+    
     Args:
         dataset_path (str): Path to the dataset file
         output_path (Optional[str]): Path to save the generated configuration
+        use_cache (bool): Whether to reuse and store suites and dataset analyses in their caches
         
     Returns:
         str: Generated YAML configuration
@@ -156,47 +531,15 @@ def generate_expectations_config(dataset_path: str, output_path: Optional[str] =
     logger.info(f"Generating expectations for dataset: {dataset_path}")
     
     try:
-        # Analyze dataset
-        dataset_info = analyze_dataset(dataset_path)
-        
-        # Prepare input for LLM
-        llm_input = {
-            "dataset_name": dataset_info['dataset_name'],
-            "row_count": dataset_info['row_count'],
-            "columns": ", ".join(dataset_info['columns']),
-            "data_types": "\n".join([f"- {col}: {dtype}" for col, dtype in dataset_info['data_types'].items()]),
-            "data_stats": json.dumps(dataset_info['data_stats'], indent=2, default=str)
-        }
-        
-        # Initialize LLM
-        llm = get_llm()
-        
-        # Create prompt template
-        prompt = PromptTemplate(
-            template=EXPECTATION_PROMPT,
-            input_variables=["dataset_name", "row_count", "columns", "data_types", "data_stats"],
-        )
-        
-        # Create LLMChain
-        chain = LLMChain(llm=llm, prompt=prompt)
-        
-        # Generate expectations configuration
-        yaml_config = chain.run(**llm_input)
-        
-        # Clean up the output to ensure it's valid YAML
-        yaml_config = yaml_config.strip()
-        if yaml_config.startswith("```yaml"):
-            yaml_config = yaml_config[7:]
-        if yaml_config.endswith("```"):
-            yaml_config = yaml_config[:-3]
-        yaml_config = yaml_config.strip()
-        
-        # Validate that the output is valid YAML
-        try:
-            yaml.safe_load(yaml_config)
-        except yaml.YAMLError as e:
-            logger.error(f"Generated YAML is invalid: {e}")
-            raise ValueError(f"Generated YAML is invalid: {e}")
+        # Reuse the suite generated for this exact file version, if any
+        cache_path = _expectations_cache_path(dataset_path) if use_cache else None
+        yaml_config = _read_cached_expectations(cache_path)
+        if yaml_config is not None:
+            logger.info(f"Using cached expectations: {cache_path}")
+        else:
+            yaml_config = _generate_yaml_config(dataset_path, use_cache=use_cache)
+            if cache_path:
+                _write_cached_expectations(cache_path, yaml_config)
         
         # Save to file if output path provided
         if output_path:
@@ -217,6 +560,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate Great Expectations configuration for a dataset")
     parser.add_argument("--dataset", required=True, help="Path to the dataset file")
     parser.add_argument("--output", help="Path to save the generated configuration")
+    parser.add_argument("--no-cache", action="store_true", help="Regenerate the suite even if a cached one exists")
     
     args = parser.parse_args()
     
@@ -225,4 +569,4 @@ if __name__ == "__main__":
         base_name = os.path.splitext(os.path.basename(args.dataset))[0]
         output_path = f"expectations/{base_name}_suite.yml"
     
-    generate_expectations_config(args.dataset, output_path)
+    generate_expectations_config(args.dataset, output_path, use_cache=not args.no_cache)
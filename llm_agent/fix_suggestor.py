@@ -5,23 +5,29 @@ This module uses LangChain and LLMs to suggest fixes for data quality issues,
 including schema changes, validation thresholds, and data transformations.
 """
 import os
-import json
+import orjson
 import logging
 from typing import Dict, List, Any, Optional
 
-from langchain.chains import LLMChain
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
 from langchain.prompts import PromptTemplate
-from langchain_openai import OpenAI, ChatOpenAI
 from langchain.output_parsers import PydanticOutputParser
 from pydantic import BaseModel, Field
 
+from ._batch_agent import (
+    LLM_BATCH_SIZE, LLM_CONCURRENCY, LLM_MAX_ATTEMPTS, BatchAgent, SharedLLM, run_batch_agent
+)
+from ._http import run_async
+from ._results import iter_failed_checks
+from ._rule_fixes import rule_based_fix
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Environment variables (should be set in .env file or environment)
-LLM_MODEL = os.getenv("LLM_MODEL", "gpt-3.5-turbo-0613")
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "your-api-key")
+# Maximum number of problematic rows included in a fix prompt
+PROBLEM_SAMPLE_ROWS = 20
 
 # Output schema for structured fix suggestions
 class FixSuggestion(BaseModel):
@@ -34,11 +40,34 @@ class FixSuggestion(BaseModel):
     alternative_approaches: List[str] = Field(description="Alternative approaches to consider")
 
 
-# Prompt template for fix suggestions
+class FixSuggestions(BaseModel):
+    """Suggested fixes for a batch of data quality issues."""
+    fixes: List[FixSuggestion] = Field(description="One fix suggestion per failed check, in the order given")
+
+
+# Prompt template for fix suggestions on a batch of failed checks
 FIX_PROMPT = """
 You are a data quality expert tasked with suggesting fixes for data quality issues.
 
-Here is a summary of a failed data quality check:
+Here are summaries of {check_count} failed data quality checks:
+{checks}
+
+For each check, suggest a fix that would address the data quality issue.
+Each answer should include:
+1. The approach to fix (schema change, data transformation, threshold adjustment, etc.)
+2. A clear explanation of why this fix is appropriate
+3. Implementation details or code snippet
+4. Your confidence level in this solution
+5. Alternative approaches to consider
+
+Return exactly one fix suggestion per check, in the same order, using the check's name as check_name.
+
+{format_instructions}
+"""
+
+# Summary of a single failed check inside FIX_PROMPT
+CHECK_TEMPLATE = """
+Check {index}:
 Check Name: {check_name}
 Check Type: {check_type}
 Dataset: {dataset_name}
@@ -57,40 +86,79 @@ Sample of problematic data:
 ```
 {sample_data}
 ```
+"""
 
-Based on this information, suggest a fix that would address the data quality issue.
-Your answer should include:
-1. The approach to fix (schema change, data transformation, threshold adjustment, etc.)
-2. A clear explanation of why this fix is appropriate
-3. Implementation details or code snippet
-4. Your confidence level in this solution
-5. Alternative approaches to consider
+# Output parser and fully-partial prompt, built once
+PARSER = PydanticOutputParser(pydantic_object=FixSuggestions)
+FORMAT_INSTRUCTIONS = PARSER.get_format_instructions()
+PROMPT = PromptTemplate(
+    template=FIX_PROMPT,
+    input_variables=["check_count", "checks"],
+    partial_variables={"format_instructions": FORMAT_INSTRUCTIONS},
+)
 
-{format_instructions}
-"""
+# Everything besides the checks that shapes a request; part of its response cache key
+REQUEST_TEMPLATE = FIX_PROMPT + CHECK_TEMPLATE + FORMAT_INSTRUCTIONS
+
+# Shared LLM client, slightly more creative for suggesting fixes
+_LLM = SharedLLM(temperature=0.2)
 
 def get_llm():
-    """Initialize and return the LLM."""
-    try:
-        # Try to use ChatOpenAI first
-        return ChatOpenAI(
-            model=LLM_MODEL,
-            temperature=0.2,  # Slightly more creative for suggesting fixes
-            openai_api_key=OPENAI_API_KEY,
-        )
-    except Exception as e:
-        logger.warning(f"Failed to initialize ChatOpenAI: {e}. Falling back to OpenAI.")
-        # Fallback to OpenAI
-        return OpenAI(
-            model_name=LLM_MODEL,
-            temperature=0.2,
-            openai_api_key=OPENAI_API_KEY,
-        )
+    """Return the shared LLM client, creating it on first use and for each event loop."""
+    return _LLM.get()
+
+def get_chain():
+    """Return the LCEL chain that renders the prompt, queries the shared LLM and parses its output."""
+    llm = get_llm().with_retry(stop_after_attempt=LLM_MAX_ATTEMPTS, wait_exponential_jitter=True)
+    return PROMPT | llm | PARSER
+
+def _problem_filter(check_info: Dict[str, Any]) -> Optional[ds.Expression]:
+    """
+    Build a dataset filter matching the rows that fail a check.
+    
+    Args:
+        check_info (Dict[str, Any]): Information about the failing check
+        
+    Returns:
+        Optional[ds.Expression]: Row filter, or None if the check has no row-level condition
+    """
+    kwargs = check_info.get('expected_value')
+    column = kwargs.get('column') if isinstance(kwargs, dict) else None
+    if not column:
+        return None
+    
+    field = ds.field(column)
+    check_type = check_info.get('check_type')
+    
+    # Rebuild the condition of common checks from their kwargs
+    if check_type == 'column_values_to_not_be_null':
+        return field.is_null()
+    if check_type == 'column_values_to_be_between':
+        conditions = []
+        if kwargs.get('min_value') is not None:
+            conditions.append(field < kwargs['min_value'])
+        if kwargs.get('max_value') is not None:
+            conditions.append(field > kwargs['max_value'])
+        if conditions:
+            return conditions[0] if len(conditions) == 1 else conditions[0] | conditions[1]
+    if check_type == 'column_values_to_be_in_set' and kwargs.get('value_set'):
+        return ~field.isin(list(kwargs['value_set'])) & field.is_valid()
+    
+    # Otherwise match the unexpected values reported by the validator
+    actual = check_info.get('actual_value')
+    unexpected_values = actual.get('unexpected_values') if isinstance(actual, dict) else None
+    unexpected_values = [value for value in unexpected_values or [] if value is not None]
+    if unexpected_values:
+        return field.isin(unexpected_values)
+    return None
 
 def get_sample_problematic_data(dataset_path: str, check_info: Dict[str, Any]) -> str:
     """
     Extract sample rows that failed validation.
     
+    The check's condition is pushed down into the dataset scan, so only the
+    first matching rows are read and converted.
+    
     Args:
         dataset_path (str): Path to the dataset
         check_info (Dict[str, Any]): Information about the failing check
@@ -98,26 +166,93 @@ def get_sample_problematic_data(dataset_path: str, check_info: Dict[str, Any]) -
     Returns:
         str: String representation of sample problematic data
     """
-    # This is a placeholder. In a real implementation, you would:
-    # 1. Load the dataset
-    # 2. Apply filtering based on the check type and conditions
-    # 3. Return a sample of rows that failed the check
-    
-    # For now, just return some mock data
-    return """
-    transaction_id,customer_id,transaction_date,amount,category,status,location
-    1007,C7890,null,null,Electronics,Completed,Chicago
-    1011,C9999,,35.40,Books,Completed,Seattle
-    1012,C8765,2025-07-05,abc,Electronics,Completed,Denver
-    1017,,2025-07-07,75.50,Groceries,Completed,Dallas
+    if not dataset_path or not os.path.exists(dataset_path):
+        return "Not available"
+    
+    row_filter = _problem_filter(check_info)
+    if row_filter is None:
+        return "Not available"
+    
+    try:
+        # Empty CSV cells are nulls, as in the validator, so null checks find their rows
+        file_format = 'parquet' if dataset_path.endswith('.parquet') else ds.CsvFileFormat(
+            convert_options=pacsv.ConvertOptions(strings_can_be_null=True)
+        )
+        scanner = ds.dataset(dataset_path, format=file_format).scanner(filter=row_filter, batch_size=1024)
+        sample = scanner.head(PROBLEM_SAMPLE_ROWS).to_pandas()
+    except Exception as e:
+        logger.warning(f"Could not sample problematic rows from {dataset_path}: {e}")
+        return "Not available"
+    
+    return sample.to_csv(index=False) if len(sample) else "No matching rows found"
+
+def _describe_check(index: int, check: Dict[str, Any]) -> str:
     """
+    Render the prompt summary of a failed check, including sample problematic data.
+    
+    Reading the sample blocks, so the batching pipeline calls this from a
+    worker thread and only for batches missing from the response cache.
+    
+    Args:
+        index (int): Position of the check in its batch (1-based)
+        check (Dict[str, Any]): Failed check from the validation results
+        
+    Returns:
+        str: Check summary for FIX_PROMPT
+    """
+    # Get sample data that failed the check
+    dataset_path = check.get('dataset_path', '')
+    sample_data = get_sample_problematic_data(dataset_path, check)
+    
+    # Render the expectation config as text for the prompt
+    check_implementation = check.get('check_implementation', 'Not available')
+    if not isinstance(check_implementation, str):
+        check_implementation = orjson.dumps(check_implementation, default=str, option=orjson.OPT_INDENT_2).decode()
+    
+    return CHECK_TEMPLATE.format(
+        index=index,
+        check_name=check.get('check_name'),
+        check_type=check.get('check_type'),
+        dataset_name=check.get('dataset_name'),
+        failed_rows=check.get('failed_rows', 0),
+        failure_percentage=check.get('failure_percentage', 0),
+        timestamp=check.get('timestamp'),
+        expected_value=str(check.get('expected_value', 'Not specified')),
+        actual_value=str(check.get('actual_value', 'Not specified')),
+        check_implementation=check_implementation,
+        sample_data=sample_data
+    )
 
-def suggest_fixes(validation_results_path: str) -> Dict[str, Any]:
+# Fix suggestor plugged into the shared batching pipeline
+AGENT = BatchAgent(
+    name="fixes",
+    request_template=REQUEST_TEMPLATE,
+    describe_check=_describe_check,
+    results_field="fixes",
+    raw_key="raw_fix"
+)
+
+async def suggest_fixes_async(validation_results_path: str,
+                              concurrency: int = LLM_CONCURRENCY,
+                              batch_size: int = LLM_BATCH_SIZE,
+                              use_rule_fixes: bool = True,
+                              use_cache: bool = True,
+                              validation_results: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
-    Suggest fixes for data quality issues based on validation results.
+    Suggest fixes for data quality issues, querying the LLM concurrently.
+    
+    Common checks get rule-based fixes without an LLM call; the remaining
+    failed checks are grouped into batches of ``batch_size`` so that each
+    LLM request covers several checks.
     
     Args:
         validation_results_path (str): Path to the validation results JSON file
+        concurrency (int): Maximum number of concurrent LLM requests
+        batch_size (int): Number of failed checks per LLM request
+        use_cache (bool): Whether to serve and store responses in the LLM response and semantic caches
+        use_rule_fixes (bool): Whether to answer common checks with rule-based fixes
+        validation_results (Optional[Dict[str, Any]]): Validation results already in memory; the
+            results file is then not read and its path only locates the output
         
     Returns:
         Dict[str, Any]: Dictionary containing fix suggestions for each failing check
@@ -125,77 +260,61 @@ def suggest_fixes(validation_results_path: str) -> Dict[str, Any]:
     logger.info(f"Generating fix suggestions for validation results at: {validation_results_path}")
     
     try:
-        # Load validation results
-        with open(validation_results_path, 'r') as f:
-            validation_results = json.load(f)
-        
-        # Initialize LLM and output parser
-        llm = get_llm()
-        parser = PydanticOutputParser(pydantic_object=FixSuggestion)
-        
-        # Create prompt template with output parser instructions
-        prompt = PromptTemplate(
-            template=FIX_PROMPT,
-            input_variables=[
-                "check_name", "check_type", "dataset_name", "failed_rows", 
-                "failure_percentage", "timestamp", "expected_value", "actual_value",
-                "check_implementation", "sample_data"
-            ],
-            partial_variables={"format_instructions": parser.get_format_instructions()},
-        )
-        
-        # Create LLMChain
-        chain = LLMChain(llm=llm, prompt=prompt)
+        # Prompt | LLM | parser chain on the shared LLM client
+        chain = get_chain()
         
-        # Generate fix suggestions for each failed check
+        # Stream the failed checks; common ones are answered locally, only the rest need the LLM
         fixes = {}
-        for check in validation_results.get('failed_checks', []):
-            logger.info(f"Generating fix suggestion for check: {check['check_name']}")
-            
-            # Get sample data that failed the check
-            dataset_path = check.get('dataset_path', '')
-            sample_data = get_sample_problematic_data(dataset_path, check)
-            
-            # Extract check information
-            check_info = {
-                "check_name": check.get('check_name'),
-                "check_type": check.get('check_type'),
-                "dataset_name": check.get('dataset_name'),
-                "failed_rows": check.get('failed_rows', 0),
-                "failure_percentage": check.get('failure_percentage', 0),
-                "timestamp": check.get('timestamp'),
-                "expected_value": str(check.get('expected_value', 'Not specified')),
-                "actual_value": str(check.get('actual_value', 'Not specified')),
-                "check_implementation": check.get('check_implementation', 'Not available'),
-                "sample_data": sample_data
-            }
-            
-            # Run LLM chain
-            raw_fix = chain.run(**check_info)
-            
-            try:
-                # Parse the output
-                parsed_fix = parser.parse(raw_fix)
-                fixes[check['check_name']] = parsed_fix.dict()
-            except Exception as e:
-                logger.error(f"Failed to parse LLM output: {e}")
-                # Store raw output if parsing fails
-                fixes[check['check_name']] = {"raw_fix": raw_fix}
+        llm_checks = []
+        for check in iter_failed_checks(validation_results if validation_results is not None else validation_results_path):
+            rule_fix = rule_based_fix(check) if use_rule_fixes else None
+            if rule_fix is None:
+                llm_checks.append(check)
+            else:
+                fixes[check['check_name']] = FixSuggestion(**rule_fix).dict()
         
-        # Save fixes to file
-        output_dir = os.path.dirname(validation_results_path).replace('validation_results', 'fixes')
-        os.makedirs(output_dir, exist_ok=True)
-        
-        output_path = os.path.join(output_dir, 'fixes.json')
-        with open(output_path, 'w') as f:
-            json.dump(fixes, f, indent=2)
-        
-        logger.info(f"Fix suggestions saved to: {output_path}")
-        return fixes
+        # Answer the remaining checks in batches
+        return await run_batch_agent(
+            AGENT,
+            chain,
+            validation_results_path,
+            llm_checks,
+            answered=fixes,
+            concurrency=concurrency,
+            batch_size=batch_size,
+            use_cache=use_cache
+        )
         
     except Exception as e:
         logger.error(f"Failed to generate fix suggestions: {e}")
         raise
+
+def suggest_fixes(validation_results_path: str,
+                  use_cache: bool = True,
+                  max_workers: Optional[int] = None,
+                  batch_size: Optional[int] = None,
+                  validation_results: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Suggest fixes for data quality issues based on validation results.
+    
+    Args:
+        validation_results_path (str): Path to the validation results JSON file
+        use_cache (bool): Whether to serve and store responses in the LLM response and semantic caches
+        max_workers (Optional[int]): Maximum number of concurrent LLM requests (defaults to LLM_CONCURRENCY)
+        batch_size (Optional[int]): Number of failed checks per LLM request (defaults to LLM_BATCH_SIZE)
+        validation_results (Optional[Dict[str, Any]]): Validation results already in memory; the
+            results file is then not read and its path only locates the output
+        
+    Returns:
+        Dict[str, Any]: Dictionary containing fix suggestions for each failing check
+    """
+    return run_async(suggest_fixes_async(
+        validation_results_path,
+        concurrency=max_workers or LLM_CONCURRENCY,
+        batch_size=batch_size or LLM_BATCH_SIZE,
+        use_cache=use_cache,
+        validation_results=validation_results
+    ))
     
 if __name__ == "__main__":
     import argparse
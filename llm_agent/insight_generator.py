@@ -4,26 +4,23 @@ LLM-based insight generator for data quality issues
 This module uses LangChain and LLMs to analyze data quality check results
 and generate human-readable insights about what might be causing issues.
 """
-import os
-import json
 from typing import Dict, List, Any, Optional
 import logging
 
-from langchain.chains import LLMChain
 from langchain.prompts import PromptTemplate
-from langchain_openai import OpenAI, ChatOpenAI
-from langchain.prompts import ChatPromptTemplate
 from langchain.output_parsers import PydanticOutputParser
 from pydantic import BaseModel, Field
 
+from ._batch_agent import (
+    LLM_BATCH_SIZE, LLM_CONCURRENCY, LLM_MAX_ATTEMPTS, BatchAgent, SharedLLM, run_batch_agent
+)
+from ._http import run_async
+from ._results import iter_failed_checks
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Environment variables (should be set in .env file or environment)
-LLM_MODEL = os.getenv("LLM_MODEL", "gpt-3.5-turbo-0613")
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "your-api-key")
-
 # Output schema for structured LLM responses
 class DataQualityInsight(BaseModel):
     """Insight about a data quality issue."""
@@ -35,11 +32,33 @@ class DataQualityInsight(BaseModel):
     recommended_actions: List[str] = Field(description="Suggested actions to investigate or fix")
 
 
-# Prompt template for data quality insights
+class DataQualityInsights(BaseModel):
+    """Insights for a batch of data quality issues."""
+    insights: List[DataQualityInsight] = Field(description="One insight per failed check, in the order given")
+
+
+# Prompt template for data quality insights on a batch of failed checks
 INSIGHT_PROMPT = """
 You are a data quality expert analyzing validation results.
 
-Here is a summary of a failed data quality check:
+Here are summaries of {check_count} failed data quality checks:
+{checks}
+
+For each check:
+1. Explain the issue in a way that a business user would understand
+2. List possible causes of this data quality problem
+3. Rate the impact level (Low/Medium/High/Critical)
+4. Describe how this issue might impact business decisions
+5. Recommend specific actions to investigate or fix this issue
+
+Return exactly one insight per check, in the same order, using the check's name as check_name.
+
+{format_instructions}
+"""
+
+# Summary of a single failed check inside INSIGHT_PROMPT
+CHECK_TEMPLATE = """
+Check {index}:
 Check Name: {check_name}
 Check Type: {check_type}
 Dataset: {dataset_name}
@@ -48,41 +67,82 @@ Failure Percentage: {failure_percentage}%
 Failure Timestamp: {timestamp}
 Expected Value/Condition: {expected_value}
 Actual Value/Finding: {actual_value}
+"""
 
-Based on this information:
-1. Explain the issue in a way that a business user would understand
-2. List possible causes of this data quality problem
-3. Rate the impact level (Low/Medium/High/Critical)
-4. Describe how this issue might impact business decisions
-5. Recommend specific actions to investigate or fix this issue
+# Output parser and fully-partial prompt, built once
+PARSER = PydanticOutputParser(pydantic_object=DataQualityInsights)
+FORMAT_INSTRUCTIONS = PARSER.get_format_instructions()
+PROMPT = PromptTemplate(
+    template=INSIGHT_PROMPT,
+    input_variables=["check_count", "checks"],
+    partial_variables={"format_instructions": FORMAT_INSTRUCTIONS},
+)
 
-{format_instructions}
-"""
+# Everything besides the checks that shapes a request; part of its response cache key
+REQUEST_TEMPLATE = INSIGHT_PROMPT + CHECK_TEMPLATE + FORMAT_INSTRUCTIONS
+
+# Shared LLM client, deterministic for consistent insights
+_LLM = SharedLLM(temperature=0)
 
 def get_llm():
-    """Initialize and return the LLM."""
-    try:
-        # Try to use ChatOpenAI first
-        return ChatOpenAI(
-            model=LLM_MODEL,
-            temperature=0,
-            openai_api_key=OPENAI_API_KEY,
-        )
-    except Exception as e:
-        logger.warning(f"Failed to initialize ChatOpenAI: {e}. Falling back to OpenAI.")
-        # Fallback to OpenAI
-        return OpenAI(
-            model_name=LLM_MODEL,
-            temperature=0,
-            openai_api_key=OPENAI_API_KEY,
-        )
+    """Return the shared LLM client, creating it on first use and for each event loop."""
+    return _LLM.get()
 
-def generate_llm_insights(validation_results_path: str) -> Dict[str, Any]:
+def get_chain():
+    """Return the LCEL chain that renders the prompt, queries the shared LLM and parses its output."""
+    llm = get_llm().with_retry(stop_after_attempt=LLM_MAX_ATTEMPTS, wait_exponential_jitter=True)
+    return PROMPT | llm | PARSER
+
+def _describe_check(index: int, check: Dict[str, Any]) -> str:
     """
-    Generate LLM insights for data quality validation results.
+    Render the prompt summary of a failed check.
+    
+    Args:
+        index (int): Position of the check in its batch (1-based)
+        check (Dict[str, Any]): Failed check from the validation results
+        
+    Returns:
+        str: Check summary for INSIGHT_PROMPT
+    """
+    return CHECK_TEMPLATE.format(
+        index=index,
+        check_name=check.get('check_name'),
+        check_type=check.get('check_type'),
+        dataset_name=check.get('dataset_name'),
+        failed_rows=check.get('failed_rows', 0),
+        failure_percentage=check.get('failure_percentage', 0),
+        timestamp=check.get('timestamp'),
+        expected_value=str(check.get('expected_value', 'Not specified')),
+        actual_value=str(check.get('actual_value', 'Not specified'))
+    )
+
+# Insight generator plugged into the shared batching pipeline
+AGENT = BatchAgent(
+    name="insights",
+    request_template=REQUEST_TEMPLATE,
+    describe_check=_describe_check,
+    results_field="insights",
+    raw_key="raw_insight"
+)
+
+async def generate_llm_insights_async(validation_results_path: str,
+                                      concurrency: int = LLM_CONCURRENCY,
+                                      batch_size: int = LLM_BATCH_SIZE,
+                                      use_cache: bool = True,
+                                      validation_results: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Generate LLM insights for data quality validation results, querying the LLM concurrently.
+    
+    Failed checks are grouped into batches of ``batch_size`` so that each
+    LLM request covers several checks.
     
     Args:
         validation_results_path (str): Path to the validation results JSON file
+        concurrency (int): Maximum number of concurrent LLM requests
+        batch_size (int): Number of failed checks per LLM request
+        use_cache (bool): Whether to serve and store responses in the LLM response and semantic caches
+        validation_results (Optional[Dict[str, Any]]): Validation results already in memory; the
+            results file is then not read and its path only locates the output
         
     Returns:
         Dict[str, Any]: Dictionary containing insights for each failing check
@@ -90,68 +150,51 @@ def generate_llm_insights(validation_results_path: str) -> Dict[str, Any]:
     logger.info(f"Generating insights for validation results at: {validation_results_path}")
     
     try:
-        # Load validation results
-        with open(validation_results_path, 'r') as f:
-            validation_results = json.load(f)
+        # Prompt | LLM | parser chain on the shared LLM client
+        chain = get_chain()
         
-        # Initialize LLM and output parser
-        llm = get_llm()
-        parser = PydanticOutputParser(pydantic_object=DataQualityInsight)
-        
-        # Create prompt template with output parser instructions
-        prompt = PromptTemplate(
-            template=INSIGHT_PROMPT,
-            input_variables=["check_name", "check_type", "dataset_name", "failed_rows", 
-                            "failure_percentage", "timestamp", "expected_value", "actual_value"],
-            partial_variables={"format_instructions": parser.get_format_instructions()},
+        # Stream the failed checks and answer them in batches
+        checks = list(iter_failed_checks(validation_results if validation_results is not None else validation_results_path))
+        return await run_batch_agent(
+            AGENT,
+            chain,
+            validation_results_path,
+            checks,
+            concurrency=concurrency,
+            batch_size=batch_size,
+            use_cache=use_cache
         )
         
-        # Create LLMChain
-        chain = LLMChain(llm=llm, prompt=prompt)
-        
-        # Generate insights for each failed check
-        insights = {}
-        for check in validation_results.get('failed_checks', []):
-            logger.info(f"Generating insight for check: {check['check_name']}")
-            
-            # Extract check information
-            check_info = {
-                "check_name": check.get('check_name'),
-                "check_type": check.get('check_type'),
-                "dataset_name": check.get('dataset_name'),
-                "failed_rows": check.get('failed_rows', 0),
-                "failure_percentage": check.get('failure_percentage', 0),
-                "timestamp": check.get('timestamp'),
-                "expected_value": str(check.get('expected_value', 'Not specified')),
-                "actual_value": str(check.get('actual_value', 'Not specified'))
-            }
-            
-            # Run LLM chain
-            raw_insight = chain.run(**check_info)
-            
-            try:
-                # Parse the output
-                parsed_insight = parser.parse(raw_insight)
-                insights[check['check_name']] = parsed_insight.dict()
-            except Exception as e:
-                logger.error(f"Failed to parse LLM output: {e}")
-                # Store raw output if parsing fails
-                insights[check['check_name']] = {"raw_insight": raw_insight}
-        
-        # Save insights to file
-        output_dir = os.path.dirname(validation_results_path).replace('validation_results', 'insights')
-        os.makedirs(output_dir, exist_ok=True)
-        
-        output_path = os.path.join(output_dir, 'insights.json')
-        with open(output_path, 'w') as f:
-            json.dump(insights, f, indent=2)
-        
-        logger.info(f"Insights saved to: {output_path}")
-        return insights
-        
     except Exception as e:
         logger.error(f"Failed to generate insights: {e}")
         raise
+
+def generate_llm_insights(validation_results_path: str,
+                          use_cache: bool = True,
+                          max_workers: Optional[int] = None,
+                          batch_size: Optional[int] = None,
+                          validation_results: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Generate LLM insights for data quality validation results.
+    
+    Args:
+        validation_results_path (str): Path to the validation results JSON file
+        use_cache (bool): Whether to serve and store responses in the LLM response and semantic caches
+        max_workers (Optional[int]): Maximum number of concurrent LLM requests (defaults to LLM_CONCURRENCY)
+        batch_size (Optional[int]): Number of failed checks per LLM request (defaults to LLM_BATCH_SIZE)
+        validation_results (Optional[Dict[str, Any]]): Validation results already in memory; the
+            results file is then not read and its path only locates the output
+        
+    Returns:
+        Dict[str, Any]: Dictionary containing insights for each failing check
+    """
+    return run_async(generate_llm_insights_async(
+        validation_results_path,
+        concurrency=max_workers or LLM_CONCURRENCY,
+        batch_size=batch_size or LLM_BATCH_SIZE,
+        use_cache=use_cache,
+        validation_results=validation_results
+    ))
     
 if __name__ == "__main__":
     import argparse
@@ -9,22 +9,50 @@ import os
 import sys
 import argparse
 import logging
-from datetime import datetime
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('app.log')
-    ]
-)
+import logging.handlers
+from datetime import date
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
 logger = logging.getLogger(__name__)
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Number of log records buffered in memory before app.log is written
+LOG_BUFFER_CAPACITY = 512
+
+def configure_logging():
+    """Configure console and file logging (only once a command actually runs)."""
+    # app.log is written in batches (immediately on errors) and rotated at 10 MiB
+    file_handler = logging.handlers.RotatingFileHandler(
+        'app.log', maxBytes=10 * 1024 * 1024, backupCount=3, delay=True
+    )
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+    )
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format=LOG_FORMAT,
+        handlers=[
+            logging.StreamHandler(),
+            buffered_handler
+        ]
+    )
+
 # Add the project directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+@lru_cache(maxsize=1)
+def _date_dir(day: date) -> str:
+    """Format a day as a data directory name (YYYY-MM-DD)."""
+    return day.strftime("%Y-%m-%d")
+
+def _today_dir() -> str:
+    """Return today's data directory name, formatted once per day."""
+    return _date_dir(date.today())
+
 def run_ingestion(args):
     """Run data ingestion."""
     from app.data_ingestion.ingest import ingest
@@ -33,7 +61,7 @@ def run_ingestion(args):
     
     target = args.target
     if not target:
-        date_dir = datetime.now().strftime("%Y-%m-%d")
+        date_dir = _today_dir()
         target = f"data/raw/{date_dir}/"
         os.makedirs(target, exist_ok=True)
     
@@ -48,7 +76,12 @@ def run_validation(args):
     
     logger.info(f"Running validation on dataset: {args.dataset} with suite: {args.suite}")
     
-    result = run_validation(args.dataset, args.suite)
+    result = run_validation(
+        args.dataset,
+        args.suite,
+        getattr(args, 'chunk_size', None),
+        parallel=getattr(args, 'parallel', False)
+    )
     
     if result['success']:
         logger.info("Validation passed! All checks successful.")
@@ -63,7 +96,13 @@ def run_insights(args):
     
     logger.info(f"Generating insights for validation results: {args.results}")
     
-    insights = generate_llm_insights(args.results)
+    insights = generate_llm_insights(
+        args.results,
+        use_cache=not getattr(args, 'no_cache', False),
+        max_workers=getattr(args, 'workers', None),
+        batch_size=getattr(args, 'batch_size', None),
+        validation_results=getattr(args, 'validation_results', None)
+    )
     
     logger.info(f"Generated insights for {len(insights)} failed checks.")
     return insights
@@ -74,7 +113,13 @@ def run_fixes(args):
     
     logger.info(f"Generating fix suggestions for validation results: {args.results}")
     
-    fixes = suggest_fixes(args.results)
+    fixes = suggest_fixes(
+        args.results,
+        use_cache=not getattr(args, 'no_cache', False),
+        max_workers=getattr(args, 'workers', None),
+        batch_size=getattr(args, 'batch_size', None),
+        validation_results=getattr(args, 'validation_results', None)
+    )
     
     logger.info(f"Generated fix suggestions for {len(fixes)} failed checks.")
     return fixes
@@ -112,17 +157,65 @@ def generate_test_suite(args):
 
 def run_dashboard(args):
     """Start the Streamlit dashboard."""
-    import streamlit.cli
+    from streamlit.web import bootstrap
     
     logger.info("Starting Streamlit dashboard")
     
-    sys.argv = ["streamlit", "run", "app/dashboard.py"]
-    if args.port:
-        sys.argv.extend(["--server.port", str(args.port)])
-    
-    streamlit.cli.main()
+    # Start the server in-process instead of going through the Streamlit CLI
+    flag_options = {"server_port": args.port} if args.port else {}
+    bootstrap.load_config_options(flag_options=flag_options)
+    bootstrap.run("app/dashboard.py", False, [], flag_options)
     return True
 
+def run_pipeline(args):
+    """Run the full pipeline: ingestion, validation, LLM insights and fixes, alerts."""
+    logger.info("Running full pipeline")
+    
+    # Ingest data
+    target = f"data/raw/{_today_dir()}/data.csv"
+    ingest_args = argparse.Namespace(
+        source=args.source,
+        target=target,
+        config=args.config
+    )
+    dataset_path = run_ingestion(ingest_args)
+    
+    # Validate data
+    validate_args = argparse.Namespace(
+        dataset=dataset_path,
+        suite=args.suite
+    )
+    validation_results = run_validation(validate_args)
+    results_path = os.path.dirname(dataset_path).replace('raw', 'validation_results')
+    results_path = os.path.join(results_path, 'results.json')
+    
+    # Generate insights and fix suggestions concurrently (independent LLM calls) from the
+    # in-memory results; results.json is only used to place their outputs
+    insights_args = argparse.Namespace(
+        results=results_path,
+        validation_results=validation_results,
+        no_cache=args.no_cache
+    )
+    fixes_args = argparse.Namespace(
+        results=results_path,
+        validation_results=validation_results,
+        no_cache=args.no_cache
+    )
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        insights_future = executor.submit(run_insights, insights_args)
+        fixes_future = executor.submit(run_fixes, fixes_args)
+        insights, fixes = insights_future.result(), fixes_future.result()
+    
+    # Send alerts with the results, insights and fixes already in memory
+    from app.alert_manager import AlertManager, send_alerts_from_dicts
+    
+    if send_alerts_from_dicts(validation_results, insights, fixes, AlertManager(args.config)):
+        logger.info("Alerts sent successfully.")
+    else:
+        logger.warning("Failed to send alerts.")
+    
+    logger.info("Pipeline completed successfully")
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="AI-powered data quality monitor")
@@ -133,19 +226,31 @@ def main():
     ingest_parser.add_argument("--source", required=True, help="Source specification (file path, 'api', 'database')")
     ingest_parser.add_argument("--target", help="Target path or name")
     ingest_parser.add_argument("--config", help="Path to configuration file")
+    ingest_parser.set_defaults(func=run_ingestion)
     
     # Validation command
     validate_parser = subparsers.add_parser("validate", help="Validate data quality")
     validate_parser.add_argument("--dataset", required=True, help="Path to the dataset file")
     validate_parser.add_argument("--suite", required=True, help="Name of the expectation suite")
+    validate_parser.add_argument("--chunk-size", type=int, help="Validate in chunks of this many rows")
+    validate_parser.add_argument("--parallel", action="store_true", help="Validate independent expectations concurrently")
+    validate_parser.set_defaults(func=run_validation)
     
     # Insights command
     insights_parser = subparsers.add_parser("insights", help="Generate LLM insights")
     insights_parser.add_argument("--results", required=True, help="Path to validation results JSON")
+    insights_parser.add_argument("--no-cache", action="store_true", help="Query the LLM even for previously answered prompts")
+    insights_parser.add_argument("--workers", type=int, help="Maximum number of concurrent LLM requests")
+    insights_parser.add_argument("--batch-size", type=int, help="Number of failed checks per LLM request")
+    insights_parser.set_defaults(func=run_insights)
     
     # Fixes command
     fixes_parser = subparsers.add_parser("fixes", help="Generate LLM fix suggestions")
     fixes_parser.add_argument("--results", required=True, help="Path to validation results JSON")
+    fixes_parser.add_argument("--no-cache", action="store_true", help="Query the LLM even for previously answered prompts")
+    fixes_parser.add_argument("--workers", type=int, help="Maximum number of concurrent LLM requests")
+    fixes_parser.add_argument("--batch-size", type=int, help="Number of failed checks per LLM request")
+    fixes_parser.set_defaults(func=run_fixes)
     
     # Alerts command
     alerts_parser = subparsers.add_parser("alerts", help="Send alerts")
@@ -153,82 +258,35 @@ def main():
     alerts_parser.add_argument("--insights", help="Path to LLM insights JSON")
     alerts_parser.add_argument("--fixes", help="Path to LLM fix suggestions JSON")
     alerts_parser.add_argument("--config", help="Path to configuration file")
+    alerts_parser.set_defaults(func=run_alerts)
     
     # Generate test suite command
     generate_parser = subparsers.add_parser("generate", help="Generate test suite")
     generate_parser.add_argument("--dataset", required=True, help="Path to the dataset file")
     generate_parser.add_argument("--output", help="Path to save the generated configuration")
+    generate_parser.set_defaults(func=generate_test_suite)
     
     # Dashboard command
     dashboard_parser = subparsers.add_parser("dashboard", help="Start the Streamlit dashboard")
     dashboard_parser.add_argument("--port", type=int, default=8501, help="Port for the dashboard")
+    dashboard_parser.set_defaults(func=run_dashboard)
     
     # Pipeline command (runs all steps)
     pipeline_parser = subparsers.add_parser("pipeline", help="Run the full pipeline")
     pipeline_parser.add_argument("--source", required=True, help="Source specification (file path, 'api', 'database')")
     pipeline_parser.add_argument("--suite", required=True, help="Name of the expectation suite")
     pipeline_parser.add_argument("--config", help="Path to configuration file")
+    pipeline_parser.add_argument("--no-cache", action="store_true", help="Query the LLM even for previously answered prompts")
+    pipeline_parser.set_defaults(func=run_pipeline)
     
     args = parser.parse_args()
     
-    if args.command == "ingest":
-        run_ingestion(args)
-    elif args.command == "validate":
-        run_validation(args)
-    elif args.command == "insights":
-        run_insights(args)
-    elif args.command == "fixes":
-        run_fixes(args)
-    elif args.command == "alerts":
-        run_alerts(args)
-    elif args.command == "generate":
-        generate_test_suite(args)
-    elif args.command == "dashboard":
-        run_dashboard(args)
-    elif args.command == "pipeline":
-        # Run full pipeline
-        logger.info("Running full pipeline")
-        
-        # Ingest data
-        target = f"data/raw/{datetime.now().strftime('%Y-%m-%d')}/data.csv"
-        ingest_args = argparse.Namespace(
-            source=args.source,
-            target=target,
-            config=args.config
-        )
-        dataset_path = run_ingestion(ingest_args)
-        
-        # Validate data
-        validate_args = argparse.Namespace(
-            dataset=dataset_path,
-            suite=args.suite
-        )
-        validation_results = run_validation(validate_args)
-        results_path = os.path.dirname(dataset_path).replace('raw', 'validation_results')
-        results_path = os.path.join(results_path, 'results.json')
-        
-        # Generate insights
-        insights_args = argparse.Namespace(
-            results=results_path
-        )
-        insights = run_insights(insights_args)
-        
-        # Generate fix suggestions
-        fixes_args = argparse.Namespace(
-            results=results_path
-        )
-        fixes = run_fixes(fixes_args)
-        
-        # Send alerts
-        alerts_args = argparse.Namespace(
-            results=results_path,
-            insights=None,
-            fixes=None,
-            config=args.config
-        )
-        run_alerts(alerts_args)
-        
-        logger.info("Pipeline completed successfully")
+    # Configure logging before any command module is imported
+    if args.command is not None:
+        configure_logging()
+    
+    if hasattr(args, "func"):
+        args.func(args)
     else:
         parser.print_help()
 
@@ -0,0 +1,168 @@
+"""
+Tests for alert manager
+"""
+import os
+import sys
+import orjson
+import httpx
+import pytest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Import the modules to test
+import app.alert_manager as alert_manager
+from app.alert_manager import AlertManager, TokenBucket, _load_config_cached, format_alert_message
+
+# Test configuration
+TEST_CONFIG = {
+    'alerts': {
+        'email': {'enabled': False},
+        'slack': {'enabled': True, 'webhook_url': 'https://hooks.example.com/slack', 'channel': '#data-quality'},
+        'webhook': {'enabled': False}
+    }
+}
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Create a test configuration file."""
+    _load_config_cached.cache_clear()
+    file_path = tmp_path / 'config.json'
+    with open(file_path, 'wb') as f:
+        f.write(orjson.dumps(TEST_CONFIG, option=orjson.OPT_INDENT_2))
+    yield str(file_path)
+    _load_config_cached.cache_clear()
+
+def test_config_is_cached_across_instances(config_file):
+    """Test that the configuration file is parsed once for repeated instances."""
+    first = AlertManager(config_file)
+    second = AlertManager(config_file)
+    assert first.config is second.config
+    assert first.slack_config['channel'] == '#data-quality'
+    assert _load_config_cached.cache_info().hits == 1
+
+def test_config_reloaded_when_file_changes(config_file):
+    """Test that a modified configuration file is reloaded."""
+    AlertManager(config_file)
+    updated = dict(TEST_CONFIG, alerts={'slack': {'enabled': False}})
+    with open(config_file, 'wb') as f:
+        f.write(orjson.dumps(updated, option=orjson.OPT_INDENT_2))
+    mtime = os.path.getmtime(config_file) + 1
+    os.utime(config_file, (mtime, mtime))
+    
+    manager = AlertManager(config_file)
+    assert manager.slack_config == {'enabled': False}
+
+def test_cached_config_is_read_only(config_file):
+    """Test that the cached configuration cannot be mutated."""
+    manager = AlertManager(config_file)
+    with pytest.raises(TypeError):
+        manager.config['alerts'] = {}
+
+def test_token_bucket_throttles_and_refills():
+    """Test that the token bucket limits bursts and refills over time."""
+    bucket = TokenBucket(capacity=2, refill_rate=1.0)
+    now = bucket.last
+    assert bucket.try_acquire(now) is True
+    assert bucket.try_acquire(now) is True
+    assert bucket.try_acquire(now) is False
+    assert bucket.dropped == 1
+    assert bucket.try_acquire(now + 1.0) is True
+
+def test_format_alert_message():
+    """Test formatting an alert message with insights, fixes and missing fields."""
+    validation_results = {
+        'dataset_name': 'data.csv',
+        'timestamp': '2025-07-10T12:34:56',
+        'success': False,
+        'statistics': {'evaluated_expectations': 3, 'success_percent': 66.67},
+        'failed_checks': [
+            {'check_name': 'expect_column_values_to_be_between', 'failed_rows': 2, 'failure_percentage': 40.0}
+        ]
+    }
+    insights = {'expect_column_values_to_be_between': {'issue_description': 'Out of range amounts', 'impact_level': 'Medium'}}
+    fixes = {'expect_column_values_to_be_between': {'fix_approach': 'Threshold Adjustment'}}
+    
+    message = format_alert_message(validation_results, insights, fixes)
+    assert "*Data Quality Alert: data.csv*" in message
+    assert "❌ FAILED" in message
+    assert "- Passed checks: 0" in message
+    assert "1. expect_column_values_to_be_between" in message
+    assert "- Failed rows: 2 (40.0%)" in message
+    assert "- *Impact:* Medium - Unknown" in message
+    assert "- *Rationale:* No rationale available" in message
+
+def _mock_http_client(monkeypatch, status_codes):
+    """Replace the shared HTTP client with one returning the given status codes."""
+    calls = []
+    responses = iter(status_codes)
+    
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(next(responses))
+    
+    monkeypatch.setattr(alert_manager, '_HTTP', httpx.Client(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(alert_manager, '_RETRY_BACKOFF', 0)
+    return calls
+
+def test_webhook_retries_server_errors(monkeypatch):
+    """Test that transient 5xx responses are retried."""
+    calls = _mock_http_client(monkeypatch, [503, 200])
+    response = alert_manager._post_json('https://hooks.example.com', {'text': 'alert'})
+    assert response.status_code == 200
+    assert len(calls) == 2
+
+def test_webhook_does_not_retry_client_errors(monkeypatch):
+    """Test that 4xx responses fail without retrying."""
+    calls = _mock_http_client(monkeypatch, [400, 200])
+    with pytest.raises(httpx.HTTPStatusError):
+        alert_manager._post_json('https://hooks.example.com', {'text': 'alert'})
+    assert len(calls) == 1
+
+def test_send_alerts_inside_running_loop_returns_false(tmp_path):
+    """Test that the synchronous entry point fails cleanly when called from an event loop."""
+    import asyncio
+    
+    async def caller():
+        return alert_manager.send_alerts(str(tmp_path / 'results.json'))
+    
+    assert asyncio.run(caller()) is False
+
+def test_async_alert_delegates_to_sync_path(config_file, monkeypatch):
+    """Test that async channel methods send through the same implementation as the sync ones."""
+    import asyncio
+    
+    calls = _mock_http_client(monkeypatch, [200])
+    manager = AlertManager(config_file)
+    
+    assert asyncio.run(manager.send_slack_alert_async('alert')) is True
+    assert len(calls) == 1
+    assert orjson.loads(calls[0].content) == {'text': 'alert', 'channel': '#data-quality'}
+
+def test_smtp_reconnects_after_dropped_connection(config_file, monkeypatch):
+    """Test that a connection failing its liveness check is closed and replaced."""
+    import smtplib
+    from unittest.mock import MagicMock
+    
+    stale, fresh = MagicMock(), MagicMock()
+    stale.noop.side_effect = ConnectionResetError("connection reset")
+    monkeypatch.setattr(smtplib, 'SMTP', MagicMock(return_value=fresh))
+    
+    manager = AlertManager(config_file)
+    manager._smtp = stale
+    with manager._smtp_lock:
+        assert manager._get_smtp() is fresh
+    stale.close.assert_called_once()
+    assert manager in alert_manager._SMTP_MANAGERS
+
+def test_send_alerts_from_dicts_inside_running_loop_returns_false(config_file):
+    """Test that the in-memory entry point fails cleanly, without leaking its coroutine, inside an event loop."""
+    import asyncio
+    import warnings
+    
+    async def caller():
+        return alert_manager.send_alerts_from_dicts({'success': False}, None, None, AlertManager(config_file))
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        assert asyncio.run(caller()) is False
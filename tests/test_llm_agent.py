@@ -3,18 +3,14 @@ Tests for LLM agent components
 """
 import os
 import sys
-import json
+import orjson
+import yaml
 import pytest
 from unittest.mock import patch, MagicMock
 
 # Add the project root to the path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-# Import the modules to test
-from llm_agent.insight_generator import generate_llm_insights, DataQualityInsight
-from llm_agent.fix_suggestor import suggest_fixes, FixSuggestion
-from llm_agent.expectation_generator import generate_expectations_config, analyze_dataset
-
 # Sample validation result for testing
 SAMPLE_VALIDATION_RESULT = {
     "dataset_path": "/path/to/data.csv",
@@ -54,7 +50,7 @@ SAMPLE_VALIDATION_RESULT = {
 
 # Sample LLM response for insight
 SAMPLE_INSIGHT_RESPONSE = """
-{
+{"insights": [{
   "check_name": "expect_column_values_to_be_between",
   "issue_description": "The transaction amount field contains values outside the expected range of 0 to 1000.",
   "possible_causes": [
@@ -69,12 +65,12 @@ SAMPLE_INSIGHT_RESPONSE = """
     "Implement input validation in the source system",
     "Consider adjusting the allowed range if these values are legitimate"
   ]
-}
+}]}
 """
 
 # Sample LLM response for fix
 SAMPLE_FIX_RESPONSE = """
-{
+{"fixes": [{
   "check_name": "expect_column_values_to_be_between",
   "fix_approach": "Data Transformation + Threshold Adjustment",
   "rationale": "The current data contains both a negative value (-10.25) which might be a refund and a high value (1200.0) which could be a legitimate large purchase. Both scenarios should be handled appropriately.",
@@ -85,24 +81,53 @@ SAMPLE_FIX_RESPONSE = """
     "Add a pre-processing step to flag outlier transactions for review",
     "Implement conditional validation based on transaction category"
   ]
-}
+}]}
 """
 
+@pytest.fixture(autouse=True, scope="session")
+def mock_llm():
+    """Answer the insight and fix agents' LLM calls with the sample responses for the whole session."""
+    from langchain_core.runnables import RunnableLambda
+    
+    prompts = []
+    
+    def dispatch(prompt):
+        text = prompt.to_string()
+        prompts.append(text)
+        return SAMPLE_FIX_RESPONSE if "suggesting fixes" in text else SAMPLE_INSIGHT_RESPONSE
+    
+    llm = RunnableLambda(dispatch)
+    with patch('llm_agent.insight_generator.get_llm', return_value=llm), \
+            patch('llm_agent.fix_suggestor.get_llm', return_value=llm):
+        yield prompts
+
+@pytest.fixture
+def llm_prompts(mock_llm):
+    """Prompts sent to the mocked LLM during the current test."""
+    mock_llm.clear()
+    return mock_llm
+
+@pytest.fixture(autouse=True)
+def llm_response_cache(tmp_path, monkeypatch):
+    """Keep the LLM response cache of each test in its temporary directory and disable the semantic cache."""
+    cache_dir = tmp_path / "llm_cache"
+    monkeypatch.setattr('llm_agent._cache.LLM_RESPONSE_CACHE_DIR', str(cache_dir))
+    monkeypatch.setattr('llm_agent._semantic_cache.SEMANTIC_CACHE_DIR', "")
+    return cache_dir
+
 @pytest.fixture
 def sample_validation_results_file(tmp_path):
     """Create a sample validation results file."""
     results_dir = tmp_path / "validation_results" / "2025-07-10" / "data"
     results_dir.mkdir(parents=True)
     file_path = results_dir / "results.json"
-    with open(file_path, 'w') as f:
-        json.dump(SAMPLE_VALIDATION_RESULT, f)
+    with open(file_path, 'wb') as f:
+        f.write(orjson.dumps(SAMPLE_VALIDATION_RESULT, option=orjson.OPT_INDENT_2))
     return str(file_path)
 
-@patch('langchain.chains.LLMChain.run')
-def test_generate_llm_insights(mock_llm_run, sample_validation_results_file, tmp_path):
+def test_generate_llm_insights(sample_validation_results_file, tmp_path):
     """Test generating LLM insights."""
-    # Mock the LLM response
-    mock_llm_run.return_value = SAMPLE_INSIGHT_RESPONSE
+    from llm_agent.insight_generator import generate_llm_insights
     
     # Create output directory
     insights_dir = tmp_path / "insights" / "2025-07-10" / "data"
@@ -123,11 +148,10 @@ def test_generate_llm_insights(mock_llm_run, sample_validation_results_file, tmp
     assert len(check_insight["possible_causes"]) == 3
     assert check_insight["impact_level"] == "Medium"
 
-@patch('langchain.chains.LLMChain.run')
-def test_suggest_fixes(mock_llm_run, sample_validation_results_file, tmp_path):
+@patch('llm_agent.fix_suggestor.rule_based_fix', return_value=None)
+def test_suggest_fixes(mock_rule_fix, sample_validation_results_file, tmp_path):
     """Test suggesting fixes."""
-    # Mock the LLM response
-    mock_llm_run.return_value = SAMPLE_FIX_RESPONSE
+    from llm_agent.fix_suggestor import suggest_fixes
     
     # Create output directory
     fixes_dir = tmp_path / "fixes" / "2025-07-10" / "data"
@@ -149,10 +173,162 @@ def test_suggest_fixes(mock_llm_run, sample_validation_results_file, tmp_path):
     assert len(check_fix["alternative_approaches"]) == 3
     assert check_fix["confidence"] == "High"
 
-@patch('langchain.chains.LLMChain.run')
+def test_generate_llm_insights_uses_response_cache(llm_prompts, sample_validation_results_file, tmp_path):
+    """Test that a repeated run is served from the response cache."""
+    from llm_agent.insight_generator import generate_llm_insights
+    
+    with patch('os.path.dirname') as mock_dirname:
+        mock_dirname.return_value = str(tmp_path / "insights" / "2025-07-10" / "data")
+        first = generate_llm_insights(sample_validation_results_file)
+        second = generate_llm_insights(sample_validation_results_file)
+        generate_llm_insights(sample_validation_results_file, use_cache=False)
+    
+    assert second == first
+    assert len(llm_prompts) == 2
+
+def test_response_cache_ignores_run_timestamp(llm_prompts, tmp_path):
+    """Test that the same failures in a later run are served from the response cache."""
+    from llm_agent.insight_generator import generate_llm_insights
+    
+    later_run = {
+        **SAMPLE_VALIDATION_RESULT,
+        "timestamp": "2025-07-11T12:34:56",
+        "failed_checks": [
+            {**check, "timestamp": "2025-07-11T12:34:56"}
+            for check in SAMPLE_VALIDATION_RESULT["failed_checks"]
+        ]
+    }
+    results_path = tmp_path / "validation_results" / "2025-07-10" / "data" / "results.json"
+    first = generate_llm_insights(str(results_path), validation_results=SAMPLE_VALIDATION_RESULT)
+    second = generate_llm_insights(str(results_path), validation_results=later_run)
+    
+    assert second == first
+    assert len(llm_prompts) == 1
+
+@patch('llm_agent.fix_suggestor.rule_based_fix', return_value=None)
+def test_suggest_fixes_samples_data_only_for_cache_misses(mock_rule_fix, llm_prompts, tmp_path):
+    """Test that problematic rows are only sampled for checks that need an LLM request."""
+    from llm_agent.fix_suggestor import suggest_fixes
+    
+    results_path = tmp_path / "validation_results" / "2025-07-10" / "data" / "results.json"
+    with patch('llm_agent.fix_suggestor.get_sample_problematic_data', return_value="amount\n1200.0\n") as mock_sample:
+        first = suggest_fixes(str(results_path), validation_results=SAMPLE_VALIDATION_RESULT)
+        second = suggest_fixes(str(results_path), validation_results=SAMPLE_VALIDATION_RESULT)
+    
+    assert second == first
+    assert len(llm_prompts) == 1
+    assert mock_sample.call_count == 1
+
+def test_generate_llm_insights_from_in_memory_results(tmp_path):
+    """Test that in-memory results are used without reading the results file."""
+    from llm_agent.insight_generator import generate_llm_insights
+    
+    results_path = tmp_path / "validation_results" / "2025-07-10" / "data" / "results.json"
+    insights = generate_llm_insights(str(results_path), validation_results=SAMPLE_VALIDATION_RESULT)
+    
+    assert not results_path.exists()
+    assert "expect_column_values_to_be_between" in insights
+    assert (tmp_path / "insights" / "2025-07-10" / "data" / "insights.json").exists()
+
+def test_suggest_fixes_uses_rule_fixes(llm_prompts, sample_validation_results_file, tmp_path):
+    """Test that common checks get rule-based fixes without calling the LLM."""
+    from llm_agent.fix_suggestor import suggest_fixes
+    
+    with patch('os.path.dirname') as mock_dirname:
+        mock_dirname.return_value = str(tmp_path / "validation_results" / "2025-07-10" / "data")
+        fixes = suggest_fixes(sample_validation_results_file)
+    
+    assert llm_prompts == []
+    check_fix = fixes["expect_column_values_to_be_between"]
+    assert check_fix["check_name"] == "expect_column_values_to_be_between"
+    assert "amount" in check_fix["implementation"]
+    assert check_fix["alternative_approaches"]
+
+def test_semantic_cache_key_ignores_observed_values():
+    """Test that recurring failures of a check share their semantic cache key."""
+    from llm_agent._semantic_cache import check_key
+    
+    check = SAMPLE_VALIDATION_RESULT["failed_checks"][0]
+    recurrence = {**check, "failed_rows": 7, "actual_value": {"unexpected_values": [5000.0]}}
+    other_column = {**check, "expected_value": {**check["expected_value"], "column": "price"}}
+    other_dataset = {**check, "dataset_name": "orders.csv"}
+    
+    assert check_key(recurrence) == check_key(check)
+    assert check_key(other_column) != check_key(check)
+    assert check_key(other_dataset) != check_key(check)
+    assert "amount" in check_key(check)
+
+def test_semantic_cache_reuses_responses_only_within_scope(tmp_path):
+    """Test that a similar check on another column never reuses a stored response, and stores are deduplicated."""
+    pytest.importorskip('faiss')
+    import numpy as np
+    from llm_agent._semantic_cache import SemanticCache
+    
+    class IdenticalEncoder:
+        """Encoder that makes every text a perfect match."""
+        def get_sentence_embedding_dimension(self):
+            return 4
+        
+        def encode(self, texts, **kwargs):
+            return np.ones((len(texts), 4), dtype=np.float32) / 2
+    
+    check = SAMPLE_VALIDATION_RESULT["failed_checks"][0]
+    other_column = {**check, "expected_value": {**check["expected_value"], "column": "price"}}
+    recurrence = {**check, "check_name": "amount_range_again", "failed_rows": 7}
+    
+    with patch('llm_agent._semantic_cache._get_encoder', return_value=IdenticalEncoder()):
+        cache = SemanticCache("insights_test", cache_dir=str(tmp_path))
+        cache.add([check], [{"issue_description": "amount out of range"}])
+        cache.add([check], [{"issue_description": "amount out of range"}])
+        
+        assert cache.index.ntotal == 1
+        assert cache.lookup([other_column, recurrence]) == [None, {"issue_description": "amount out of range"}]
+        
+        cache.save()
+        reopened = SemanticCache("insights_test", cache_dir=str(tmp_path))
+        assert reopened.lookup([recurrence]) == [{"issue_description": "amount out of range"}]
+
+def test_semantic_cache_open_failure_disables_cache(tmp_path):
+    """Test that a semantic cache that fails to load is disabled instead of failing the run."""
+    from llm_agent._semantic_cache import SemanticCache
+    
+    with patch('llm_agent._semantic_cache.SemanticCache.__init__', side_effect=OSError("model download failed")):
+        assert SemanticCache.open("insights_test", cache_dir=str(tmp_path)) is None
+
+def test_get_sample_problematic_data(tmp_path):
+    """Test that only rows failing the check are sampled."""
+    from llm_agent.fix_suggestor import get_sample_problematic_data
+    
+    dataset_path = tmp_path / "data.csv"
+    dataset_path.write_text("id,amount\n1,10.5\n2,1200.0\n3,-10.25\n4,999.0\n")
+    
+    sample = get_sample_problematic_data(str(dataset_path), SAMPLE_VALIDATION_RESULT["failed_checks"][0])
+    
+    assert sample.splitlines() == ["id,amount", "2,1200.0", "3,-10.25"]
+    assert get_sample_problematic_data(str(tmp_path / "missing.csv"), {}) == "Not available"
+
+def test_get_sample_problematic_data_finds_null_strings(tmp_path):
+    """Test that empty cells of a string column match a not-null check."""
+    from llm_agent.fix_suggestor import get_sample_problematic_data
+    
+    dataset_path = tmp_path / "data.csv"
+    dataset_path.write_text("id,customer_id\n1,C5432\n2,\n3,C7890\n")
+    check = {
+        "check_type": "column_values_to_not_be_null",
+        "expected_value": {"column": "customer_id"}
+    }
+    
+    sample = get_sample_problematic_data(str(dataset_path), check)
+    
+    assert sample.splitlines() == ["id,customer_id", "2,"]
+
+@patch('llm_agent.expectation_generator.get_llm')
 @patch('llm_agent.expectation_generator.analyze_dataset')
 def test_generate_expectations_config(mock_analyze, mock_llm_run, tmp_path):
     """Test generating expectations configuration."""
+    from langchain_core.runnables import RunnableLambda
+    from llm_agent.expectation_generator import generate_expectations_config, ExpectationSuite
+    
     # Mock dataset analysis
     mock_analyze.return_value = {
         'dataset_name': 'test_data.csv',
@@ -183,27 +359,22 @@ def test_generate_expectations_config(mock_analyze, mock_llm_run, tmp_path):
         }
     }
     
-    # Mock LLM response
-    mock_llm_run.return_value = """
-name: test_data_suite
-config_version: 1.0
-expectations:
-  - expectation_type: expect_table_columns_to_match_ordered_list
-    kwargs:
-      column_list:
-        - transaction_id
-        - customer_id
-        - transaction_date
-        - amount
-        - category
-        - status
-        - location
-  - expectation_type: expect_column_values_to_be_between
-    kwargs:
-      column: amount
-      min_value: 0
-      max_value: 1000
-"""
+    # Mock structured LLM response
+    suite = ExpectationSuite(
+        name="test_data_suite",
+        expectations=[
+            {
+                "expectation_type": "expect_table_columns_to_match_ordered_list",
+                "kwargs": {"column_list": ['transaction_id', 'customer_id', 'transaction_date', 'amount',
+                                           'category', 'status', 'location']}
+            },
+            {
+                "expectation_type": "expect_column_values_to_be_between",
+                "kwargs": {"column": "amount", "min_value": 0, "max_value": 1000}
+            }
+        ]
+    )
+    mock_llm_run.return_value.with_structured_output.return_value = RunnableLambda(lambda prompt: suite)
     
     # Create output path
     output_path = tmp_path / "expectations" / "test_data_suite.yml"
@@ -216,3 +387,119 @@ expectations:
     assert "expect_table_columns_to_match_ordered_list" in config
     assert "expect_column_values_to_be_between" in config
     assert "amount" in config
+    assert yaml.safe_load(config)['name'] == "test_data_suite"
+    assert output_path.read_text() == config
+
+@patch('llm_agent.expectation_generator._generate_yaml_config')
+def test_generate_expectations_config_uses_cache(mock_generate, tmp_path, monkeypatch):
+    """Test that a suite is generated once per dataset file version."""
+    from llm_agent.expectation_generator import generate_expectations_config
+    
+    monkeypatch.setattr('llm_agent.expectation_generator.EXPECTATIONS_CACHE_DIR', str(tmp_path / "cache"))
+    mock_generate.return_value = "name: data_suite\nexpectations: []\n"
+    
+    dataset_path = tmp_path / "data.csv"
+    dataset_path.write_text("id,amount\n1,10.5\n")
+    
+    first = generate_expectations_config(str(dataset_path))
+    second = generate_expectations_config(str(dataset_path))
+    
+    assert first == second
+    mock_generate.assert_called_once()
+    
+    # A changed file is profiled again
+    dataset_path.write_text("id,amount\n1,10.5\n2,20.0\n")
+    generate_expectations_config(str(dataset_path))
+    assert mock_generate.call_count == 2
+
+def test_analyze_dataset_is_cached_by_content(tmp_path, monkeypatch):
+    """Test that a dataset is profiled once per file content."""
+    from llm_agent import expectation_generator
+    
+    monkeypatch.setattr('llm_agent.expectation_generator.ANALYSIS_CACHE_DIR', str(tmp_path / "analysis"))
+    dataset_path = tmp_path / "data.csv"
+    dataset_path.write_text("id,amount\n1,10.5\n2,20.0\n")
+    
+    with patch.object(expectation_generator, '_read_csv_sample',
+                      wraps=expectation_generator._read_csv_sample) as mock_read:
+        first = expectation_generator.analyze_dataset(str(dataset_path))
+        
+        # Rewriting the same content keeps the cached analysis
+        dataset_path.write_text("id,amount\n1,10.5\n2,20.0\n")
+        second = expectation_generator.analyze_dataset(str(dataset_path))
+        assert mock_read.call_count == 1
+        assert second['row_count'] == first['row_count'] == 2
+        assert second['data_stats']['amount']['max'] == first['data_stats']['amount']['max']
+        
+        # Changed content or use_cache=False profiles the file again
+        dataset_path.write_text("id,amount\n1,10.5\n")
+        assert expectation_generator.analyze_dataset(str(dataset_path))['row_count'] == 1
+        expectation_generator.analyze_dataset(str(dataset_path), use_cache=False)
+        assert mock_read.call_count == 3
+
+def test_analyze_dataset_profiles_wide_datasets_in_processes(tmp_path, monkeypatch):
+    """Test that profiling columns on a process pool gives the same analysis."""
+    from llm_agent.expectation_generator import analyze_dataset
+    
+    dataset_path = tmp_path / "data.csv"
+    dataset_path.write_text(
+        "id,category,status,created_date\n"
+        "1,Books,Completed,2025-07-01\n"
+        "2,Books,Pending,2025-07-02\n"
+        "3,Dining,Completed,\n"
+    )
+    
+    serial = analyze_dataset(str(dataset_path), use_cache=False)
+    monkeypatch.setattr('llm_agent.expectation_generator.PROFILE_PARALLEL_MIN_COLUMNS', 1)
+    parallel = analyze_dataset(str(dataset_path), use_cache=False)
+    
+    assert parallel['data_stats'] == serial['data_stats']
+    assert parallel['data_stats']['category']['top_values'] == {'Books': 2, 'Dining': 1}
+
+def test_count_tokens_falls_back_when_encoding_cannot_load():
+    """Test that token counting falls back to the estimate when the BPE file cannot be downloaded."""
+    import sys
+    from unittest.mock import MagicMock
+    from llm_agent import expectation_generator
+    
+    tiktoken = MagicMock()
+    tiktoken.encoding_for_model.side_effect = ConnectionError("offline")
+    expectation_generator._get_encoding.cache_clear()
+    try:
+        with patch.dict(sys.modules, {'tiktoken': tiktoken}):
+            assert expectation_generator._count_tokens("x" * 40) == 10
+    finally:
+        expectation_generator._get_encoding.cache_clear()
+
+def test_shrink_stats_drops_healthy_columns_first():
+    """Test that prompt statistics are shrunk to the token budget."""
+    from llm_agent.expectation_generator import _shrink_stats
+    
+    stats = {f"metric_{i}": {'min': 0, 'max': i, 'mean': i / 2, 'null_count': 0} for i in range(50)}
+    stats['category'] = {
+        'unique_count': 20,
+        'top_values': {f"value_{i}": 20 - i for i in range(20)},
+        'null_count': 3
+    }
+    
+    shrunk, omitted = _shrink_stats(stats, max_tokens=100)
+    
+    assert 'category' in shrunk
+    assert len(shrunk['category']['top_values']) == 5
+    assert omitted and all(col.startswith('metric_') for col in omitted)
+    assert set(shrunk) | set(omitted) == set(stats)
+
+def test_describe_numeric_matches_pandas():
+    """Test that the fused numeric statistics agree with pandas."""
+    import numpy as np
+    import pandas as pd
+    from llm_agent._stats import describe_numeric
+    
+    series = pd.Series(np.r_[np.random.default_rng(0).normal(50, 10, 200_000), [np.nan] * 10])
+    stats = describe_numeric(series)
+    
+    assert stats['min'] == pytest.approx(series.min())
+    assert stats['max'] == pytest.approx(series.max())
+    assert stats['mean'] == pytest.approx(series.mean())
+    assert stats['median'] == pytest.approx(series.median())
+    assert stats['std'] == pytest.approx(series.std())
@@ -3,17 +3,12 @@ Tests for data quality validator
 """
 import os
 import sys
-import json
+import orjson
 import pytest
-import pandas as pd
-import great_expectations as ge
 
 # Add the project root to the path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-# Import the modules to test
-from app.validator.run_checks import DataQualityValidator
-
 # Test data
 TEST_DATA = {
     'transaction_id': [1001, 1002, 1003, 1004, 1005],
@@ -52,27 +47,47 @@ TEST_EXPECTATION_SUITE = {
     ]
 }
 
-@pytest.fixture
-def test_data_file(tmp_path):
-    """Create a test data file."""
+@pytest.fixture(scope="session")
+def test_data_file(tmp_path_factory):
+    """Create a test data file (shared by the session, treat as read-only)."""
+    import pandas as pd
+    
     df = pd.DataFrame(TEST_DATA)
-    file_path = tmp_path / 'test_data.csv'
+    file_path = tmp_path_factory.mktemp('data') / 'test_data.csv'
     df.to_csv(file_path, index=False)
     return file_path
 
-@pytest.fixture
-def test_suite_file(tmp_path):
-    """Create a test expectation suite file."""
-    suite_dir = tmp_path / 'expectations'
-    suite_dir.mkdir()
+@pytest.fixture(scope="session")
+def test_suite_file(tmp_path_factory):
+    """Create a test expectation suite file (shared by the session, treat as read-only)."""
+    suite_dir = tmp_path_factory.mktemp('expectations')
     file_path = suite_dir / 'test_suite.yml'
-    with open(file_path, 'w') as f:
-        json.dump(TEST_EXPECTATION_SUITE, f)
+    with open(file_path, 'wb') as f:
+        f.write(orjson.dumps(TEST_EXPECTATION_SUITE, option=orjson.OPT_INDENT_2))
     return suite_dir, 'test_suite'
 
+@pytest.fixture(autouse=True)
+def suite_cache_dir(tmp_path, monkeypatch):
+    """Keep the pickled suite cache of each test in its temporary directory."""
+    cache_dir = tmp_path / 'suite_cache'
+    monkeypatch.setattr('app.validator.run_checks.SUITE_CACHE_DIR', str(cache_dir))
+    return cache_dir
+
+@pytest.fixture(scope="session")
+def validator(tmp_path_factory, test_suite_file):
+    """Create a DataQualityValidator instance shared by the session (tests using it must not save results)."""
+    from app.validator.run_checks import DataQualityValidator
+    
+    suite_dir, _ = test_suite_file
+    results_dir = tmp_path_factory.mktemp('validator') / 'results'
+    results_dir.mkdir()
+    return DataQualityValidator(expectations_dir=str(suite_dir), results_dir=str(results_dir))
+
 @pytest.fixture
-def validator(tmp_path, test_suite_file):
-    """Create a DataQualityValidator instance."""
+def results_validator(tmp_path, test_suite_file):
+    """Create a DataQualityValidator with its own results directory, for tests that save results."""
+    from app.validator.run_checks import DataQualityValidator
+    
     suite_dir, _ = test_suite_file
     results_dir = tmp_path / 'results'
     results_dir.mkdir()
@@ -83,6 +98,24 @@ def test_validator_initialization(validator):
     assert validator is not None
     assert os.path.isdir(validator.results_dir)
 
+def test_load_expectation_suite_reuses_pickled_config(validator, test_suite_file, suite_cache_dir):
+    """Test that a new process reuses the pickled suite configuration instead of parsing it."""
+    from unittest.mock import patch
+    from app.validator.run_checks import _load_suite_config
+    
+    _load_suite_config.cache_clear()
+    
+    suite_dir, suite_name = test_suite_file
+    validator._load_expectation_suite(suite_name)
+    assert len(list(suite_cache_dir.glob('*.pkl'))) == 1
+    assert not list(suite_dir.glob('*.pkl'))
+    
+    # Simulate a fresh process: no in-memory cache, and parsing is not allowed
+    _load_suite_config.cache_clear()
+    with patch('app.validator.run_checks.yaml.load', side_effect=AssertionError("suite was parsed")):
+        suite = validator._load_expectation_suite(suite_name)
+    assert len(suite.expectations) == 3
+
 def test_load_dataset(validator, test_data_file):
     """Test loading a dataset."""
     dataset = validator._load_dataset(str(test_data_file))
@@ -90,6 +123,45 @@ def test_load_dataset(validator, test_data_file):
     assert len(dataset.columns) == 7
     assert len(dataset) == 5
 
+def test_load_dataset_prunes_columns(validator, test_data_file):
+    """Test loading only the requested columns of a dataset."""
+    dataset = validator._load_dataset(str(test_data_file), ['amount', 'missing_column', 'transaction_id'])
+    assert list(dataset.columns) == ['transaction_id', 'amount']
+    assert len(dataset) == 5
+
+def test_load_dataset_reads_empty_csv_cells_as_nulls(validator, tmp_path):
+    """Test that empty CSV cells are nulls and dates stay strings, as in the chunked reader."""
+    import pandas as pd
+    
+    data = dict(TEST_DATA, customer_id=['C5432', '', 'C7890', 'C3456', 'C5432'])
+    file_path = tmp_path / 'empty_cells.csv'
+    pd.DataFrame(data).to_csv(file_path, index=False)
+    
+    dataset = validator._load_dataset(str(file_path))
+    assert dataset['customer_id'].isna().sum() == 1
+    assert dataset['transaction_date'].tolist() == TEST_DATA['transaction_date']
+    
+    chunked = pd.concat(validator._iter_dataset(str(file_path), chunk_size=2), ignore_index=True)
+    assert chunked['customer_id'].isna().tolist() == dataset['customer_id'].isna().tolist()
+    assert chunked['transaction_date'].tolist() == dataset['transaction_date'].tolist()
+
+def test_load_dataset_is_cached_per_file_version(validator, tmp_path):
+    """Test that an unchanged file is loaded once and a modified file is reloaded."""
+    import pandas as pd
+    
+    # Work on a private copy; the shared test data file must not change
+    file_path = tmp_path / 'cached_data.csv'
+    pd.DataFrame(TEST_DATA).to_csv(file_path, index=False)
+    
+    first = validator._load_dataset(str(file_path))
+    assert validator._load_dataset(str(file_path)) is first
+    
+    pd.DataFrame(TEST_DATA).head(3).to_csv(file_path, index=False)
+    os.utime(file_path, ns=(0, os.stat(file_path).st_mtime_ns + 1_000_000))
+    reloaded = validator._load_dataset(str(file_path))
+    assert reloaded is not first
+    assert len(reloaded) == 3
+
 def test_load_expectation_suite(validator, test_suite_file):
     """Test loading an expectation suite."""
     suite_dir, suite_name = test_suite_file
@@ -98,25 +170,27 @@ def test_load_expectation_suite(validator, test_suite_file):
     assert suite.expectation_suite_name == 'test_suite'
     assert len(suite.expectations) == 3
 
-def test_validate_passing_dataset(validator, test_data_file, test_suite_file):
+def test_validate_passing_dataset(validator, test_suite_file):
     """Test validating a dataset that passes all checks."""
+    import pandas as pd
+    
     suite_dir, suite_name = test_suite_file
-    results = validator.validate(str(test_data_file), suite_name, save_results=False)
+    results = validator.validate(pd.DataFrame(TEST_DATA), suite_name, save_results=False)
     assert results is not None
     assert results['success'] is True
     assert results['statistics']['unsuccessful_expectations'] == 0
 
-def test_validate_failing_dataset(validator, tmp_path, test_suite_file):
+def test_validate_failing_dataset(validator, test_suite_file):
     """Test validating a dataset that fails some checks."""
+    import pandas as pd
+    
     # Create a dataset with invalid data
     failing_data = TEST_DATA.copy()
     failing_data['amount'] = [125.99, 45.50, 1200.00, -10.25, 12.99]  # Values outside range
     df = pd.DataFrame(failing_data)
-    file_path = tmp_path / 'failing_data.csv'
-    df.to_csv(file_path, index=False)
     
     suite_dir, suite_name = test_suite_file
-    results = validator.validate(str(file_path), suite_name, save_results=False)
+    results = validator.validate(df, suite_name, save_results=False)
     assert results is not None
     assert results['success'] is False
     assert results['statistics']['unsuccessful_expectations'] > 0
@@ -128,3 +202,114 @@ def test_validate_failing_dataset(validator, tmp_path, test_suite_file):
             assert check['failed_rows'] == 2  # Two rows fail the range check
             assert check['check_type'] == 'column_values_to_be_between'
             assert 'amount' in str(check['expected_value'])
+
+def test_validate_parallel_matches_serial(validator, tmp_path, test_suite_file):
+    """Test that concurrent validation reports the same outcome as a serial run."""
+    import pandas as pd
+    
+    failing_data = TEST_DATA.copy()
+    failing_data['amount'] = [125.99, 45.50, 1200.00, -10.25, 12.99]
+    file_path = tmp_path / 'failing_data.csv'
+    pd.DataFrame(failing_data).to_csv(file_path, index=False)
+    
+    suite_dir, suite_name = test_suite_file
+    serial = validator.validate(str(file_path), suite_name, save_results=False)
+    parallel = validator.validate(str(file_path), suite_name, save_results=False, parallel=True)
+    
+    assert parallel['success'] == serial['success']
+    assert parallel['statistics'] == serial['statistics']
+    assert sorted(c['check_name'] for c in parallel['failed_checks']) == \
+        sorted(c['check_name'] for c in serial['failed_checks'])
+
+def test_native_checks_match_great_expectations(validator, tmp_path, test_suite_file):
+    """Test that natively evaluated expectations agree with Great Expectations."""
+    import pandas as pd
+    import great_expectations as ge
+    from app.validator.native_checks import validate_dataframe
+    
+    failing_data = TEST_DATA.copy()
+    failing_data['amount'] = [125.99, 45.50, 1200.00, -10.25, 12.99]
+    df = pd.DataFrame(failing_data)
+    
+    suite_dir, suite_name = test_suite_file
+    suite = validator._load_expectation_suite(suite_name)
+    native = validate_dataframe(df, suite)
+    reference = ge.from_pandas(df).validate(expectation_suite=suite).to_json_dict()
+    
+    def by_type(results):
+        return {r['expectation_config']['expectation_type']: r for r in results['results']}
+    
+    native_results, reference_results = by_type(native), by_type(reference)
+    assert native_results.keys() == reference_results.keys()
+    for expectation_type, result in native_results.items():
+        assert result['success'] == reference_results[expectation_type]['success']
+        assert result['result'].get('unexpected_count') == reference_results[expectation_type]['result'].get('unexpected_count')
+    assert native['statistics'] == pytest.approx(reference['statistics'])
+
+def test_validate_dataframe_reports_results_in_suite_order(validator, test_suite_file):
+    """Test that native and Great Expectations results are merged in suite order."""
+    import pandas as pd
+    from great_expectations.core import ExpectationConfiguration
+    from app.validator.native_checks import validate_dataframe
+    
+    suite_dir, suite_name = test_suite_file
+    suite = validator._load_expectation_suite(suite_name)
+    suite.expectations.insert(1, ExpectationConfiguration(
+        expectation_type='expect_column_value_lengths_to_equal',
+        kwargs={'column': 'customer_id', 'value': 5}
+    ))
+    suite.expectations.insert(0, ExpectationConfiguration(
+        expectation_type='expect_column_values_to_match_regex',
+        kwargs={'column': 'status', 'regex': '^[A-Z]'}
+    ))
+    
+    for parallel in (False, True):
+        results = validate_dataframe(pd.DataFrame(TEST_DATA), suite, parallel=parallel)
+        assert [r['expectation_config']['expectation_type'] for r in results['results']] == \
+            [expectation.expectation_type for expectation in suite.expectations]
+
+def test_save_results_updates_index(results_validator, test_data_file, test_suite_file):
+    """Test that saving results records the run in the summary index."""
+    import pandas as pd
+    
+    suite_dir, suite_name = test_suite_file
+    results_validator.validate(str(test_data_file), suite_name)
+    results_validator.validate(str(test_data_file), suite_name)
+    
+    index = pd.read_parquet(os.path.join(results_validator.results_dir, 'index.parquet'))
+    assert len(index) == 1
+    assert index.iloc[0]['dataset'] == 'test_data'
+    assert index.iloc[0]['success_percent'] == 100.0
+    assert index.iloc[0]['failed_count'] == 0
+
+def test_save_results_writes_latest(results_validator, test_data_file, test_suite_file):
+    """Test that results.json mirrors the timestamped results file."""
+    suite_dir, suite_name = test_suite_file
+    results = results_validator.validate(str(test_data_file), suite_name, save_results=False)
+    output_path = results_validator._save_results(results)
+    latest_path = os.path.join(os.path.dirname(output_path), 'results.json')
+    
+    with open(output_path, 'rb') as f, open(latest_path, 'rb') as g:
+        assert f.read() == g.read()
+    with open(latest_path, 'rb') as f:
+        assert orjson.loads(f.read())['dataset_name'] == 'test_data.csv'
+
+def test_validate_chunked_matches_full(validator, tmp_path, test_suite_file):
+    """Test that chunked validation merges to the same outcome as a single pass."""
+    import pandas as pd
+    
+    failing_data = TEST_DATA.copy()
+    failing_data['amount'] = [125.99, 45.50, 1200.00, -10.25, 12.99]
+    file_path = tmp_path / 'failing_data.csv'
+    pd.DataFrame(failing_data).to_csv(file_path, index=False)
+    
+    suite_dir, suite_name = test_suite_file
+    full = validator.validate(str(file_path), suite_name, save_results=False)
+    chunked = validator.validate(str(file_path), suite_name, save_results=False, chunk_size=2)
+    
+    assert chunked['success'] == full['success']
+    assert chunked['statistics']['unsuccessful_expectations'] == full['statistics']['unsuccessful_expectations']
+    full_check = next(c for c in full['failed_checks'] if c['check_name'] == 'expect_column_values_to_be_between')
+    chunked_check = next(c for c in chunked['failed_checks'] if c['check_name'] == 'expect_column_values_to_be_between')
+    assert chunked_check['failed_rows'] == full_check['failed_rows'] == 2
+    assert chunked_check['failure_percentage'] == pytest.approx(full_check['failure_percentage'])